@@ -0,0 +1,174 @@
+import datetime
+import json
+from typing import Any
+
+import pytz
+from telegram.ext import Application, Defaults
+from telegram.request import BaseRequest, RequestData
+
+import constants as c
+import resources.Environment as Env
+
+# Endpoints that return the sent or edited message
+MESSAGE_ENDPOINTS = [
+    "sendMessage",
+    "sendPhoto",
+    "sendAnimation",
+    "sendVideo",
+    "sendDocument",
+    "sendSticker",
+    "sendDice",
+    "editMessageText",
+    "editMessageCaption",
+    "editMessageMedia",
+    "editMessageReplyMarkup",
+    "forwardMessage",
+]
+
+
+class FakeRequest(BaseRequest):
+    """
+    Request backend that answers every Bot API call locally, so that updates can be processed
+    without network access
+    """
+
+    def __init__(self):
+        """
+        Initialize the request backend
+        """
+        self.calls: dict[str, int] = {}
+        self.message_id: int = 0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: RequestData = None,
+        read_timeout=BaseRequest.DEFAULT_NONE,
+        write_timeout=BaseRequest.DEFAULT_NONE,
+        connect_timeout=BaseRequest.DEFAULT_NONE,
+        pool_timeout=BaseRequest.DEFAULT_NONE,
+    ) -> tuple[int, bytes]:
+        """
+        Answer a Bot API call
+        :param url: The url, ending with the endpoint
+        :param method: The http method
+        :param request_data: The request data
+        :return: The status code and the payload
+        """
+
+        endpoint = url.rsplit("/", 1)[-1]
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        parameters: dict = request_data.parameters if request_data is not None else {}
+
+        payload = {"ok": True, "result": self.get_result(endpoint, parameters)}
+        return 200, json.dumps(payload).encode()
+
+    def get_result(self, endpoint: str, parameters: dict) -> Any:
+        """
+        Get the result of a Bot API call
+        :param endpoint: The endpoint
+        :param parameters: The parameters of the call
+        :return: The result
+        """
+
+        chat_id = int(parameters.get("chat_id", 0) or 0)
+
+        if endpoint == "getMe":
+            return {
+                "id": Env.BOT_ID.get_int(),
+                "is_bot": True,
+                "first_name": Env.BOT_USERNAME.get(),
+                "username": Env.BOT_USERNAME.get(),
+                "can_join_groups": True,
+                "can_read_all_group_messages": True,
+                "supports_inline_queries": True,
+            }
+
+        if endpoint in MESSAGE_ENDPOINTS:
+            self.message_id += 1
+            message = {
+                "message_id": int(parameters.get("message_id", self.message_id)),
+                "date": int(datetime.datetime.now().timestamp()),
+                "chat": get_chat(chat_id),
+                "text": parameters.get("text", ""),
+            }
+            if endpoint in ["sendPhoto", "editMessageMedia"]:
+                message["photo"] = [
+                    {"file_id": "photo", "file_unique_id": "photo", "width": 1, "height": 1}
+                ]
+            if endpoint == "sendAnimation":
+                message["animation"] = {
+                    "file_id": "animation",
+                    "file_unique_id": "animation",
+                    "width": 1,
+                    "height": 1,
+                    "duration": 1,
+                }
+            return message
+
+        if endpoint == "getChat":
+            return get_chat(chat_id)
+
+        if endpoint == "getChatMember":
+            return {
+                "status": "member",
+                "user": {
+                    "id": int(parameters.get("user_id", 0)),
+                    "is_bot": False,
+                    "first_name": "",
+                },
+            }
+
+        if endpoint == "getChatAdministrators":
+            return []
+
+        return True
+
+    def get_calls_count(self) -> int:
+        """
+        Get how many Bot API calls have been made
+        :return: The count
+        """
+
+        return sum(self.calls.values())
+
+
+def get_chat(chat_id: int) -> dict:
+    """
+    Get the chat object of a chat id, negative ids are groups
+    :param chat_id: The chat id
+    :return: The chat object
+    """
+
+    if chat_id < 0:
+        return {"id": chat_id, "type": "supergroup", "title": "Benchmark"}
+
+    return {"id": chat_id, "type": "private", "first_name": "Benchmark"}
+
+
+async def build_application(request: FakeRequest) -> Application:
+    """
+    Build and initialize an application whose bot uses the fake request backend
+    :param request: The fake request backend
+    :return: The application
+    """
+
+    defaults = Defaults(parse_mode=c.TG_DEFAULT_PARSE_MODE, tzinfo=pytz.timezone(Env.TZ.get()))
+    application = (
+        Application.builder()
+        .token(Env.BOT_TOKEN.get())
+        .defaults(defaults)
+        .request(request)
+        .get_updates_request(FakeRequest())
+        .build()
+    )
+    await application.initialize()
+
+    return application
@@ -0,0 +1,151 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+from peewee import Database
+
+from benchmarks.fake_bot import FakeRequest
+
+
+class QueryCounter:
+    """
+    Counts the queries executed by every peewee database while active
+    """
+
+    def __init__(self):
+        """
+        Initialize the counter
+        """
+        self.count: int = 0
+        self.original_execute_sql = None
+
+    def __enter__(self) -> "QueryCounter":
+        counter = self
+        self.original_execute_sql = original_execute_sql = Database.execute_sql
+
+        def execute_sql(database, sql, params=None, *args, **kwargs):
+            counter.count += 1
+            return original_execute_sql(database, sql, params, *args, **kwargs)
+
+        Database.execute_sql = execute_sql
+        return self
+
+    def __exit__(self, *args) -> None:
+        Database.execute_sql = self.original_execute_sql
+
+
+class Sample:
+    """
+    Measurements of a single run
+    """
+
+    __slots__ = ("duration_ms", "queries", "api_calls", "allocated_kb")
+
+    def __init__(self, duration_ms: float, queries: int, api_calls: int, allocated_kb: float):
+        self.duration_ms: float = duration_ms
+        self.queries: int = queries
+        self.api_calls: int = api_calls
+        self.allocated_kb: float = allocated_kb
+
+
+class Recorder:
+    """
+    Collects samples by label and reports them
+    """
+
+    def __init__(self, request: FakeRequest, trace_allocations: bool = False):
+        """
+        Initialize the recorder
+        :param request: The fake request backend, to count Bot API calls
+        :param trace_allocations: Whether to measure the allocated memory, slows down the runs
+        """
+        self.request: FakeRequest = request
+        self.trace_allocations: bool = trace_allocations
+        self.samples: dict[str, list[Sample]] = {}
+
+    @contextmanager
+    def measure(self, label: str) -> Iterator[None]:
+        """
+        Measure the code run inside the context
+        :param label: The label the sample is grouped by
+        """
+
+        api_calls_before = self.request.get_calls_count()
+        if self.trace_allocations:
+            tracemalloc.start()
+
+        with QueryCounter() as counter:
+            start = time.perf_counter()
+            try:
+                yield
+            except Exception:
+                label += " (failed)"
+                raise
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+
+                allocated_kb = 0.0
+                if self.trace_allocations:
+                    allocated_kb = tracemalloc.get_traced_memory()[1] / 1024
+                    tracemalloc.stop()
+
+                self.samples.setdefault(label, []).append(
+                    Sample(
+                        duration_ms,
+                        counter.count,
+                        self.request.get_calls_count() - api_calls_before,
+                        allocated_kb,
+                    )
+                )
+
+    def get_report(self) -> str:
+        """
+        Get the report of all the samples, slowest p95 first
+        :return: The report
+        """
+
+        header = (
+            f"{'label':<45} {'runs':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+            f" {'max ms':>9} {'queries':>8} {'api':>5} {'peak kb':>9}"
+        )
+        lines = [header, "-" * len(header)]
+
+        rows = []
+        for label, samples in self.samples.items():
+            durations = sorted(sample.duration_ms for sample in samples)
+            rows.append((
+                get_percentile(durations, 95),
+                (
+                    f"{label:<45} {len(samples):>6} {get_percentile(durations, 50):>9.2f}"
+                    f" {get_percentile(durations, 95):>9.2f} {get_percentile(durations, 99):>9.2f}"
+                    f" {durations[-1]:>9.2f} {get_average([s.queries for s in samples]):>8.1f}"
+                    f" {get_average([s.api_calls for s in samples]):>5.1f}"
+                    f" {get_average([s.allocated_kb for s in samples]):>9.1f}"
+                ),
+            ))
+
+        lines += [row for _, row in sorted(rows, reverse=True)]
+        return "\n".join(lines)
+
+
+def get_percentile(sorted_values: list[float], percentile: int) -> float:
+    """
+    Get a percentile with the nearest rank method
+    :param sorted_values: The values, sorted ascending
+    :param percentile: The percentile
+    :return: The value
+    """
+
+    index = max(0, -(-len(sorted_values) * percentile // 100) - 1)
+    return sorted_values[index]
+
+
+def get_average(values: list[float]) -> float:
+    """
+    Get the average of the values
+    :param values: The values
+    :return: The average
+    """
+
+    return sum(values) / len(values) if len(values) > 0 else 0
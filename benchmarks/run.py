@@ -0,0 +1,247 @@
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+from telegram.ext import Application, CallbackContext
+
+from benchmarks.fake_bot import FakeRequest, build_application
+from benchmarks.measurement import Recorder
+from benchmarks.seed import (
+    seed_users,
+    seed_group_chats,
+    seed_group_users,
+    seed_leaderboards,
+    seed_prediction,
+)
+from benchmarks.synthetic_updates import UpdateFactory
+from src.chat.manage_message import manage_regular, manage_callback
+from src.model.enums.Feature import Feature
+from src.service.bounty_service import reset_bounty
+from src.service.group_service import broadcast_to_chats_with_feature_enabled
+from src.service.leaderboard_service import send_leaderboard
+from src.service.migration_service import apply_migrations
+from src.service.prediction_service import set_results
+
+SCENARIOS = ["updates", "leaderboard", "reset_bounty", "set_results", "broadcast"]
+
+# Each synthetic group has this many users, used to size the broadcast
+USERS_PER_GROUP = 100
+
+
+class ErrorCounter(logging.Handler):
+    """
+    Counts the errors logged while running, e.g. by the update handlers, which log the errors
+    instead of raising them
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.count: int = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+async def wait_for_tasks(background_tasks: set[asyncio.Task]) -> None:
+    """
+    Wait for the tasks created while processing, including the ones they create in turn
+    :param background_tasks: The tasks that run for the whole benchmark, not waited for
+    :return: None
+    """
+
+    current_task = asyncio.current_task()
+    while True:
+        pending = [
+            task
+            for task in asyncio.all_tasks()
+            if task is not current_task and task not in background_tasks and not task.done()
+        ]
+        if len(pending) == 0:
+            return
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def run_updates(
+    application: Application,
+    recorder: Recorder,
+    background_tasks: set[asyncio.Task],
+    users_count: int,
+    updates_count: int,
+    seed: int,
+) -> None:
+    """
+    Replay a synthetic update stream through the message handlers
+    :param application: The application
+    :param recorder: The recorder
+    :param background_tasks: The tasks not to wait for
+    :param users_count: How many distinct users send updates
+    :param updates_count: How many updates
+    :param seed: The random seed of the stream
+    :return: None
+    """
+
+    factory = UpdateFactory(application.bot, users_count, seed=seed)
+    for synthetic_update in factory.stream(updates_count):
+        update = synthetic_update.update
+        context = CallbackContext.from_update(update, application)
+        handler = manage_callback if synthetic_update.is_callback else manage_regular
+
+        with recorder.measure(synthetic_update.label):
+            await handler(update, context)
+            await wait_for_tasks(background_tasks)
+
+
+async def run_scenario(
+    name: str,
+    application: Application,
+    recorder: Recorder,
+    background_tasks: set[asyncio.Task],
+    users_count: int,
+) -> None:
+    """
+    Run a scheduled job scenario. Scenarios modify the data, so they should only be run against a
+    disposable database
+    :param name: The scenario name
+    :param application: The application
+    :param recorder: The recorder
+    :param background_tasks: The tasks not to wait for
+    :param users_count: How many users are seeded
+    :return: None
+    """
+
+    context = CallbackContext(application)
+    label = f"{name} ({users_count} users)"
+
+    match name:
+        case "leaderboard":
+            job = send_leaderboard(context)
+        case "reset_bounty":
+            job = reset_bounty(context)
+        case "set_results":
+            job = set_results(context, seed_prediction(users_count))
+        case "broadcast":
+            job = broadcast_to_chats_with_feature_enabled(
+                context,
+                Feature.PREDICTION,
+                "Benchmark",
+                external_item=seed_prediction(0),
+            )
+        case _:
+            raise ValueError(f"Unknown scenario {name}")
+
+    with recorder.measure(label):
+        await job
+        await wait_for_tasks(background_tasks)
+
+
+async def run(args: argparse.Namespace) -> bool:
+    """
+    Run the benchmarks and print the report
+    :param args: The command line arguments
+    :return: True if no scenario failed and no error was logged
+    """
+
+    if args.migrate:
+        apply_migrations()
+
+    logging.info(f"Seeding {args.users} users")
+    seed_users(args.users, seed=args.seed)
+    seed_group_chats(max(1, args.users // USERS_PER_GROUP))
+    seed_leaderboards(seed_group_users(args.users))
+
+    error_counter = ErrorCounter()
+    logging.getLogger().addHandler(error_counter)
+    failed_scenarios: list[str] = []
+
+    request = FakeRequest()
+    application = await build_application(request)
+    await application.start()
+    background_tasks = asyncio.all_tasks()
+    recorder = Recorder(request, trace_allocations=args.trace_allocations)
+
+    try:
+        for name in args.scenario:
+            logging.info(f"Running {name}")
+            if name == "updates":
+                # Warm up caches and imports, not measured
+                await run_updates(
+                    application,
+                    Recorder(request),
+                    background_tasks,
+                    args.users,
+                    min(args.updates, 100),
+                    args.seed + 1,
+                )
+                await run_updates(
+                    application, recorder, background_tasks, args.users, args.updates, args.seed
+                )
+            else:
+                try:
+                    await run_scenario(name, application, recorder, background_tasks, args.users)
+                except Exception as e:
+                    logging.error(f"Scenario {name} failed: {e}", exc_info=True)
+                    failed_scenarios.append(name)
+    finally:
+        await application.stop()
+        await application.shutdown()
+        logging.getLogger().removeHandler(error_counter)
+
+    print(recorder.get_report())
+    print(f"\nBot API calls: {request.calls}")
+
+    if len(failed_scenarios) > 0 or error_counter.count > 0:
+        print(
+            f"\nFailed scenarios: {failed_scenarios}, errors logged: {error_counter.count}."
+            " The measurements include error paths"
+        )
+        return False
+
+    return True
+
+
+def main() -> None:
+    """
+    Run the benchmarks from the command line
+    :return: None
+    """
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark update processing and scheduled jobs against a fake bot. Scenarios other"
+            " than updates modify the data, use a disposable database"
+        )
+    )
+    parser.add_argument("env_file", nargs="?", help="Optional path to .env file")
+    parser.add_argument(
+        "--scenario", nargs="+", choices=SCENARIOS, default=["updates"], help="What to run"
+    )
+    parser.add_argument("--users", type=int, default=10_000, help="How many users to seed")
+    parser.add_argument("--updates", type=int, default=1000, help="How many updates to replay")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the update stream")
+    parser.add_argument(
+        "--migrate", action="store_true", help="Apply the schema migrations before seeding"
+    )
+    parser.add_argument(
+        "--trace-allocations", action="store_true", help="Measure the peak allocated memory"
+    )
+    args = parser.parse_args()
+
+    # Synthetic users send many updates in a short time, don't throttle them
+    os.environ.setdefault("ANTI_SPAM_PRIVATE_CHAT_MESSAGE_LIMIT", str(sys.maxsize))
+    os.environ.setdefault("ANTI_SPAM_GROUP_CHAT_MESSAGE_LIMIT", str(sys.maxsize))
+
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=logging.getLevelName(os.environ.get("LOG_LEVEL", "WARNING")),
+        stream=sys.stdout,
+    )
+
+    if not asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
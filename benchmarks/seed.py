@@ -0,0 +1,206 @@
+import datetime
+import random
+
+from benchmarks.synthetic_updates import BENCHMARK_FIRST_TG_USER_ID, BENCHMARK_GROUP_ID
+from src.model.Group import Group
+from src.model.GroupChat import GroupChat
+from src.model.GroupUser import GroupUser
+from src.model.Leaderboard import Leaderboard
+from src.model.Prediction import Prediction
+from src.model.PredictionOption import PredictionOption
+from src.model.PredictionOptionUser import PredictionOptionUser
+from src.model.User import User
+from src.model.enums.PredictionStatus import PredictionStatus
+from src.model.enums.PredictionType import PredictionType
+from src.service.leaderboard_service import create_leaderboard_users
+
+BATCH_SIZE = 1000
+
+
+def insert_in_batches(model, rows: list[dict]) -> None:
+    """
+    Insert rows in batches
+    :param model: The model
+    :param rows: The rows
+    :return: None
+    """
+
+    for index in range(0, len(rows), BATCH_SIZE):
+        model.insert_many(rows[index : index + BATCH_SIZE]).execute()
+
+
+def get_synthetic_users(count: int) -> dict[str, int]:
+    """
+    Get the synthetic users that already exist
+    :param count: How many synthetic users to look for
+    :return: The user ids by Telegram user id
+    """
+
+    tg_user_ids = [str(BENCHMARK_FIRST_TG_USER_ID + index) for index in range(count)]
+    users: dict[str, int] = {}
+    for index in range(0, count, BATCH_SIZE):
+        query = User.select(User.id, User.tg_user_id).where(
+            User.tg_user_id.in_(tg_user_ids[index : index + BATCH_SIZE])
+        )
+        users |= {user.tg_user_id: user.id for user in query}
+
+    return users
+
+
+def seed_users(count: int, seed: int = 0) -> None:
+    """
+    Create the synthetic users that are missing, with random bounties
+    :param count: How many users
+    :param seed: The random seed
+    :return: None
+    """
+
+    generator = random.Random(seed)
+    existing_users = get_synthetic_users(count)
+
+    now = datetime.datetime.now()
+    insert_in_batches(
+        User,
+        [
+            {
+                User.tg_user_id: str(BENCHMARK_FIRST_TG_USER_ID + index),
+                User.tg_first_name: f"User {index}",
+                User.tg_last_name: "",
+                User.tg_username: f"user_{index}",
+                User.bounty: generator.randrange(0, 500_000_000, 1000),
+                User.last_message_date: now - datetime.timedelta(
+                    minutes=generator.randrange(0, 60 * 24 * 7)
+                ),
+            }
+            for index in range(count)
+            if str(BENCHMARK_FIRST_TG_USER_ID + index) not in existing_users
+        ],
+    )
+
+
+def seed_group_chats(count: int) -> list[GroupChat]:
+    """
+    Create the synthetic groups, each with its general chat
+    :param count: How many groups, the first one is the group the updates are sent to
+    :return: The group chats
+    """
+
+    tg_group_ids = [str(BENCHMARK_GROUP_ID - index) for index in range(count)]
+    existing_ids = [
+        group.tg_group_id
+        for group in Group.select(Group.tg_group_id).where(Group.tg_group_id.in_(tg_group_ids))
+    ]
+    insert_in_batches(
+        Group,
+        [
+            {Group.tg_group_id: tg_group_id, Group.tg_group_name: "Benchmark"}
+            for tg_group_id in tg_group_ids
+            if tg_group_id not in existing_ids
+        ],
+    )
+
+    groups = list(Group.select().where(Group.tg_group_id.in_(tg_group_ids)))
+    groups_with_chat = [
+        group_chat.group_id
+        for group_chat in GroupChat.select(GroupChat.group).where(GroupChat.group.in_(groups))
+    ]
+    insert_in_batches(
+        GroupChat,
+        [{GroupChat.group: group} for group in groups if group.id not in groups_with_chat],
+    )
+
+    return list(GroupChat.select().where(GroupChat.group.in_(groups)))
+
+
+def seed_group_users(users_count: int) -> Group:
+    """
+    Add the synthetic users that are missing to the group the updates are sent to, as active
+    members
+    :param users_count: How many users
+    :return: The group
+    """
+
+    group: Group = Group.get(Group.tg_group_id == str(BENCHMARK_GROUP_ID))
+    member_ids = [
+        group_user.user_id
+        for group_user in GroupUser.select(GroupUser.user).where(GroupUser.group == group)
+    ]
+    insert_in_batches(
+        GroupUser,
+        [
+            {GroupUser.group: group, GroupUser.user: user_id}
+            for user_id in get_synthetic_users(users_count).values()
+            if user_id not in member_ids
+        ],
+    )
+
+    return group
+
+
+def seed_leaderboards(group: Group) -> None:
+    """
+    Create the global leaderboard and the local leaderboard of a group for the current week, if
+    missing. Many commands and screens read the rank of the user from them
+    :param group: The group of the local leaderboard
+    :return: None
+    """
+
+    year, week, _ = datetime.datetime.now().isocalendar()
+    for leaderboard_group in (None, group):
+        group_condition = (
+            Leaderboard.group.is_null()
+            if leaderboard_group is None
+            else Leaderboard.group == leaderboard_group
+        )
+        if (
+            Leaderboard.select()
+            .where((Leaderboard.year == year) & (Leaderboard.week == week) & group_condition)
+            .exists()
+        ):
+            continue
+
+        leaderboard = Leaderboard.create(year=year, week=week, group=leaderboard_group)
+        create_leaderboard_users(leaderboard, leaderboard_group)
+
+
+def seed_prediction(bets_count: int, seed: int = 0) -> Prediction:
+    """
+    Create a prediction with closed bets, placed by the first synthetic users
+    :param bets_count: How many bets
+    :param seed: The random seed
+    :return: The prediction
+    """
+
+    generator = random.Random(seed)
+
+    prediction = Prediction()
+    prediction.type = PredictionType.EVENT
+    prediction.status = PredictionStatus.BETS_CLOSED
+    prediction.question = "Benchmark"
+    prediction.send_date = datetime.datetime.now()
+    prediction.save()
+
+    options = []
+    for number in range(1, 4):
+        option = PredictionOption()
+        option.prediction = prediction
+        option.number = number
+        option.option = f"Option {number}"
+        option.is_correct = number == 1
+        option.save()
+        options.append(option)
+
+    insert_in_batches(
+        PredictionOptionUser,
+        [
+            {
+                PredictionOptionUser.prediction: prediction,
+                PredictionOptionUser.prediction_option: generator.choice(options),
+                PredictionOptionUser.user: user_id,
+                PredictionOptionUser.wager: generator.randrange(1000, 10_000_000, 1000),
+            }
+            for user_id in get_synthetic_users(bets_count).values()
+        ],
+    )
+
+    return prediction
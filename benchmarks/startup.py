@@ -0,0 +1,101 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Prefixes of the modules of this project
+PROJECT_MODULE_PREFIXES = ("main", "constants", "resources", "src")
+
+
+class ImportTime:
+    """
+    Import time of a module, as reported by python -X importtime
+    """
+
+    __slots__ = ("module", "self_us", "cumulative_us")
+
+    def __init__(self, module: str, self_us: int, cumulative_us: int):
+        self.module: str = module
+        self.self_us: int = self_us
+        self.cumulative_us: int = cumulative_us
+
+
+def measure_import_times(env_file: str | None) -> list[ImportTime]:
+    """
+    Import main in a fresh interpreter and collect the import time of every module
+    :param env_file: Optional path to the .env file
+    :return: The import times
+    """
+
+    command = [sys.executable, "-X", "importtime", "-c", "import main"]
+    if env_file is not None:
+        command.append(env_file)
+
+    result = subprocess.run(
+        command,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import of main failed:\n{result.stderr[-2000:]}")
+
+    import_times: list[ImportTime] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        import_times.append(ImportTime(module.strip(), int(self_us), int(cumulative_us)))
+
+    return import_times
+
+
+def get_report(import_times: list[ImportTime], limit: int) -> str:
+    """
+    Get the report of the slowest modules
+    :param import_times: The import times
+    :param limit: How many modules to list
+    :return: The report
+    """
+
+    total_us = next(i.cumulative_us for i in import_times if i.module == "main")
+    project_modules = [i for i in import_times if i.module.startswith(PROJECT_MODULE_PREFIXES)]
+
+    lines = [f"Startup imports: {total_us / 1000:.0f} ms, {len(import_times)} modules", ""]
+    lines.append(f"{'slowest project modules, cumulative':<70} {'ms':>8}")
+    for i in sorted(project_modules, key=lambda i: i.cumulative_us, reverse=True)[:limit]:
+        lines.append(f"{i.module:<70} {i.cumulative_us / 1000:>8.1f}")
+
+    lines += ["", f"{'slowest modules, self':<70} {'ms':>8}"]
+    for i in sorted(import_times, key=lambda i: i.self_us, reverse=True)[:limit]:
+        lines.append(f"{i.module:<70} {i.self_us / 1000:>8.1f}")
+
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """
+    Print the import time report of the bot startup from the command line
+    :return: None
+    """
+
+    parser = argparse.ArgumentParser(description="Report the import time of the bot startup")
+    parser.add_argument("env_file", nargs="?", help="Optional path to .env file")
+    parser.add_argument("--limit", type=int, default=20, help="How many modules to list")
+    parser.add_argument(
+        "--budget-ms", type=int, help="Exit with an error if startup imports take longer"
+    )
+    args = parser.parse_args()
+
+    import_times = measure_import_times(args.env_file)
+    print(get_report(import_times, args.limit))
+
+    total_ms = next(i.cumulative_us for i in import_times if i.module == "main") / 1000
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nOver budget: {total_ms:.0f} ms > {args.budget_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
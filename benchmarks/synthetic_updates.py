@@ -0,0 +1,234 @@
+import base64
+import datetime
+import json
+import random
+
+from telegram import Bot, Update
+
+from src.model.enums.CommandName import CommandName
+from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
+from src.model.enums.Screen import Screen
+
+BENCHMARK_GROUP_ID = -1001000000000
+BENCHMARK_FIRST_TG_USER_ID = 1000000
+
+# Commands sent in the group, with whether they are sent in reply to another user
+GROUP_COMMANDS: list[tuple[CommandName, bool]] = [
+    (CommandName.STATUS, False),
+    (CommandName.STATUS, True),
+    (CommandName.DOC_Q, False),
+    (CommandName.DAILY_REWARD, False),
+    (CommandName.FIGHT, True),
+    (CommandName.PLUNDER, True),
+]
+
+# Screens opened from private chat buttons
+PRIVATE_SCREENS: list[Screen] = [
+    Screen.PVT_START,
+    Screen.PVT_USER_STATUS,
+    Screen.PVT_SETTINGS,
+    Screen.PVT_CREW,
+    Screen.PVT_LOGS,
+    Screen.PVT_PREDICTION,
+    Screen.PVT_DEVIL_FRUIT,
+]
+
+
+# Screens opened from deeplinks, only the ones with a command as the deeplinks sent by the bot
+DEEPLINK_SCREENS: list[Screen] = [
+    Screen.PVT_START,
+    Screen.PVT_USER_STATUS,
+    Screen.PVT_SETTINGS,
+    Screen.PVT_CREW,
+]
+
+
+class SyntheticUpdate:
+    """
+    A generated update, with the label used to group its measurements
+    """
+
+    def __init__(self, label: str, update: Update, is_callback: bool):
+        """
+        Initialize the synthetic update
+        :param label: The label, for example the command or screen
+        :param update: The update
+        :param is_callback: Whether the update is a callback query
+        """
+        self.label: str = label
+        self.update: Update = update
+        self.is_callback: bool = is_callback
+
+
+class UpdateFactory:
+    """
+    Generates Telegram updates for group commands, private screens, callbacks and deeplinks
+    """
+
+    def __init__(self, bot: Bot, users_count: int, seed: int = 0):
+        """
+        Initialize the factory
+        :param bot: The bot the updates are bound to
+        :param users_count: How many distinct users send updates
+        :param seed: The random seed, same seed generates the same stream
+        """
+        self.bot: Bot = bot
+        self.users_count: int = users_count
+        self.random: random.Random = random.Random(seed)
+        self.update_id: int = 0
+        self.message_id: int = 0
+
+    def get_tg_user(self, index: int) -> dict:
+        """
+        Get the Telegram user object of a synthetic user
+        :param index: The index of the user
+        :return: The user object
+        """
+
+        tg_user_id = BENCHMARK_FIRST_TG_USER_ID + index
+        return {
+            "id": tg_user_id,
+            "is_bot": False,
+            "first_name": f"User {index}",
+            "last_name": "",
+            "username": f"user_{index}",
+        }
+
+    def get_random_user_index(self) -> int:
+        """
+        Get the index of a random user
+        :return: The index
+        """
+
+        return self.random.randrange(self.users_count)
+
+    def get_message(self, chat: dict, from_user: dict, text: str, reply_to: dict = None) -> dict:
+        """
+        Get a message object
+        :param chat: The chat object
+        :param from_user: The sender
+        :param text: The text
+        :param reply_to: The message replied to
+        :return: The message object
+        """
+
+        self.message_id += 1
+        message = {
+            "message_id": self.message_id,
+            "date": int(datetime.datetime.now().timestamp()),
+            "chat": chat,
+            "from": from_user,
+            "text": text,
+        }
+        if text.startswith("/"):
+            message["entities"] = [
+                {"type": "bot_command", "offset": 0, "length": len(text.split(" ")[0])}
+            ]
+        if reply_to is not None:
+            message["reply_to_message"] = reply_to
+
+        return message
+
+    def build(self, label: str, data: dict, is_callback: bool = False) -> SyntheticUpdate:
+        """
+        Build an update
+        :param label: The label
+        :param data: The update content, without the update id
+        :param is_callback: Whether the update is a callback query
+        :return: The synthetic update
+        """
+
+        self.update_id += 1
+        update = Update.de_json({"update_id": self.update_id} | data, self.bot)
+        return SyntheticUpdate(label, update, is_callback)
+
+    def group_command(self, command_name: CommandName, is_reply: bool) -> SyntheticUpdate:
+        """
+        Generate a command sent in the group
+        :param command_name: The command name
+        :param is_reply: Whether the command is sent in reply to another user
+        :return: The synthetic update
+        """
+
+        chat = {"id": BENCHMARK_GROUP_ID, "type": "supergroup", "title": "Benchmark"}
+        from_user = self.get_tg_user(self.get_random_user_index())
+
+        reply_to = None
+        if is_reply:
+            reply_to = self.get_message(
+                chat, self.get_tg_user(self.get_random_user_index()), "Hello"
+            )
+
+        message = self.get_message(chat, from_user, "/" + command_name, reply_to=reply_to)
+        label = f"group /{command_name}" + (" (reply)" if is_reply else "")
+        return self.build(label, {"message": message})
+
+    def private_command(self, command_name: CommandName) -> SyntheticUpdate:
+        """
+        Generate a command sent in private chat
+        :param command_name: The command name
+        :return: The synthetic update
+        """
+
+        from_user = self.get_tg_user(self.get_random_user_index())
+        chat = {"id": from_user["id"], "type": "private", "first_name": from_user["first_name"]}
+        message = self.get_message(chat, from_user, "/" + command_name)
+        return self.build(f"private /{command_name}", {"message": message})
+
+    def private_callback(self, screen: Screen, info: dict = None) -> SyntheticUpdate:
+        """
+        Generate a button press in private chat
+        :param screen: The screen the button leads to
+        :param info: Additional keyboard info
+        :return: The synthetic update
+        """
+
+        from_user = self.get_tg_user(self.get_random_user_index())
+        chat = {"id": from_user["id"], "type": "private", "first_name": from_user["first_name"]}
+        keyboard_info = (info or {}) | {ReservedKeyboardKeys.SCREEN: int(screen[1:])}
+        callback_query = {
+            "id": str(self.update_id),
+            "from": from_user,
+            "chat_instance": str(from_user["id"]),
+            "message": self.get_message(chat, self.get_tg_user(0) | {"is_bot": True}, "Menu"),
+            "data": json.dumps(keyboard_info, separators=(",", ":")),
+        }
+        return self.build(f"callback {screen.name}", {"callback_query": callback_query}, True)
+
+    def deeplink(self, screen: Screen, info: dict = None) -> SyntheticUpdate:
+        """
+        Generate a deeplink opened in private chat
+        :param screen: The screen of the deeplink
+        :param info: Additional keyboard info
+        :return: The synthetic update
+        """
+
+        from_user = self.get_tg_user(self.get_random_user_index())
+        chat = {"id": from_user["id"], "type": "private", "first_name": from_user["first_name"]}
+        keyboard_info = (info or {}) | {ReservedKeyboardKeys.SCREEN: int(screen[1:])}
+        parameter = base64.b64encode(
+            json.dumps(keyboard_info, separators=(",", ":")).encode()
+        ).decode()
+        message = self.get_message(chat, from_user, f"/{CommandName.START} {parameter}")
+        return self.build(f"deeplink {screen.name}", {"message": message})
+
+    def stream(self, count: int) -> list[SyntheticUpdate]:
+        """
+        Generate a replayable mix of updates
+        :param count: How many updates
+        :return: The synthetic updates
+        """
+
+        updates: list[SyntheticUpdate] = []
+        for _ in range(count):
+            kind = self.random.random()
+            if kind < 0.4:
+                updates.append(self.group_command(*self.random.choice(GROUP_COMMANDS)))
+            elif kind < 0.5:
+                updates.append(self.private_command(CommandName.START))
+            elif kind < 0.9:
+                updates.append(self.private_callback(self.random.choice(PRIVATE_SCREENS)))
+            else:
+                updates.append(self.deeplink(self.random.choice(DEEPLINK_SCREENS)))
+
+        return updates
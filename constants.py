@@ -17,6 +17,7 @@ ASSETS_IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
 ASSETS_SAVED_MEDIA_DIR = os.path.join(ASSETS_IMAGES_DIR, "saved_media")
 ASSETS_FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
 ASSETS_ITEMS_DIR = os.path.join(ASSETS_DIR, "items")
+CONTEXT_DATA_PERSISTENCE_FILE = os.path.join(ROOT_DIR, "context_data.pickle")
 
 # Command
 STANDARD_SPLIT_CHAR = "|"
@@ -30,7 +31,7 @@ STANDARD_LIST_SIZE = 10
 STANDARD_LIST_KEYBOARD_ROW_SIZE = 5
 FEATURE_KEYBOARD_ROW_SIZE = 2
 USER_KEYBOARD_ROW_SIZE = 2
-MAX_LIMIT = 18446744073709551610  # Max unsigned bigint
+MAX_LIMIT = 9223372036854775807  # Max signed bigint, a valid limit for both MySQL and SQLite
 
 STANDARD_DATE_FORMAT = "%Y-%m-%d"
 STANDARD_DATE_TIME_FORMAT = "%Y-%m-%d %H:%M"
@@ -1,6 +1,7 @@
 import logging
 import sys
 import time
+from multiprocessing.queues import Queue
 
 import pytz
 from telegram import Update
@@ -14,15 +15,29 @@ from telegram.ext import (
     ContextTypes,
     AIORateLimiter,
     InlineQueryHandler,
+    PicklePersistence,
+    PersistenceInput,
 )
 
 import constants as c
 import resources.Environment as Env
+import src.service.auto_delete_service as auto_delete_service
+import src.service.download_service as download_service
+import src.service.game_timer_service as game_timer_service
+import src.service.metrics_service as metrics_service
+import src.service.reddit_service as reddit_service
+import src.service.task_service as task_service
+import src.service.timer_lease_service as timer_lease_service
+import src.service.webhook_service as webhook_service
 from src.chat.manage_message import (
     manage_regular as manage_regular_message,
     manage_callback as manage_callback_message,
 )
+from src.chat.screen_registry import preload_screen_modules
+from src.model.enums.TaskPoolType import TaskPoolType
+from src.service.game_service import register_active_game_artifacts, run_game_timer
 from src.service.message_service import full_message_send
+from src.service.migration_service import get_pending_migrations
 from src.service.timer_service import set_timers
 
 
@@ -53,13 +68,45 @@ async def post_init(application: Application) -> None:
     :param application: the application
     :return: None
     """
+    # With webhook workers, the pending items are loaded only by the primary one
+    is_primary_worker = webhook_service.is_primary_worker()
+
     await application.job_queue.start()
+    timer_lease_service.start()
     await set_timers(application)
+    auto_delete_service.start(application, should_load_pending=is_primary_worker)
+    game_timer_service.start(application, run_game_timer, should_load_pending=is_primary_worker)
+    register_active_game_artifacts()
 
+    # Screen modules are imported on first use, warm them up now that the bot is running
+    if Env.SCREEN_PRELOAD_ENABLED.get_bool():
+        task_service.submit(TaskPoolType.BACKGROUND, preload_screen_modules())
 
-def main() -> None:
+    if Env.METRICS_ENABLED.get_bool():
+        # One port for each webhook worker
+        await metrics_service.start_metrics_server(
+            Env.METRICS_PORT.get_int() + (webhook_service.get_worker_index() or 0)
+        )
+
+
+async def post_stop(application: Application) -> None:
     """
-    Main function. Starts the bot
+    Post stop
+    :param application: the application
+    :return: None
+    """
+    # Let the running tasks finish while the other services are still available
+    await task_service.stop()
+    auto_delete_service.stop()
+    timer_lease_service.stop()
+    game_timer_service.stop()
+    await reddit_service.close()
+    await download_service.close()
+
+
+def configure() -> None:
+    """
+    Configure the process: environment checks, logging, error reporting and metrics
     :return: None
     """
     # Set timezone: Only on linux
@@ -81,7 +128,7 @@ def main() -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
     logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format="%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s",
         level=logging.getLevelName(Env.LOG_LEVEL.get()),
         stream=sys.stdout,
     )
@@ -105,17 +152,52 @@ def main() -> None:
             ],
         )
 
+    # Metrics
+    if Env.METRICS_ENABLED.get_bool():
+        metrics_service.install()
+
+
+def build_application() -> Application:
+    """
+    Build the application with its handlers
+    :return: The application
+    """
+
     defaults = Defaults(parse_mode=c.TG_DEFAULT_PARSE_MODE, tzinfo=pytz.timezone(Env.TZ.get()))
 
-    application = (
+    builder = (
         Application.builder()
         .token(Env.BOT_TOKEN.get())
         .post_init(post_init)
+        .post_stop(post_stop)
         .defaults(defaults)
         .rate_limiter(AIORateLimiter())
-        .build()
     )
 
+    if Env.METRICS_ENABLED.get_bool():
+        builder.request(metrics_service.InstrumentedHTTPXRequest(connection_pool_size=256))
+
+    # Webhook worker, the updates are received by the dispatcher process
+    worker_index = webhook_service.get_worker_index()
+    if worker_index is not None:
+        builder.updater(None)
+
+    # Context data persistence, so that in-flight navigation survives restarts
+    if Env.CONTEXT_DATA_PERSISTENCE_ENABLED.get_bool():
+        persistence_file = Env.CONTEXT_DATA_PERSISTENCE_FILE.get()
+        if worker_index is not None:
+            persistence_file += f".{worker_index}"
+
+        builder.persistence(
+            PicklePersistence(
+                filepath=persistence_file,
+                store_data=PersistenceInput(chat_data=False, callback_data=False),
+                update_interval=Env.CONTEXT_DATA_PERSISTENCE_UPDATE_INTERVAL_SECONDS.get_int(),
+            )
+        )
+
+    application = builder.build()
+
     # Chat id handler
     application.add_handler(CommandHandler("chatid", chat_id))
 
@@ -131,8 +213,47 @@ def main() -> None:
     # Activate timers
     logging.getLogger("apscheduler.executors.default").propagate = False
 
+    return application
+
+
+def main() -> None:
+    """
+    Main function. Starts the bot
+    :return: None
+    """
+
+    configure()
+
+    # The schema is managed by migrate.py, only warn if it's behind
+    pending_migrations = get_pending_migrations()
+    if len(pending_migrations) > 0:
+        logging.warning(
+            "Pending database migrations, run migrate.py to apply them: "
+            + ", ".join(str(migration) for migration in pending_migrations)
+        )
+
+    # Updates received by the webhook and managed by the worker processes
+    if Env.WEBHOOK_ENABLED.get_bool():
+        webhook_service.run(run_webhook_worker)
+        return
+
+    application = build_application()
     application.run_polling(drop_pending_updates=Env.BOT_DROP_PENDING_UPDATES.get_bool())
 
 
+def run_webhook_worker(worker_index: int, update_queue: Queue) -> None:
+    """
+    Run a webhook worker. Entry point of the worker processes
+    :param worker_index: The worker index
+    :param update_queue: The queue of the updates to manage
+    :return: None
+    """
+
+    webhook_service.init_worker(worker_index)
+    configure()
+
+    webhook_service.run_worker(build_application(), worker_index, update_queue)
+
+
 if __name__ == "__main__":
     main()
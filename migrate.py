@@ -0,0 +1,44 @@
+import argparse
+import logging
+import sys
+
+from src.model.SchemaMigration import SchemaMigration
+from src.service.migration_service import apply_migrations, get_migrations
+
+
+def main() -> None:
+    """
+    Apply the database schema migrations
+    :return: None
+    """
+
+    parser = argparse.ArgumentParser(description="Apply the database schema migrations")
+    parser.add_argument("env_file", nargs="?", help="Optional path to .env file")
+    parser.add_argument(
+        "--list", action="store_true", help="List the migrations without applying them"
+    )
+    parser.add_argument("--target", type=int, help="Apply the migrations up to this version")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=logging.INFO,
+        stream=sys.stdout,
+    )
+
+    if args.list:
+        applied_versions: list[int] = SchemaMigration.get_applied_versions()
+        for migration in get_migrations():
+            status = "applied" if migration.version in applied_versions else "pending"
+            print(f"{migration} [{status}]")
+        return
+
+    applied = apply_migrations(target_version=args.target)
+    if len(applied) == 0:
+        logging.info("Database schema is up to date")
+    else:
+        logging.info(f"Applied {len(applied)} migrations")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,11 @@ class ReconnectMySQLDatabase(ReconnectMixin, MySQLDatabase, ABC):
 
 class Database:
     def __init__(self):
+        # SQLite is only meant for local runs, such as benchmarks
+        if Env.DB_ENGINE.get() == "sqlite":
+            self.db = SqliteDatabase(Env.DB_NAME.get(), pragmas={"foreign_keys": 1})
+            return
+
         self.db = ReconnectMySQLDatabase(
             Env.DB_NAME.get(),
             host=Env.DB_HOST.get(),
@@ -95,7 +95,8 @@ class Environment:
         return self.get()
 
 
-if len(sys.argv) > 1:
+# First argument, if not an option, is the path to the .env file
+if len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
     load_dotenv(sys.argv[1])
 else:
     load_dotenv()
@@ -111,9 +112,37 @@ BOT_USERNAME = Environment("BOT_USERNAME")
 TZ = Environment("TZ", default_value="Etc/UTC")
 # Log level
 LOG_LEVEL = Environment("LOG_LEVEL", default_value="INFO")
+# Import all screen modules right after startup instead of on their first use. Default: True
+SCREEN_PRELOAD_ENABLED = Environment("SCREEN_PRELOAD_ENABLED", default_value="True")
+
+# WEBHOOK
+# Receive the updates with a webhook instead of polling, and manage them with multiple worker
+# processes. Default: False
+WEBHOOK_ENABLED = Environment("WEBHOOK_ENABLED", default_value="False")
+# Public url to which Telegram sends the updates, the endpoint listens on its path
+WEBHOOK_URL = Environment("WEBHOOK_URL", can_be_empty=True)
+# Secret token sent by Telegram with each update, 1-256 characters among A-Z, a-z, 0-9, _ and -
+WEBHOOK_SECRET_TOKEN = Environment("WEBHOOK_SECRET_TOKEN", can_be_empty=True)
+# Address on which the endpoint listens. Default: 0.0.0.0
+WEBHOOK_LISTEN_ADDRESS = Environment("WEBHOOK_LISTEN_ADDRESS", default_value="0.0.0.0")
+# Port on which the endpoint listens. Default: 8443
+WEBHOOK_PORT = Environment("WEBHOOK_PORT", default_value="8443")
+# Number of worker processes, the updates of a chat are always managed by the same one. Changing
+# it moves chats to other workers, which don't have their context data. If 0, the number of CPU
+# cores. Default: 0
+WEBHOOK_WORKERS = Environment("WEBHOOK_WORKERS", default_value="0")
+# Maximum number of concurrent connections Telegram opens to the endpoint, 1-100. Default: 40
+WEBHOOK_MAX_CONNECTIONS = Environment("WEBHOOK_MAX_CONNECTIONS", default_value="40")
+# After how many seconds a webhook worker reloads the state it keeps in memory, to include the
+# changes made by the other workers (e.g. the in progress Davy Back Fights). Default: 10
+WEBHOOK_SHARED_STATE_REFRESH_SECONDS = Environment(
+    "WEBHOOK_SHARED_STATE_REFRESH_SECONDS", default_value="10"
+)
 
 # DATABASE
-# Database name
+# Database engine, mysql or sqlite. SQLite is only meant for local runs like benchmarks
+DB_ENGINE = Environment("DB_ENGINE", default_value="mysql")
+# Database name, path to the database file for SQLite
 DB_NAME = Environment("DB_NAME")
 # Database host
 DB_HOST = Environment("DB_HOST")
@@ -163,6 +192,26 @@ ANTI_SPAM_TIME_INTERVAL_SECONDS = Environment(
     "ANTI_SPAM_TIME_INTERVAL_SECONDS", default_value="60"
 )
 
+# CONTEXT DATA
+# How long context data is kept after its last update, in seconds. Default: 1 day
+CONTEXT_DATA_TTL_SECONDS = Environment("CONTEXT_DATA_TTL_SECONDS", default_value="86400")
+# How long keyboard data too long for the callback is kept, in seconds. Default: 7 days
+CONTEXT_DATA_KEYBOARD_DATA_TTL_SECONDS = Environment(
+    "CONTEXT_DATA_KEYBOARD_DATA_TTL_SECONDS", default_value="604800"
+)
+# Persist context data on disk, so it survives restarts. Default: False
+CONTEXT_DATA_PERSISTENCE_ENABLED = Environment(
+    "CONTEXT_DATA_PERSISTENCE_ENABLED", default_value="False"
+)
+# File in which context data is persisted
+CONTEXT_DATA_PERSISTENCE_FILE = Environment(
+    "CONTEXT_DATA_PERSISTENCE_FILE", default_value=c.CONTEXT_DATA_PERSISTENCE_FILE
+)
+# Every how many seconds context data is written to disk. Default: 60
+CONTEXT_DATA_PERSISTENCE_UPDATE_INTERVAL_SECONDS = Environment(
+    "CONTEXT_DATA_PERSISTENCE_UPDATE_INTERVAL_SECONDS", default_value="60"
+)
+
 # REDDIT
 # Enable reddit posts from r/onepiece and r/memepiece
 ENABLE_REDDIT_POSTS = Environment("ENABLE_REDDIT_POSTS", default_value="False")
@@ -176,6 +225,12 @@ REDDIT_USER_AGENT = Environment("REDDIT_USER_AGENT", can_be_empty=True)
 REDDIT_ONE_PIECE_SUBREDDIT = Environment("REDDIT_ONE_PIECE_SUBREDDIT", default_value="onepiece")
 # Reddit Meme Piece Subreddit
 REDDIT_MEME_PIECE_SUBREDDIT = Environment("REDDIT_MEME_PIECE_SUBREDDIT", default_value="memepiece")
+# Maximum size of the downloaded and compressed reddit media kept in memory. Default: 50 MB
+REDDIT_MEDIA_CACHE_MAX_BYTES = Environment(
+    "REDDIT_MEDIA_CACHE_MAX_BYTES", default_value="52428800"
+)
+# Maximum number of reddit media downloaded or compressed at the same time. Default: 2
+REDDIT_MEDIA_MAX_WORKERS = Environment("REDDIT_MEDIA_MAX_WORKERS", default_value="2")
 
 # SUPABASE
 # Supabase rest url
@@ -201,9 +256,66 @@ SENTRY_LOG_LEVEL = Environment("SENTRY_LOG_LEVEL", default_value="INFO")
 # Sentry log event level. Default: INFO
 SENTRY_LOG_EVENT_LEVEL = Environment("SENTRY_LOG_EVENT_LEVEL", default_value="INFO")
 
+# METRICS
+# Enable the metrics endpoint and the slow request log
+METRICS_ENABLED = Environment("METRICS_ENABLED", default_value="False")
+# Host on which the metrics endpoint listens. Default: 127.0.0.1
+METRICS_HOST = Environment("METRICS_HOST", default_value="127.0.0.1")
+# Port on which the metrics endpoint listens. Default: 9464
+METRICS_PORT = Environment("METRICS_PORT", default_value="9464")
+# Requests, screens or timers slower than this are logged with their top queries. Default: 1000
+METRICS_SLOW_TRACE_THRESHOLD_MILLISECONDS = Environment(
+    "METRICS_SLOW_TRACE_THRESHOLD_MILLISECONDS", default_value="1000"
+)
+# How many queries to include in the slow request log. Default: 5
+METRICS_SLOW_TRACE_TOP_QUERIES = Environment("METRICS_SLOW_TRACE_TOP_QUERIES", default_value="5")
+
+# TASK POOLS
+# Background tasks run in pools with a maximum concurrency. When the queue of a pool is full,
+# new tasks are shed
+# Updates managed at the same time. Default: 64
+TASK_POOL_UPDATES_MAX_CONCURRENCY = Environment(
+    "TASK_POOL_UPDATES_MAX_CONCURRENCY", default_value="64"
+)
+# Updates waiting to be managed, the oldest are dropped above it. Default: 1000
+TASK_POOL_UPDATES_MAX_QUEUE_SIZE = Environment(
+    "TASK_POOL_UPDATES_MAX_QUEUE_SIZE", default_value="1000"
+)
+# Notifications sent at the same time. Default: 16
+TASK_POOL_NOTIFICATIONS_MAX_CONCURRENCY = Environment(
+    "TASK_POOL_NOTIFICATIONS_MAX_CONCURRENCY", default_value="16"
+)
+# Notifications waiting to be sent, new ones are dropped above it. Default: 10000
+TASK_POOL_NOTIFICATIONS_MAX_QUEUE_SIZE = Environment(
+    "TASK_POOL_NOTIFICATIONS_MAX_QUEUE_SIZE", default_value="10000"
+)
+# Broadcasts running at the same time. Default: 4
+TASK_POOL_BROADCASTS_MAX_CONCURRENCY = Environment(
+    "TASK_POOL_BROADCASTS_MAX_CONCURRENCY", default_value="4"
+)
+# Broadcasts waiting to run, new ones are dropped above it. Default: 1000
+TASK_POOL_BROADCASTS_MAX_QUEUE_SIZE = Environment(
+    "TASK_POOL_BROADCASTS_MAX_QUEUE_SIZE", default_value="1000"
+)
+# Timer tasks running at the same time, never dropped. Default: 8
+TASK_POOL_TIMERS_MAX_CONCURRENCY = Environment(
+    "TASK_POOL_TIMERS_MAX_CONCURRENCY", default_value="8"
+)
+# Other background tasks running at the same time, never dropped. Default: 32
+TASK_POOL_BACKGROUND_MAX_CONCURRENCY = Environment(
+    "TASK_POOL_BACKGROUND_MAX_CONCURRENCY", default_value="32"
+)
+
 # TIMERS
-# Check for files to clean up. Default: 12 hours
-CRON_TEMP_DIR_CLEANUP = Environment("CRON_TEMP_DIR_CLEANUP", default_value="0 */12 * * *")
+# Each timer runs only in the process that holds its lease, renewed while the process is alive.
+# After how many seconds without renewal another process can take over. Default: 60
+TIMER_LEASE_TTL_SECONDS = Environment("TIMER_LEASE_TTL_SECONDS", default_value="60")
+# Every how many seconds the held leases are renewed. Default: 15
+TIMER_LEASE_HEARTBEAT_SECONDS = Environment("TIMER_LEASE_HEARTBEAT_SECONDS", default_value="15")
+# How many days the timer runs are kept. Default: 30
+TIMER_RUN_RETENTION_DAYS = Environment("TIMER_RUN_RETENTION_DAYS", default_value="30")
+# Check for files to clean up. Default: Every 10 minutes
+CRON_TEMP_DIR_CLEANUP = Environment("CRON_TEMP_DIR_CLEANUP", default_value="*/10 * * * *")
 ENABLE_TIMER_TEMP_DIR_CLEANUP = Environment("ENABLE_TIMER_TEMP_DIR_CLEANUP", default_value="True")
 SHOULD_LOG_TIMER_TEMP_DIR_CLEANUP = Environment(
     "SHOULD_LOG_TIMER_TEMP_DIR_CLEANUP", default_value="False"
@@ -452,8 +564,58 @@ SHOULD_RUN_ON_STARTUP_MINUTE_TASKS = Environment(
     "SHOULD_RUN_ON_STARTUP_MINUTE_TASKS", default_value="False"
 )
 
+# Remove expired context data and idle anti-spam entries. Default: Every 10 minutes
+CRON_CONTEXT_DATA_CLEANUP = Environment("CRON_CONTEXT_DATA_CLEANUP", default_value="*/10 * * * *")
+ENABLE_TIMER_CONTEXT_DATA_CLEANUP = Environment(
+    "ENABLE_TIMER_CONTEXT_DATA_CLEANUP", default_value="True"
+)
+SHOULD_LOG_TIMER_CONTEXT_DATA_CLEANUP = Environment(
+    "SHOULD_LOG_TIMER_CONTEXT_DATA_CLEANUP", default_value="False"
+)
+SHOULD_RUN_ON_STARTUP_CONTEXT_DATA_CLEANUP = Environment(
+    "SHOULD_RUN_ON_STARTUP_CONTEXT_DATA_CLEANUP", default_value="False"
+)
+
+# Correct the crew member counts that drifted from the actual members. Default: Every day at 00:20
+CRON_RECONCILE_CREW_MEMBER_COUNT = Environment(
+    "CRON_RECONCILE_CREW_MEMBER_COUNT", default_value="20 0 * * *"
+)
+ENABLE_TIMER_RECONCILE_CREW_MEMBER_COUNT = Environment(
+    "ENABLE_TIMER_RECONCILE_CREW_MEMBER_COUNT", default_value="True"
+)
+SHOULD_LOG_TIMER_RECONCILE_CREW_MEMBER_COUNT = Environment(
+    "SHOULD_LOG_TIMER_RECONCILE_CREW_MEMBER_COUNT", default_value="False"
+)
+SHOULD_RUN_ON_STARTUP_RECONCILE_CREW_MEMBER_COUNT = Environment(
+    "SHOULD_RUN_ON_STARTUP_RECONCILE_CREW_MEMBER_COUNT", default_value="False"
+)
+
 # How much time should temp files be kept before they are deleted. Default: 6 hours
 TEMP_DIR_CLEANUP_TIME_SECONDS = Environment("TEMP_DIR_CLEANUP_TIME_SECONDS", default_value="21600")
+# Maximum size of the temp folder, the least recently used files not owned by an active game are
+# deleted above it. Default: 1 GB
+ARTIFACT_STORE_MAX_BYTES = Environment("ARTIFACT_STORE_MAX_BYTES", default_value="1073741824")
+# How much time released temp files, for example of a finished game, are kept. Default: 10 minutes
+ARTIFACT_RELEASE_GRACE_SECONDS = Environment("ARTIFACT_RELEASE_GRACE_SECONDS", default_value="600")
+
+# DOWNLOAD
+# Timeout of a file download. Default: 30 seconds
+DOWNLOAD_TIMEOUT_SECONDS = Environment("DOWNLOAD_TIMEOUT_SECONDS", default_value="30")
+# Maximum size of a downloaded file. Default: 50 MB
+DOWNLOAD_MAX_BYTES = Environment("DOWNLOAD_MAX_BYTES", default_value="52428800")
+# Maximum size of the downloaded files kept in memory. Default: 100 MB
+DOWNLOAD_CACHE_MAX_BYTES = Environment("DOWNLOAD_CACHE_MAX_BYTES", default_value="104857600")
+# Maximum number of concurrent connections used for downloads. Default: 20
+DOWNLOAD_MAX_CONNECTIONS = Environment("DOWNLOAD_MAX_CONNECTIONS", default_value="20")
+
+# TEXT RENDERING
+# Maximum number of rendered user mentions kept in memory. Default: 10000
+MENTION_CACHE_MAX_SIZE = Environment("MENTION_CACHE_MAX_SIZE", default_value="10000")
+
+# SEARCH
+# After how many seconds the search indexes are rebuilt, to include the changes made by other
+# processes. Default: 300
+SEARCH_INDEX_REFRESH_SECONDS = Environment("SEARCH_INDEX_REFRESH_SECONDS", default_value="300")
 
 # BOUNTY
 # How much should belly be upper rounded. Default: 1000
@@ -854,6 +1016,8 @@ CREW_JOIN_REQUEST_COOLDOWN_DURATION = Environment(
 CREW_JOIN_REQUEST_COOLDOWN_SAME_CREW_DURATION = Environment(
     "CREW_JOIN_REQUEST_COOLDOWN_SAME_CREW_DURATION", default_value="7"
 )
+# How long crew summaries (member count, averages, captain...) are cached in seconds. Default: 60
+CREW_SUMMARY_CACHE_TTL_SECONDS = Environment("CREW_SUMMARY_CACHE_TTL_SECONDS", default_value="60")
 # After long in minutes before a Davy Back Fight request expire. Default: 15 minutes
 DAVY_BACK_FIGHT_REQUEST_EXPIRATION_TIME = Environment(
     "DAVY_BACK_FIGHT_REQUEST_EXPIRATION_TIME", default_value="15"
@@ -1031,3 +1195,7 @@ IMPEL_DOWN_BAIL_PER_MINUTE = Environment("IMPEL_DOWN_BAIL_PER_MINUTE", default_v
 AUTO_DELETE_DURATION_VALUES = Environment(
     "AUTO_DELETE_DURATION_VALUES", default_value="1|2|5|15|30|60|120|180|360"
 )
+# How many auto delete requests can be sent to Telegram at the same time. Default: 5
+AUTO_DELETE_MAX_CONCURRENT_REQUESTS = Environment(
+    "AUTO_DELETE_MAX_CONCURRENT_REQUESTS", default_value="5"
+)
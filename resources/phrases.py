@@ -778,7 +778,7 @@ CREW_SEARCH_ITEM_LEGEND_AUTO_ACCEPT_JOIN = "Auto accepts join"
 CREW_SEARCH_ITEM_LEGEND_CANNOT_JOIN = "Cannot join"
 CREW_SEARCH_ITEM_LEGEND_AVAILABLE_FOR_DAVY_BACK_FIGHT = "Available for Davy Back Fight"
 CREW_SEARCH_ITEM_LEGEND_AUTO_ACCEPTS_DAVY_BACK_FIGHT = "Auto accepts Davy Back Fight"
-CREW_SEARCH_FILTER_NAME = "Crew name"
+CREW_SEARCH_FILTER_NAME = "Crew name or description"
 CREW_SEARCH_NOT_ALLOWED_TO_VIEW = (
     "Crew information not available.\n\nIf you are the Captain of this Crew, enable `Allow users"
     " to find the Crew from search` option under `Crew-\\>Modify`"
@@ -2012,6 +2012,7 @@ DEVIL_FRUIT_DETAIL_SELL_ALREADY_FOR_SALE = (
 # Devil Fruit Shop
 DEVIL_FRUIT_SHOP_ITEM_TEXT = "{}\nPrice: ฿{}"
 DEVIL_FRUIT_SHOP_ITEM_TEXT_FILL_IN = "Devil Fruit"
+DEVIL_FRUIT_SHOP_FILTER_NAME = "Devil Fruit name or category"
 DEVIL_FRUIT_SHOP_ITEM_DETAIL_TEXT = "{}\n\n*Seller*: {}\n*Price*: ฿{}"
 DEVIL_FRUIT_SHOP_LIST_NO_ITEMS = (
     "There are currently no *Devil Fruits* for sale, please come back later.\n\nYou will see any"
@@ -7,42 +7,8 @@ from telegram.ext import ContextTypes
 import resources.Environment as Env
 import src.model.enums.Command as Command
 import src.model.enums.Location as Location
-from src.chat.group.screens.screen_bounty_gift import manage as manage_screen_bounty_gift
-from src.chat.group.screens.screen_bounty_loan import manage as manage_screen_bounty_loan
-from src.chat.group.screens.screen_change_region import manage as manage_screen_change_region
-from src.chat.group.screens.screen_crew_invite import manage as manage_screen_crew_invite
-from src.chat.group.screens.screen_crew_join import manage as manage_screen_crew_join
-from src.chat.group.screens.screen_daily_reward import manage as manage_screen_daily_reward
-from src.chat.group.screens.screen_daily_reward_prize import (
-    manage as manage_screen_daily_reward_prize,
-)
-from src.chat.group.screens.screen_devil_fruit_sell import manage as manage_screen_devil_fruit_sell
-from src.chat.group.screens.screen_doc_q_game import manage as manage_screen_doc_q_game
-from src.chat.group.screens.screen_fight import manage as manage_screen_fight
-from src.chat.group.screens.screen_game import manage as manage_screen_game
-from src.chat.group.screens.screen_game_opponent_confirmation import (
-    manage as manage_screen_game_opponent_confirmation,
-)
-from src.chat.group.screens.screen_game_rps import manage as manage_screen_game_rps
-from src.chat.group.screens.screen_game_rr import manage as manage_screen_game_rr
-from src.chat.group.screens.screen_game_selection import manage as manage_screen_game_selection
-from src.chat.group.screens.screen_plunder import manage as manage_screen_plunder
-from src.chat.group.screens.screen_prediction_bet import manage as manage_screen_prediction_bet
-from src.chat.group.screens.screen_prediction_bet_remove import (
-    manage as manage_screen_prediction_bet_remove,
-)
-from src.chat.group.screens.screen_prediction_bet_status import (
-    manage as manage_screen_prediction_bet_status,
-)
-from src.chat.group.screens.screen_settings import manage as manage_screen_settings
-from src.chat.group.screens.screen_settings_auto_delete import (
-    manage as manage_screen_settings_auto_delete,
-)
-from src.chat.group.screens.screen_settings_features import manage as manage_screen_features
-from src.chat.group.screens.screen_silence import manage as manage_screen_silence
-from src.chat.group.screens.screen_silence_end import manage as manage_screen_silence_end
-from src.chat.group.screens.screen_speak import manage as manage_screen_speak
-from src.chat.group.screens.screen_status import manage as manage_screen_show_status
+import src.service.metrics_service as metrics_service
+from src.chat.screen_registry import get_screen_handler
 from src.model.Group import Group
 from src.model.GroupChat import GroupChat
 from src.model.User import User
@@ -53,6 +19,7 @@ from src.model.enums.Notification import (
     DeletedMessageLocationNotification,
 )
 from src.model.enums.Screen import Screen
+from src.model.enums.TraceKind import TraceKind
 from src.model.error.CustomException import GroupMessageValidationException
 from src.model.error.GroupChatError import GroupChatError, GroupChatException
 from src.model.pojo.Keyboard import Keyboard
@@ -122,9 +89,10 @@ async def manage(
     if command is Command.ND:
         return
 
-    await dispatch_screens(
-        update, context, user, keyboard, command, target_user, group_chat, added_to_group
-    )
+    with metrics_service.trace(TraceKind.SCREEN, str(command.screen)):
+        await dispatch_screens(
+            update, context, user, keyboard, command, target_user, group_chat, added_to_group
+        )
 
 
 async def dispatch_screens(
@@ -151,98 +119,91 @@ async def dispatch_screens(
     :return: None
     """
 
+    manage_screen = get_screen_handler(command.screen)
     match command.screen:
         case Screen.GRP_USER_STATUS:  # User status
-            await manage_screen_show_status(update, context, command, user, group_chat=group_chat)
+            await manage_screen(update, context, command, user, group_chat=group_chat)
 
         case Screen.GRP_DOC_Q_GAME:  # Doc Q Game
-            await manage_screen_doc_q_game(update, context, user, inbound_keyboard, group_chat)
+            await manage_screen(update, context, user, inbound_keyboard, group_chat)
 
         case Screen.GRP_CHANGE_REGION:  # Change region
-            await manage_screen_change_region(
-                update, context, user, keyboard=inbound_keyboard, command=command
-            )
+            await manage_screen(update, context, user, keyboard=inbound_keyboard, command=command)
 
         case Screen.GRP_FIGHT:  # Fight
-            await manage_screen_fight(update, context, user, inbound_keyboard, group_chat)
+            await manage_screen(update, context, user, inbound_keyboard, group_chat)
 
         case Screen.GRP_GAME:  # Game
-            await manage_screen_game(update, context, user, command, group_chat)
+            await manage_screen(update, context, user, command, group_chat)
 
         case Screen.GRP_GAME_SELECTION:  # Game selection
-            await manage_screen_game_selection(
-                update, context, user, inbound_keyboard=inbound_keyboard
-            )
+            await manage_screen(update, context, user, inbound_keyboard=inbound_keyboard)
 
         case Screen.GRP_GAME_OPPONENT_CONFIRMATION:  # Game opponent confirmation
-            await manage_screen_game_opponent_confirmation(
-                update, context, user, inbound_keyboard=inbound_keyboard
-            )
+            await manage_screen(update, context, user, inbound_keyboard=inbound_keyboard)
 
         case Screen.GRP_ROCK_PAPER_SCISSORS_GAME:  # Game Rock Paper Scissors
-            await manage_screen_game_rps(update, context, user, inbound_keyboard=inbound_keyboard)
+            await manage_screen(update, context, user, inbound_keyboard=inbound_keyboard)
 
         case Screen.GRP_RUSSIAN_ROULETTE_GAME:  # Game Russian Roulette
-            await manage_screen_game_rr(update, context, user, inbound_keyboard=inbound_keyboard)
+            await manage_screen(update, context, user, inbound_keyboard=inbound_keyboard)
 
         case Screen.GRP_PREDICTION_BET:  # Prediction bet
-            await manage_screen_prediction_bet(update, context, user, command, group_chat)
+            await manage_screen(update, context, user, command, group_chat)
 
         case Screen.GRP_PREDICTION_BET_REMOVE:  # Prediction bet remove
-            await manage_screen_prediction_bet_remove(update, context, user, command, group_chat)
+            await manage_screen(update, context, user, command, group_chat)
 
         case Screen.GRP_PREDICTION_BET_STATUS:  # Prediction bet status
-            await manage_screen_prediction_bet_status(update, context, user, group_chat)
+            await manage_screen(update, context, user, group_chat)
 
         case Screen.GRP_CREW_JOIN:  # Crew join
-            await manage_screen_crew_join(update, context, user, inbound_keyboard, target_user)
+            await manage_screen(update, context, user, inbound_keyboard, target_user)
 
         case Screen.GRP_CREW_INVITE:  # Crew invite
-            await manage_screen_crew_invite(update, context, user, inbound_keyboard, target_user)
+            await manage_screen(update, context, user, inbound_keyboard, target_user)
 
         case Screen.GRP_SILENCE:  # Silence
-            await manage_screen_silence(update, context, group_chat)
+            await manage_screen(update, context, group_chat)
 
         case Screen.GRP_SILENCE_END:  # Silence end
-            await manage_screen_silence_end(update, context, group_chat)
+            await manage_screen(update, context, group_chat)
 
         case Screen.GRP_SPEAK:  # Speak
-            await manage_screen_speak(update, context, target_user, group_chat)
+            await manage_screen(update, context, target_user, group_chat)
 
         case Screen.GRP_BOUNTY_GIFT:  # Bounty gift
-            await manage_screen_bounty_gift(
+            await manage_screen(
                 update, context, user, inbound_keyboard, target_user, command, group_chat
             )
 
         case Screen.GRP_SETTINGS_FEATURES:  # Features
-            await manage_screen_features(
-                update, context, inbound_keyboard, group_chat, added_to_group
-            )
+            await manage_screen(update, context, inbound_keyboard, group_chat, added_to_group)
 
         case Screen.GRP_DEVIL_FRUIT_SELL:  # Devil fruit sell
-            await manage_screen_devil_fruit_sell(
+            await manage_screen(
                 update, context, user, inbound_keyboard, target_user, command, group_chat
             )
 
         case Screen.GRP_BOUNTY_LOAN:  # Bounty loan
-            await manage_screen_bounty_loan(
+            await manage_screen(
                 update, context, user, inbound_keyboard, target_user, command, group_chat
             )
 
         case Screen.GRP_PLUNDER:  # Plunder
-            await manage_screen_plunder(update, context, user, inbound_keyboard, group_chat)
+            await manage_screen(update, context, user, inbound_keyboard, group_chat)
 
         case Screen.GRP_DAILY_REWARD:  # Daily reward
-            await manage_screen_daily_reward(update, context, user, group_chat)
+            await manage_screen(update, context, user, group_chat)
 
         case Screen.GRP_DAILY_REWARD_PRIZE:  # Daily reward prize
-            await manage_screen_daily_reward_prize(update, context, inbound_keyboard)
+            await manage_screen(update, context, inbound_keyboard)
 
         case Screen.GRP_SETTINGS:  # Settings
-            await manage_screen_settings(update, context)
+            await manage_screen(update, context)
 
         case Screen.GRP_SETTINGS_AUTO_DELETE:  # Auto delete
-            await manage_screen_settings_auto_delete(update, context, inbound_keyboard, group_chat)
+            await manage_screen(update, context, inbound_keyboard, group_chat)
 
         case _:  # Unknown screen
             if update.callback_query is not None:
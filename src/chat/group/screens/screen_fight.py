@@ -10,7 +10,6 @@ from src.model.Fight import Fight
 from src.model.GroupChat import GroupChat
 from src.model.User import User
 from src.model.enums.GameStatus import GameStatus
-from src.model.enums.LeaderboardRank import get_rank_by_leaderboard_user
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.SavedMediaName import SavedMediaName
 from src.model.enums.Screen import Screen
@@ -20,10 +19,8 @@ from src.model.error.CustomException import OpponentValidationException
 from src.model.error.GroupChatError import GroupChatError, GroupChatException
 from src.model.pojo.Keyboard import Keyboard
 from src.service.bounty_service import add_or_remove_bounty
+from src.service.combat_service import CombatContext, load_combat_context
 from src.service.date_service import convert_seconds_to_duration
-from src.service.devil_fruit_service import get_ability_adjusted_datetime
-from src.service.devil_fruit_service import get_ability_value
-from src.service.leaderboard_service import get_current_leaderboard_user
 from src.service.message_service import (
     full_message_send,
     mention_markdown_user,
@@ -45,6 +42,14 @@ class FightReservedKeys(StrEnum):
     FIGHT_ID = "a"
 
 
+# The abilities that modify the odds and outcome of a fight
+FIGHT_ABILITY_TYPES: list[DevilFruitAbilityType] = [
+    DevilFruitAbilityType.FIGHT_DEFENSE_BOOST,
+    DevilFruitAbilityType.FIGHT_IMMUNITY_DURATION,
+    DevilFruitAbilityType.FIGHT_COOLDOWN_DURATION,
+]
+
+
 def get_opponent(update: Update = None, keyboard: Keyboard = None) -> User | None:
     """
     Get opponent from update or keyboard
@@ -131,21 +136,36 @@ async def validate(
     return True
 
 
-def get_fight_odds(challenger: User, opponent: User) -> tuple[float, int, int, int, int]:
+def load_fight_context(challenger: User, opponent: User) -> CombatContext:
+    """
+    Load the data needed to compute the odds and outcome of a fight
+    :param challenger: The challenger object
+    :param opponent: The opponent object
+    :return: The combat context
+    """
+
+    return load_combat_context(
+        challenger, opponent, FIGHT_ABILITY_TYPES, load_leaderboard_ranks=True
+    )
+
+
+def get_fight_odds(
+    challenger: User, opponent: User, combat_context: CombatContext
+) -> tuple[float, int, int, int, int]:
     """
     Get the win probability
     :param challenger: The challenger object
     :param opponent: The opponent object
+    :param combat_context: The combat context of challenger and opponent
     :return: list -  [0] - Win probability, [1] - Win amount, [2] - Lose amount
             [3] - Final bounty if user win, [4] - Final bounty if user lose
     """
     # Probability of winning - How much percent more is the challenger bounty compared to the
     # opponent
-    win_probability = (challenger.bounty / opponent.get_max_bounty()) * 50
+    win_probability = (challenger.bounty / combat_context.get_max_bounty(opponent)) * 50
 
     # Cap max probability
-    leaderboard_user = get_current_leaderboard_user(challenger)
-    leaderboard_rank = get_rank_by_leaderboard_user(leaderboard_user)
+    leaderboard_rank = combat_context.get_leaderboard_rank(challenger)
     # Use minimum probability if the probability is too low
     win_probability = max(win_probability, leaderboard_rank.min_win_probability)
     # Use maximum probability if the probability is too high
@@ -159,7 +179,7 @@ def get_fight_odds(challenger: User, opponent: User) -> tuple[float, int, int, i
     lose_probability = 100 - win_probability
 
     # Recalculate opponent win probability with Devil Fruit ability
-    opponent_win_probability = get_ability_value(
+    opponent_win_probability = combat_context.get_ability_value(
         opponent, DevilFruitAbilityType.FIGHT_DEFENSE_BOOST, lose_probability, add_to_value=True
     )
     # Cap opponent win probability to max allowed for Devil Fruit boost
@@ -186,6 +206,30 @@ def get_fight_odds(challenger: User, opponent: User) -> tuple[float, int, int, i
     return win_probability, win_amount, lose_amount, final_bounty_if_won, final_bounty_if_lose
 
 
+async def delete_previous_fights(
+    context: ContextTypes.DEFAULT_TYPE, user: User, group_chat: GroupChat
+) -> None:
+    """
+    Delete all the pending fights of the user
+    :param context: The context
+    :param user: The user
+    :param group_chat: The group chat
+    :return: None
+    """
+
+    pending_condition = (Fight.challenger == user) & (Fight.status == GameStatus.IN_PROGRESS)
+    message_ids: list[int] = [
+        message_id
+        for (message_id,) in Fight.select(Fight.message_id).where(pending_condition).tuples()
+        if message_id is not None
+    ]
+    Fight.delete().where(pending_condition).execute()
+
+    # Try to delete messages
+    for message_id in message_ids:
+        await delete_message(context=context, group_chat=group_chat, message_id=message_id)
+
+
 async def delete_fight(
     context: ContextTypes.DEFAULT_TYPE, fight: Fight, group_chat: GroupChat
 ) -> None:
@@ -216,16 +260,13 @@ async def send_request(
     """
 
     # Delete all previous pending fights
-    previous_fights: list[Fight] = Fight.select().where(
-        (Fight.challenger == user) & (Fight.status == GameStatus.IN_PROGRESS)
-    )
-    for previous_fight in previous_fights:
-        await delete_fight(context, previous_fight, group_chat)
+    await delete_previous_fights(context, user, group_chat)
 
     # Get opponent
     opponent: User = get_opponent(update)
+    combat_context: CombatContext = load_fight_context(user, opponent)
     win_probability, win_amount, lose_amount, final_bounty_if_win, final_bounty_if_lose = (
-        get_fight_odds(user, opponent)
+        get_fight_odds(user, opponent, combat_context)
     )
 
     # Create fight
@@ -246,7 +287,8 @@ async def send_request(
 
     odds_recalculated_text = (
         phrases.FIGHT_CONFIRMATION_ODDS_RECALCULATED
-        if opponent.is_crew_member() and not opponent.has_higher_bounty_than_crew_average()
+        if opponent.is_crew_member()
+        and not combat_context.has_higher_bounty_than_crew_average(opponent)
         else ""
     )
 
@@ -314,9 +356,10 @@ async def keyboard_interaction(
         return
 
     opponent: User = fight.opponent
+    combat_context: CombatContext = load_fight_context(user, opponent)
     # Get fight odds
     win_probability, win_amount, lose_amount, final_bounty_if_win, final_bounty_if_lose = (
-        get_fight_odds(user, opponent)
+        get_fight_odds(user, opponent, combat_context)
     )
     fight.win_probability = win_probability
     fight.date = datetime.datetime.now()
@@ -369,7 +412,7 @@ async def keyboard_interaction(
         )
 
     # Add fight immunity to opponent
-    opponent.fight_immunity_end_date = get_ability_adjusted_datetime(
+    opponent.fight_immunity_end_date = combat_context.get_ability_adjusted_datetime(
         opponent,
         DevilFruitAbilityType.FIGHT_IMMUNITY_DURATION,
         Env.FIGHT_IMMUNITY_DURATION.get_int(),
@@ -378,7 +421,7 @@ async def keyboard_interaction(
     user.fight_immunity_end_date = None
 
     # Add fight cooldown to user
-    user.fight_cooldown_end_date = get_ability_adjusted_datetime(
+    user.fight_cooldown_end_date = combat_context.get_ability_adjusted_datetime(
         user, DevilFruitAbilityType.FIGHT_COOLDOWN_DURATION, Env.FIGHT_COOLDOWN_DURATION.get_int()
     )
     # Remove fight cooldown from opponent
@@ -6,11 +6,13 @@ from telegram.ext import ContextTypes
 
 import resources.Environment as Env
 import resources.phrases as phrases
+import src.service.task_service as task_service
 from src.model.Game import Game
 from src.model.User import User
 from src.model.enums.Emoji import Emoji
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.game.GameOutcome import GameOutcome
 from src.model.game.punkrecords.PunkRecords import PunkRecords, RevealedDetail
 from src.model.pojo.Keyboard import Keyboard
@@ -56,10 +58,9 @@ async def manage(
     if inbound_keyboard.screen == Screen.GRP_GAME_OPPONENT_CONFIRMATION:
         game.status = GameStatus.COUNTDOWN_TO_START
         game.save()
-        context.application.create_task(
-            guess_game_countdown_to_start(
-                update, context, game, Env.GAME_START_WAIT_TIME.get_int(), run_game
-            )
+        task_service.submit(
+            TaskPoolType.BACKGROUND,
+            guess_game_countdown_to_start(context, game, Env.GAME_START_WAIT_TIME.get_int()),
         )
         return
 
@@ -220,12 +221,12 @@ async def run_game(
         recap_text,
     )
     for user in users:
-        context.application.create_task(
-            full_message_send(context, ot_text, chat_id=user.tg_user_id)
+        task_service.submit(
+            TaskPoolType.BACKGROUND, full_message_send(context, ot_text, chat_id=user.tg_user_id)
         )
 
         # Set private screen for input
-        context.application.create_task(set_user_private_screen(user, game))
+        task_service.submit(TaskPoolType.BACKGROUND, set_user_private_screen(user, game))
 
     if not schedule_next_send:
         return
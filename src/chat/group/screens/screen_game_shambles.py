@@ -7,12 +7,14 @@ from telegram.ext import ContextTypes
 import resources.Environment as Env
 import resources.phrases as phrases
 import src.service.game_service as game_service
+import src.service.task_service as task_service
 from src.model.Game import Game
 from src.model.User import User
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaType import SavedMediaType
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.game.shambles.Shambles import Shambles
 from src.model.pojo.Keyboard import Keyboard
 from src.model.wiki.SupabaseRest import SupabaseRest
@@ -53,10 +55,9 @@ async def manage(
     if inbound_keyboard.screen == Screen.GRP_GAME_OPPONENT_CONFIRMATION:
         game.status = GameStatus.COUNTDOWN_TO_START
         game.save()
-        context.application.create_task(
-            guess_game_countdown_to_start(
-                update, context, game, Env.GAME_START_WAIT_TIME.get_int(), run_game
-            )
+        task_service.submit(
+            TaskPoolType.BACKGROUND,
+            guess_game_countdown_to_start(context, game, Env.GAME_START_WAIT_TIME.get_int()),
         )
         return
 
@@ -135,18 +136,19 @@ async def run_game(
             )
 
     for user in users:
-        context.application.create_task(
+        task_service.submit(
+            TaskPoolType.BACKGROUND,
             full_media_send(
                 context,
                 saved_media=saved_media,
                 chat_id=user.tg_user_id,
                 caption=caption,
                 ignore_forbidden_exception=True,
-            )
+            ),
         )
 
         # Set private screen for input
-        context.application.create_task(set_user_private_screen(user, game))
+        task_service.submit(TaskPoolType.BACKGROUND, set_user_private_screen(user, game))
 
     if not schedule_next_send:
         return
@@ -1,18 +1,22 @@
 import asyncio
 import json
+import os
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
 import resources.Environment as Env
 import resources.phrases as phrases
+import src.service.download_service as download_service
 import src.service.game_service as game_service
+import src.service.task_service as task_service
 from src.model.Game import Game
 from src.model.User import User
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaType import SavedMediaType
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.game.whoswho.WhosWho import WhosWho
 from src.model.pojo.Keyboard import Keyboard
 from src.model.wiki.Character import Character
@@ -46,21 +50,20 @@ async def manage(
         return
 
     # Init board
-    get_board(game)
+    await get_board(game)
 
     # From opponent confirmation, start countdown
     if inbound_keyboard.screen == Screen.GRP_GAME_OPPONENT_CONFIRMATION:
         game.status = GameStatus.COUNTDOWN_TO_START
         game.save()
-        context.application.create_task(
-            guess_game_countdown_to_start(
-                update, context, game, Env.GAME_START_WAIT_TIME.get_int(), run_game
-            )
+        task_service.submit(
+            TaskPoolType.BACKGROUND,
+            guess_game_countdown_to_start(context, game, Env.GAME_START_WAIT_TIME.get_int()),
         )
         return
 
 
-def get_board(game: Game) -> WhosWho:
+async def get_board(game: Game) -> WhosWho:
     """
     Get the board
     :param game: The game object
@@ -70,7 +73,10 @@ def get_board(game: Game) -> WhosWho:
     # Create board
     if game.board is None:
         random_character: Character = SupabaseRest.get_random_character(game.get_difficulty())
-        whos_who = WhosWho(random_character)
+        image_path = await download_service.download_temp_file(
+            random_character.anime_image_url, "jpg"
+        )
+        whos_who = WhosWho(random_character, image_path=image_path)
         save_game(game, whos_who.get_board_json())
         return whos_who
 
@@ -79,6 +85,12 @@ def get_board(game: Game) -> WhosWho:
     char_dict = json_dict.pop("character")
     char: Character = Character(**char_dict)
 
+    # Re-download the image if it was deleted, the board would otherwise download it blocking
+    if json_dict.get("image_path") is None or not os.path.isfile(json_dict["image_path"]):
+        json_dict["image_path"] = await download_service.download_temp_file(
+            char.anime_image_url, "jpg"
+        )
+
     # Create a WhosWho object with attribute unpacking
     return WhosWho(character=char, **json_dict)
 
@@ -114,7 +126,7 @@ async def run_game(
         users: list[User] = [challenger, opponent]
 
     # Get the board
-    whos_who = get_board(game)
+    whos_who = await get_board(game)
 
     # Send the image
     saved_media: SavedMedia = SavedMedia(
@@ -137,18 +149,19 @@ async def run_game(
             )
 
     for user in users:
-        context.application.create_task(
+        task_service.submit(
+            TaskPoolType.BACKGROUND,
             full_media_send(
                 context,
                 saved_media=saved_media,
                 chat_id=user.tg_user_id,
                 caption=caption,
                 ignore_forbidden_exception=True,
-            )
+            ),
         )
 
         # Set private screen for input
-        context.application.create_task(set_user_private_screen(user, game))
+        task_service.submit(TaskPoolType.BACKGROUND, set_user_private_screen(user, game))
 
     if not schedule_next_send:
         return
@@ -161,7 +174,7 @@ async def run_game(
         return
 
     # Reduce level
-    whos_who = get_board(game)
+    whos_who = await get_board(game)
 
     # Already at level 1
     if whos_who.level == 1 and whos_who.have_revealed_all_letters():
@@ -25,13 +25,13 @@ from src.model.error.GroupChatError import GroupChatError, GroupChatException
 from src.model.pojo.Keyboard import Keyboard
 from src.service.bounty_loan_service import add_loan
 from src.service.bounty_service import add_or_remove_bounty
+from src.service.combat_service import CombatContext, load_combat_context
 from src.service.date_service import (
     convert_seconds_to_duration,
     get_elapsed_hours,
     get_datetime_in_future_hours,
     convert_hours_to_duration,
 )
-from src.service.devil_fruit_service import get_ability_adjusted_datetime, get_ability_value
 from src.service.impel_down_service import add_sentence
 from src.service.message_service import (
     full_message_send,
@@ -44,6 +44,13 @@ from src.service.message_service import (
 from src.utils.math_utils import get_random_win, get_value_from_percentage
 from src.utils.string_utils import get_belly_formatted
 
+# The abilities that modify the odds and outcome of a plunder
+PLUNDER_ABILITY_TYPES: list[DevilFruitAbilityType] = [
+    DevilFruitAbilityType.PLUNDER_SENTENCE_DURATION,
+    DevilFruitAbilityType.PLUNDER_IMMUNITY_DURATION,
+    DevilFruitAbilityType.PLUNDER_COOLDOWN_DURATION,
+]
+
 
 async def manage(
     update: Update,
@@ -166,12 +173,13 @@ async def validate(
 
 
 def get_plunder_odds(
-    challenger: User, opponent: User
+    challenger: User, opponent: User, combat_context: CombatContext
 ) -> tuple[int, int, int, float, int, int, int]:
     """
     Get the win probability
     :param challenger: The challenger object
     :param opponent: The opponent object
+    :param combat_context: The combat context of challenger and opponent
     :return: list -  [0] - Win probability, [1] - Win amount, [2] - Lose amount,
      [3] - Win percentage [4] - Final bounty if user win, [5] - Final bounty if user lose,
      [6] - Sentence duration in hours
@@ -188,7 +196,7 @@ def get_plunder_odds(
     win_percentage = (100 - win_probability) / 2
     win_amount = int(get_value_from_percentage(opponent.bounty, win_percentage))
     sentence_duration = ceil(
-        get_ability_value(
+        combat_context.get_ability_value(
             challenger, DevilFruitAbilityType.PLUNDER_SENTENCE_DURATION, win_percentage
         )
     )
@@ -208,6 +216,30 @@ def get_plunder_odds(
     )
 
 
+async def delete_previous_plunders(
+    context: ContextTypes.DEFAULT_TYPE, user: User, group_chat: GroupChat
+) -> None:
+    """
+    Delete all the pending plunders of the user
+    :param context: The context
+    :param user: The user
+    :param group_chat: The group chat
+    :return: None
+    """
+
+    pending_condition = (Plunder.challenger == user) & (Plunder.status == GameStatus.IN_PROGRESS)
+    message_ids: list[int] = [
+        message_id
+        for (message_id,) in Plunder.select(Plunder.message_id).where(pending_condition).tuples()
+        if message_id is not None
+    ]
+    Plunder.delete().where(pending_condition).execute()
+
+    # Try to delete messages
+    for message_id in message_ids:
+        await delete_message(context=context, group_chat=group_chat, message_id=message_id)
+
+
 async def delete_plunder(
     context: ContextTypes.DEFAULT_TYPE, plunder: Plunder, group_chat: GroupChat
 ) -> None:
@@ -238,14 +270,11 @@ async def send_request(
     """
 
     # Delete all previous pending plunders
-    previous_plunders: list[Plunder] = Plunder.select().where(
-        (Plunder.challenger == user) & (Plunder.status == GameStatus.IN_PROGRESS)
-    )
-    for previous_plunder in previous_plunders:
-        await delete_plunder(context, previous_plunder, group_chat)
+    await delete_previous_plunders(context, user, group_chat)
 
     # Get opponent
     opponent: User = get_opponent(update)
+    combat_context: CombatContext = load_combat_context(user, opponent, PLUNDER_ABILITY_TYPES)
     (
         win_probability,
         win_amount,
@@ -254,7 +283,7 @@ async def send_request(
         final_bounty_if_win,
         final_bounty_if_lose,
         sentence,
-    ) = get_plunder_odds(user, opponent)
+    ) = get_plunder_odds(user, opponent, combat_context)
 
     # Create plunder
     plunder: Plunder = Plunder()
@@ -333,6 +362,7 @@ async def keyboard_interaction(
         return
 
     opponent: User = plunder.opponent
+    combat_context: CombatContext = load_combat_context(user, opponent, PLUNDER_ABILITY_TYPES)
     # Get plunder odds
     (
         win_probability,
@@ -342,7 +372,7 @@ async def keyboard_interaction(
         final_bounty_if_win,
         final_bounty_if_lose,
         sentence,
-    ) = get_plunder_odds(user, opponent)
+    ) = get_plunder_odds(user, opponent, combat_context)
 
     plunder.win_probability = win_probability
     plunder.date = datetime.datetime.now()
@@ -411,7 +441,7 @@ async def keyboard_interaction(
         saved_media_name: SavedMediaName = SavedMediaName.PLUNDER_FAIL
 
     # Add plunder immunity to opponent
-    opponent.plunder_immunity_end_date = get_ability_adjusted_datetime(
+    opponent.plunder_immunity_end_date = combat_context.get_ability_adjusted_datetime(
         opponent,
         DevilFruitAbilityType.PLUNDER_IMMUNITY_DURATION,
         Env.PLUNDER_IMMUNITY_DURATION.get_int(),
@@ -420,7 +450,7 @@ async def keyboard_interaction(
     user.plunder_immunity_end_date = None
 
     # Add plunder cooldown to user
-    user.plunder_cooldown_end_date = get_ability_adjusted_datetime(
+    user.plunder_cooldown_end_date = combat_context.get_ability_adjusted_datetime(
         user,
         DevilFruitAbilityType.PLUNDER_COOLDOWN_DURATION,
         Env.PLUNDER_COOLDOWN_DURATION.get_int(),
@@ -20,11 +20,13 @@ from src.model.Group import Group
 from src.model.GroupChat import GroupChat
 from src.model.GroupUser import GroupUser
 from src.model.User import User
-from src.model.enums.ContextDataKey import ContextDataType, ContextDataKey
+from src.model.enums.ContextDataKey import ContextDataKey
 from src.model.enums.Feature import Feature
 from src.model.enums.MessageSource import MessageSource
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
+from src.model.enums.TraceKind import TraceKind
 from src.model.error.ChatWarning import ChatWarning
 from src.model.error.CommonChatError import CommonChatException
 from src.model.error.CustomException import (
@@ -35,14 +37,15 @@ from src.model.error.CustomException import (
 from src.model.error.GroupChatError import GroupChatException
 from src.model.error.PrivateChatError import PrivateChatException
 from src.model.pojo.Keyboard import Keyboard
+import src.service.identity_map_service as identity_map_service
+import src.service.metrics_service as metrics_service
+import src.service.rate_limit_service as rate_limit_service
+import src.service.task_service as task_service
 from src.service.bot_service import (
-    get_context_data,
-    set_context_data,
     get_user_context_data,
     set_user_context_data,
     remove_user_context_data,
 )
-from src.service.date_service import get_datetime_in_future_seconds
 from src.service.group_service import feature_is_enabled, get_group_or_topic_text, is_main_group
 from src.service.message_service import (
     full_message_send,
@@ -88,7 +91,7 @@ async def manage_regular(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     :return: None
     """
 
-    context.application.create_task(manage(update, context, False))
+    task_service.submit(TaskPoolType.UPDATES, manage(update, context, False))
 
 
 async def manage_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -99,7 +102,7 @@ async def manage_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     :return: None
     """
 
-    context.application.create_task(manage(update, context, True))
+    task_service.submit(TaskPoolType.UPDATES, manage(update, context, True))
 
 
 async def manage(update: Update, context: ContextTypes.DEFAULT_TYPE, is_callback: bool) -> None:
@@ -127,7 +130,11 @@ async def manage(update: Update, context: ContextTypes.DEFAULT_TYPE, is_callback
 
     db = init()
     try:
-        await manage_after_db(update, context, is_callback)
+        with (
+            identity_map_service.scope(),
+            metrics_service.trace(TraceKind.UPDATE, "callback" if is_callback else "message"),
+        ):
+            await manage_after_db(update, context, is_callback)
     except AnonymousAdminException:  # Wasn't able to infer the user
         pass
     except Exception as e:
@@ -199,6 +206,7 @@ async def manage_after_db(
 
         user.private_screen_previous_step = user.private_screen_step
         user.save()
+        identity_map_service.set_effective_user(user)
 
     # Leave chat if not recognized
     if message_source is MessageSource.ND:
@@ -215,6 +223,8 @@ async def manage_after_db(
             update, (user if update.effective_user is not None else None)
         )
         group_chat: GroupChat = add_or_update_group_chat(update, group)
+        identity_map_service.add(group, str(group.tg_group_id))
+        identity_map_service.add(group_chat, (str(group.tg_group_id), group_chat.tg_topic_id))
 
     command: Command.Command = Command.ND
     keyboard = None
@@ -730,11 +740,9 @@ async def is_spam(
     """
 
     if message_source is MessageSource.PRIVATE:
-        context_data_type = ContextDataType.USER
-        inner_key = None
+        key = str(update.effective_user.id)
     elif message_source is MessageSource.GROUP:
-        context_data_type = ContextDataType.BOT
-        inner_key = str(update.effective_chat.id)
+        key = str(update.effective_chat.id)
     else:
         return False  # Not managing spam for other message sources
 
@@ -746,63 +754,21 @@ async def is_spam(
     if command is not None and command.screen is Screen.GRP_RUSSIAN_ROULETTE_GAME:
         return False
 
-    # Get past messages date list
-    try:
-        past_messages_date_list: list[datetime] = get_context_data(
-            context, context_data_type, ContextDataKey.PAST_MESSAGES_DATE, inner_key=inner_key
-        )
-    except CommonChatException:
-        past_messages_date_list = []
+    is_throttled, is_first_throttle = rate_limit_service.hit(message_source, key)
+    if not is_throttled:
+        return False
 
-    # Remove old messages
-    now = datetime.now()
-    past_messages_date_list = [
-        x
-        for x in past_messages_date_list
-        if now
-        < get_datetime_in_future_seconds(
-            Env.ANTI_SPAM_TIME_INTERVAL_SECONDS.get_int(), start_time=x
+    # In case spam limit was just reached, send warning message just in private chat
+    if is_first_throttle and message_source is MessageSource.PRIVATE:
+        await full_message_send(
+            context,
+            phrases.ANTI_SPAM_WARNING,
+            update=update,
+            quote_if_group=False,
+            new_message=True,
         )
-    ]
 
-    # Check if the message is spam
-    spam_limit = (
-        Env.ANTI_SPAM_PRIVATE_CHAT_MESSAGE_LIMIT.get_int()
-        if message_source is MessageSource.PRIVATE
-        else Env.ANTI_SPAM_GROUP_CHAT_MESSAGE_LIMIT.get_int()
-    )
-
-    if len(past_messages_date_list) >= spam_limit:
-        # In case spam limit was just reached, send warning message just in private chat
-        if len(past_messages_date_list) == spam_limit and message_source is MessageSource.PRIVATE:
-            past_messages_date_list.append(now)
-            set_context_data(
-                context,
-                context_data_type,
-                ContextDataKey.PAST_MESSAGES_DATE,
-                past_messages_date_list,
-                inner_key=inner_key,
-            )
-            await full_message_send(
-                context,
-                phrases.ANTI_SPAM_WARNING,
-                update=update,
-                quote_if_group=False,
-                new_message=True,
-            )
-        return True
-
-    # Add the message to the list
-    past_messages_date_list.append(now)
-    set_context_data(
-        context,
-        context_data_type,
-        ContextDataKey.PAST_MESSAGES_DATE,
-        past_messages_date_list,
-        inner_key=inner_key,
-    )
-
-    return False
+    return True
 
 
 async def check_current_requests(context: ContextTypes.DEFAULT_TYPE) -> bool:
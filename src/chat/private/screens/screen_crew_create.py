@@ -7,10 +7,12 @@ from telegram.ext import ContextTypes
 import resources.Environment as Env
 import resources.phrases as phrases
 import src.model.enums.crew.CrewRole as CrewRole
+import src.service.search_index_service as search_index_service
 from src.model.Crew import Crew
 from src.model.User import User
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.model.enums.SearchIndexType import SearchIndexType
 from src.model.error.ChatWarning import ChatWarning
 from src.model.error.CustomException import CrewValidationException
 from src.model.error.PrivateChatError import PrivateChatError, PrivateChatException
@@ -94,6 +96,8 @@ async def manage(
 
                     # Add user to crew
                     if should_create_item:
+                        # The captain, added below
+                        crew.member_count = 1
                         crew.save()
                         # Remove price from user bounty
                         await add_or_remove_bounty(
@@ -158,6 +162,7 @@ async def manage(
             # Input provided, save crew and reset private screen
             if step in REQUIRES_TEXT:
                 crew.save()
+                search_index_service.invalidate(SearchIndexType.CREW)
                 user.reset_private_screen()
             else:
                 user.private_screen_force_go_back = True
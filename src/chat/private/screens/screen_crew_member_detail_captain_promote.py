@@ -13,6 +13,7 @@ from src.model.error.CustomException import CrewValidationException
 from src.model.pojo.Keyboard import Keyboard
 from src.service.bounty_service import get_duration_to_next_bounty_reset
 from src.service.crew_service import get_crew
+from src.service.crew_summary_service import invalidate_crew_summary
 from src.service.message_service import (
     full_message_send,
     get_yes_no_keyboard,
@@ -101,6 +102,7 @@ async def manage(
     crew.save()
     member.save()
     user.save()
+    invalidate_crew_summary(crew)
 
     # Send success message
     ot_text = phrases.CREW_PROMOTE_TO_CAPTAIN_SUCCESS.format(mention_markdown_user(member))
@@ -8,6 +8,7 @@ from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.error.CustomException import CrewValidationException
 from src.model.pojo.Keyboard import Keyboard
 from src.service.crew_service import get_crew
+from src.service.crew_summary_service import invalidate_crew_summary
 from src.service.leaderboard_service import get_remaining_time_to_next_leaderboard
 from src.service.message_service import (
     full_message_send,
@@ -72,6 +73,7 @@ async def manage(
     # Demote from First Mate
     member.crew_role = None
     member.save()
+    invalidate_crew_summary(member.crew)
 
     # Send success message
     ot_text = phrases.CREW_DEMOTE_FROM_FIRST_MATE_SUCCESS.format(mention_markdown_user(member))
@@ -12,6 +12,7 @@ from src.model.enums.crew.CrewRole import CrewRole
 from src.model.error.CustomException import CrewValidationException
 from src.model.pojo.Keyboard import Keyboard
 from src.service.crew_service import get_crew
+from src.service.crew_summary_service import invalidate_crew_summary
 from src.service.message_service import (
     full_message_send,
     get_yes_no_keyboard,
@@ -94,6 +95,7 @@ async def manage(
     member.crew_promotion_date = datetime.datetime.now()
     crew.save()
     member.save()
+    invalidate_crew_summary(crew)
 
     # Send success message
     ot_text = phrases.CREW_PROMOTE_TO_FIRST_MATE_SUCCESS.format(mention_markdown_user(member))
@@ -1,7 +1,9 @@
+from peewee import Select
 from telegram import Update
 from telegram.ext import ContextTypes
 
 import resources.phrases as phrases
+import src.service.search_index_service as search_index_service
 from src.chat.private.screens.screen_crew_davy_back_fight_request import (
     ScreenReservedKeys as DBFRequestReservedKeys,
 )
@@ -12,6 +14,7 @@ from src.model.enums.Emoji import Emoji
 from src.model.enums.ListPage import ListPage, EmojiLegend, ListFilter, ListFilterType
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.model.enums.SearchIndexType import SearchIndexType
 from src.model.error.CustomException import UnauthorizedToViewItemException
 from src.model.error.PrivateChatError import PrivateChatException
 from src.model.pojo.Keyboard import Keyboard
@@ -35,18 +38,45 @@ class CrewSearchListPage(ListPage):
         if self.object is None:
             raise PrivateChatException(text=phrases.CREW_NOT_FOUND)
 
-    def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[User]:
-        return (
-            self.object.select()
-            .where(
-                (Crew.is_active == True)
-                & (Crew.allow_view_in_search == True)
-                & (self.get_active_filter_list_condition())
+    def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[Crew]:
+        search_text = self.get_active_string_filter_value()
+        if search_text is not None:
+            crew_ids, _ = self.search(
+                SearchIndexType.CREW, self.get_items_query(Crew.id), page, limit
             )
+            return search_index_service.get_rows(SearchIndexType.CREW, crew_ids)
+
+        return (
+            self.get_items_query()
             .order_by(Crew.level.desc(), Crew.total_gained_chest_amount.desc())
             .paginate(page, limit)
         )
 
+    def get_total_items_count(self) -> int:
+        search_text = self.get_active_string_filter_value()
+        if search_text is not None:
+            _, total_count = self.search(
+                SearchIndexType.CREW, self.get_items_query(Crew.id), None, 0
+            )
+            return total_count
+
+        return self.get_items_query().count()
+
+    def get_items_query(self, *fields) -> Select:
+        """
+        Get the query of the crews in the list, without the string filter which is searched
+        with the search index
+
+        :param fields: The fields to select, all if empty
+        :return: The query
+        """
+
+        return Crew.select(*fields).where(
+            (Crew.is_active == True)
+            & (Crew.allow_view_in_search == True)
+            & (self.get_active_filter_list_condition(include_string_filter=False))
+        )
+
     def get_item_text(self) -> str:
         return self.get_emoji_legend_multiple_formatted() + phrases.CREW_SEARCH_ITEM_TEXT.format(
             self.object.get_name_escaped(), self.object.level
@@ -123,7 +153,7 @@ class CrewSearchListPage(ListPage):
             ListFilter(
                 ListFilterType.STRING,
                 phrases.CREW_SEARCH_FILTER_NAME,
-                (Crew.name ** ("%" + str(self.string_filter) + "%")),
+                None,  # Searched with the search index
             ),
         ]
 
@@ -151,8 +181,8 @@ class CrewSearchListPage(ListPage):
         return (
             (Crew.allow_davy_back_fight_request == True)
             & (Crew.id.in_(DavyBackFight.get_crew_with_enough_members()))
-            & (Crew.id.not_in([c.id for c in DavyBackFight.get_crews_in_active()]))
-            & (Crew.id.not_in([c.id for c in DavyBackFight.get_crews_in_penalty()]))
+            & (Crew.id.not_in(DavyBackFight.get_crew_ids_in_active()))
+            & (Crew.id.not_in(DavyBackFight.get_crew_ids_in_penalty()))
             & (Crew.id != self.user.crew.id)
         )
 
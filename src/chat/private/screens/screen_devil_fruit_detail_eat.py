@@ -5,12 +5,14 @@ from telegram import Update
 from telegram.ext import ContextTypes
 
 import resources.phrases as phrases
+import src.service.task_service as task_service
 from resources import Environment as Env
 from src.model.DevilFruit import DevilFruit
 from src.model.DevilFruitTrade import DevilFruitTrade
 from src.model.User import User
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.enums.devil_fruit.DevilFruitCategory import DevilFruitCategory
 from src.model.enums.devil_fruit.DevilFruitStatus import DevilFruitStatus
 from src.model.error.CustomException import DevilFruitValidationException
@@ -119,8 +121,9 @@ async def manage(
     await full_message_send(context, ot_text, update=update, inbound_keyboard=inbound_keyboard)
 
     # Alert user if it will be disbanded if they don't appear in the next leaderboard
-    context.application.create_task(
-        warn_inactive_users_with_eaten_devil_fruit(context, users=[user])
+    task_service.submit(
+        TaskPoolType.NOTIFICATIONS,
+        warn_inactive_users_with_eaten_devil_fruit(context, users=[user]),
     )
 
 
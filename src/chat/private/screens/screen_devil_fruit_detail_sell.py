@@ -3,6 +3,7 @@ from enum import IntEnum
 from telegram import Update
 from telegram.ext import ContextTypes
 
+import src.service.search_index_service as search_index_service
 from resources import phrases
 from src.chat.group.screens.screen_devil_fruit_sell import validate_trade
 from src.model.DevilFruit import DevilFruit
@@ -11,6 +12,7 @@ from src.model.User import User
 from src.model.enums.ContextDataKey import ContextDataKey
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.model.enums.SearchIndexType import SearchIndexType
 from src.model.enums.devil_fruit.DevilFruitSource import DevilFruitSource
 from src.model.pojo.Keyboard import Keyboard
 from src.service.bounty_service import get_amount_from_string, validate_amount
@@ -148,6 +150,7 @@ async def manage(
             trade.source = DevilFruitSource.SHOP
             trade.price = amount
             trade.save()
+            search_index_service.invalidate(SearchIndexType.DEVIL_FRUIT_SHOP)
 
             user.private_screen_in_edit_id = None
             user.private_screen_force_go_back = True
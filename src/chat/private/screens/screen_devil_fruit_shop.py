@@ -1,14 +1,17 @@
+from peewee import Select
 from telegram import Update
 from telegram.ext import ContextTypes
 
+import src.service.search_index_service as search_index_service
 from resources import phrases
 from src.model.DevilFruit import DevilFruit
 from src.model.DevilFruitTrade import DevilFruitTrade
 from src.model.User import User
 from src.model.enums.Emoji import Emoji
-from src.model.enums.ListPage import ListPage, EmojiLegend
+from src.model.enums.ListPage import ListPage, EmojiLegend, ListFilter, ListFilterType
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.model.enums.SearchIndexType import SearchIndexType
 from src.model.enums.devil_fruit.DevilFruitCategory import DevilFruitCategory
 from src.model.enums.devil_fruit.DevilFruitSource import DevilFruitSource
 from src.model.enums.devil_fruit.DevilFruitTradeStatus import DevilFruitTradeStatus
@@ -37,16 +40,44 @@ class DevilFruitShopListPage(ListPage):
     def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[DevilFruitTrade]:
         """Get Devil Fruits that are owned by user"""
 
+        search_text = self.get_active_string_filter_value()
+        if search_text is not None:
+            trade_ids, _ = self.search(
+                SearchIndexType.DEVIL_FRUIT_SHOP,
+                self.get_items_query(DevilFruitTrade.id),
+                page,
+                limit,
+            )
+            return search_index_service.get_rows(SearchIndexType.DEVIL_FRUIT_SHOP, trade_ids)
+
+        return self.get_items_query().order_by(DevilFruitTrade.date).paginate(page, limit)
+
+    def get_total_items_count(self) -> int:
+        search_text = self.get_active_string_filter_value()
+        if search_text is not None:
+            _, total_count = self.search(
+                SearchIndexType.DEVIL_FRUIT_SHOP, self.get_items_query(DevilFruitTrade.id), None, 0
+            )
+            return total_count
+
+        return self.get_items_query().count()
+
+    def get_items_query(self, *fields) -> Select:
+        """
+        Get the query of the Devil Fruits in the shop, without the string filter which is
+        searched with the search index
+        :param fields: The fields to select, all if empty
+        :return: The query
+        """
+
         return (
-            self.object.select()
+            DevilFruitTrade.select(*fields)
             .join(DevilFruit)
             .where(
                 (DevilFruitTrade.source == DevilFruitSource.SHOP)
                 & (DevilFruitTrade.status == DevilFruitTradeStatus.PENDING)
-                & (self.get_active_filter_list_condition())
+                & (self.get_active_filter_list_condition(include_string_filter=False))
             )
-            .order_by(DevilFruitTrade.date)
-            .paginate(page, limit)
         )
 
     def get_item_text(self) -> str:
@@ -99,6 +130,21 @@ class DevilFruitShopListPage(ListPage):
             ),
         ]
 
+    def get_filter_list(self) -> list[ListFilter]:
+        """
+        Get the filter list
+
+        :return: The filter list
+        """
+
+        return super().get_filter_list() + [
+            ListFilter(
+                ListFilterType.STRING,
+                phrases.DEVIL_FRUIT_SHOP_FILTER_NAME,
+                None,  # Searched with the search index
+            ),
+        ]
+
 
 async def manage(
     update: Update, context: ContextTypes.DEFAULT_TYPE, inbound_keyboard: Keyboard, user: User
@@ -119,8 +165,10 @@ async def manage(
     devil_fruit_shop_list_page: DevilFruitShopListPage = DevilFruitShopListPage()
     devil_fruit_shop_list_page.user = user
 
-    # Has direct DF Shop item
-    direct_item: DevilFruitTrade = devil_fruit_shop_list_page.get_direct_item()
+    # Has direct DF Shop item, not when a search text is sent
+    direct_item: DevilFruitTrade | None = (
+        devil_fruit_shop_list_page.get_direct_item() if inbound_keyboard is not None else None
+    )
     if direct_item is not None:
         inbound_keyboard.info[ReservedKeyboardKeys.DEFAULT_SECONDARY_KEY] = direct_item.id
         await screen_devil_fruit_shop_detail_detail(update, context, inbound_keyboard, user)
@@ -137,6 +185,8 @@ async def manage(
         empty_list_text=phrases.DEVIL_FRUIT_SHOP_LIST_NO_ITEMS,
         context=context,
         user=user,
+        update=update,
+        allow_string_filter=True,
     )
 
     await full_message_send(
@@ -0,0 +1,211 @@
+import asyncio
+import importlib
+import logging
+import time
+from types import ModuleType
+from typing import Callable, Coroutine
+
+from src.model.enums.Screen import Screen
+
+# Module of the handler of each group screen, imported the first time the screen is used
+GROUP_SCREEN_MODULES: dict[Screen, str] = {
+    Screen.GRP_USER_STATUS: "src.chat.group.screens.screen_status",
+    Screen.GRP_DOC_Q_GAME: "src.chat.group.screens.screen_doc_q_game",
+    Screen.GRP_CHANGE_REGION: "src.chat.group.screens.screen_change_region",
+    Screen.GRP_FIGHT: "src.chat.group.screens.screen_fight",
+    Screen.GRP_GAME: "src.chat.group.screens.screen_game",
+    Screen.GRP_GAME_SELECTION: "src.chat.group.screens.screen_game_selection",
+    Screen.GRP_GAME_OPPONENT_CONFIRMATION: (
+        "src.chat.group.screens.screen_game_opponent_confirmation"
+    ),
+    Screen.GRP_ROCK_PAPER_SCISSORS_GAME: "src.chat.group.screens.screen_game_rps",
+    Screen.GRP_RUSSIAN_ROULETTE_GAME: "src.chat.group.screens.screen_game_rr",
+    Screen.GRP_PREDICTION_BET: "src.chat.group.screens.screen_prediction_bet",
+    Screen.GRP_PREDICTION_BET_REMOVE: "src.chat.group.screens.screen_prediction_bet_remove",
+    Screen.GRP_PREDICTION_BET_STATUS: "src.chat.group.screens.screen_prediction_bet_status",
+    Screen.GRP_CREW_JOIN: "src.chat.group.screens.screen_crew_join",
+    Screen.GRP_CREW_INVITE: "src.chat.group.screens.screen_crew_invite",
+    Screen.GRP_SILENCE: "src.chat.group.screens.screen_silence",
+    Screen.GRP_SILENCE_END: "src.chat.group.screens.screen_silence_end",
+    Screen.GRP_SPEAK: "src.chat.group.screens.screen_speak",
+    Screen.GRP_BOUNTY_GIFT: "src.chat.group.screens.screen_bounty_gift",
+    Screen.GRP_SETTINGS_FEATURES: "src.chat.group.screens.screen_settings_features",
+    Screen.GRP_DEVIL_FRUIT_SELL: "src.chat.group.screens.screen_devil_fruit_sell",
+    Screen.GRP_BOUNTY_LOAN: "src.chat.group.screens.screen_bounty_loan",
+    Screen.GRP_PLUNDER: "src.chat.group.screens.screen_plunder",
+    Screen.GRP_DAILY_REWARD: "src.chat.group.screens.screen_daily_reward",
+    Screen.GRP_DAILY_REWARD_PRIZE: "src.chat.group.screens.screen_daily_reward_prize",
+    Screen.GRP_SETTINGS: "src.chat.group.screens.screen_settings",
+    Screen.GRP_SETTINGS_AUTO_DELETE: "src.chat.group.screens.screen_settings_auto_delete",
+}
+
+# Module of the handler of each private screen, imported the first time the screen is used
+PRIVATE_SCREEN_MODULES: dict[Screen, str] = {
+    Screen.PVT_START: "src.chat.private.screens.screen_start",
+    Screen.PVT_SETTINGS: "src.chat.private.screens.screen_settings",
+    Screen.PVT_USER_STATUS: "src.chat.private.screens.screen_status",
+    Screen.PVT_CREW: "src.chat.private.screens.screen_crew",
+    Screen.PVT_CREW_ABILITY: "src.chat.private.screens.screen_crew_ability",
+    Screen.PVT_CREW_ABILITY_ACTIVATE: "src.chat.private.screens.screen_crew_ability_activate",
+    Screen.PVT_CREW_ABILITY_ACTIVATE_CONFIRM: (
+        "src.chat.private.screens.screen_crew_ability_activate_confirm"
+    ),
+    Screen.PVT_CREW_CREATE_OR_EDIT: "src.chat.private.screens.screen_crew_create",
+    Screen.PVT_CREW_POWERUP: "src.chat.private.screens.screen_crew_powerup",
+    Screen.PVT_CREW_LEVEL: "src.chat.private.screens.screen_crew_level",
+    Screen.PVT_CREW_LEVEL_UP: "src.chat.private.screens.screen_crew_level_up",
+    Screen.PVT_CREW_MODIFY: "src.chat.private.screens.screen_crew_modify",
+    Screen.PVT_CREW_LEAVE: "src.chat.private.screens.screen_crew_leave",
+    Screen.PVT_CREW_DISBAND: "src.chat.private.screens.screen_crew_disband",
+    Screen.PVT_CREW_MEMBER: "src.chat.private.screens.screen_crew_member",
+    Screen.PVT_CREW_MEMBER_DETAIL: "src.chat.private.screens.screen_crew_member_detail",
+    Screen.PVT_CREW_MEMBER_DETAIL_REMOVE: (
+        "src.chat.private.screens.screen_crew_member_detail_remove"
+    ),
+    Screen.PVT_CREW_MEMBER_DETAIL_FIRST_MATE_PROMOTE: (
+        "src.chat.private.screens.screen_crew_member_detail_first_mate_promote"
+    ),
+    Screen.PVT_CREW_MEMBER_DETAIL_FIRST_MATE_DEMOTE: (
+        "src.chat.private.screens.screen_crew_member_detail_first_mate_demote"
+    ),
+    Screen.PVT_CREW_MEMBER_DETAIL_POST_BAIL: (
+        "src.chat.private.screens.screen_crew_member_detail_post_bail"
+    ),
+    Screen.PVT_CREW_SEARCH: "src.chat.private.screens.screen_crew_search",
+    Screen.PVT_CREW_SEARCH_DETAIL: "src.chat.private.screens.screen_crew_search_detail",
+    Screen.PVT_CREW_SEARCH_DETAIL_JOIN: "src.chat.private.screens.screen_crew_search_detail_join",
+    Screen.PVT_CREW_JOIN_REQUEST_RECEIVED: (
+        "src.chat.private.screens.screen_crew_join_request_received"
+    ),
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_REQUEST: (
+        "src.chat.private.screens.screen_crew_davy_back_fight_request"
+    ),
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_REQUEST_RECEIVED: (
+        "src.chat.private.screens.screen_crew_davy_back_fight_request_received"
+    ),
+    Screen.PVT_SETTINGS_NOTIFICATIONS: "src.chat.private.screens.screen_settings_notifications",
+    Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE: (
+        "src.chat.private.screens.screen_settings_notifications_type"
+    ),
+    Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE_EDIT: (
+        "src.chat.private.screens.screen_settings_notifications_type_edit"
+    ),
+    Screen.PVT_LOGS: "src.chat.private.screens.screen_logs",
+    Screen.PVT_LOGS_TYPE: "src.chat.private.screens.screen_logs_type",
+    Screen.PVT_LOGS_TYPE_DETAIL: "src.chat.private.screens.screen_logs_type_detail",
+    Screen.PVT_PREDICTION: "src.chat.private.screens.screen_prediction",
+    Screen.PVT_PREDICTION_DETAIL: "src.chat.private.screens.screen_prediction_detail",
+    Screen.PVT_PREDICTION_DETAIL_PLACE_BET: (
+        "src.chat.private.screens.screen_prediction_detail_place_bet"
+    ),
+    Screen.PVT_PREDICTION_DETAIL_PLACE_BET_SEND_AMOUNT: (
+        "src.chat.private.screens.screen_prediction_detail_place_bet_send_amount"
+    ),
+    Screen.PVT_PREDICTION_DETAIL_REMOVE_BET: (
+        "src.chat.private.screens.screen_prediction_detail_remove_bet"
+    ),
+    Screen.PVT_PREDICTION_DETAIL_REMOVE_BET_CONFIRM: (
+        "src.chat.private.screens.screen_prediction_detail_remove_bet_confirm"
+    ),
+    Screen.PVT_PREDICTION_DETAIL_SEND_TO_GROUP: (
+        "src.chat.private.screens.screen_prediction_detail_send_to_group_chat"
+    ),
+    Screen.PVT_PREDICTION_DETAIL_SET_RESULT: (
+        "src.chat.private.screens.screen_prediction_detail_set_result"
+    ),
+    Screen.PVT_PREDICTION_CREATE: "src.chat.private.screens.screen_prediction_create",
+    Screen.PVT_DEVIL_FRUIT: "src.chat.private.screens.screen_devil_fruit",
+    Screen.PVT_DEVIL_FRUIT_DETAIL: "src.chat.private.screens.screen_devil_fruit_detail",
+    Screen.PVT_DEVIL_FRUIT_DETAIL_EAT: "src.chat.private.screens.screen_devil_fruit_detail_eat",
+    Screen.PVT_DEVIL_FRUIT_DETAIL_DISCARD: (
+        "src.chat.private.screens.screen_devil_fruit_detail_discard"
+    ),
+    Screen.PVT_DEVIL_FRUIT_DETAIL_SELL: "src.chat.private.screens.screen_devil_fruit_detail_sell",
+    Screen.PVT_GAME_GUESS_INPUT: "src.chat.private.screens.screen_game_guess_input",
+    Screen.PVT_LOGS_TYPE_STATS: "src.chat.private.screens.screen_logs_type_stats",
+    Screen.PVT_SETTINGS_TIMEZONE: "src.chat.private.screens.screen_settings_timezone",
+    Screen.PVT_BOUNTY_LOAN: "src.chat.private.screens.screen_bounty_loan",
+    Screen.PVT_BOUNTY_LOAN_DETAIL: "src.chat.private.screens.screen_bounty_loan_detail",
+    Screen.PVT_BOUNTY_LOAN_DETAIL_PAY: "src.chat.private.screens.screen_bounty_loan_detail_pay",
+    Screen.PVT_BOUNTY_LOAN_DETAIL_FORGIVE: (
+        "src.chat.private.screens.screen_bounty_loan_detail_forgive"
+    ),
+    Screen.PVT_CREW_DAVY_BACK_FIGHT: "src.chat.private.screens.screen_crew_davy_back_fight",
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL: (
+        "src.chat.private.screens.screen_crew_davy_back_fight_detail"
+    ),
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_PARTICIPANTS_SELECT: (
+        "src.chat.private.screens.screen_crew_davy_back_fight_detail_participants_select"
+    ),
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_PARTICIPANTS_VIEW: (
+        "src.chat.private.screens.screen_crew_davy_back_fight_detail_participants_view"
+    ),
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_CONSCRIPT_OPPONENT: (
+        "src.chat.private.screens.screen_crew_davy_back_fight_detail_conscript_opponent"
+    ),
+    Screen.PVT_CREW_MODIFY_DAVY_BACK_FIGHT_DEFAULT_PARTICIPANTS: (
+        "src.chat.private.screens.screen_crew_modify_davy_back_fight_default_participants"
+    ),
+    Screen.PVT_DEVIL_FRUIT_SHOP: "src.chat.private.screens.screen_devil_fruit_shop",
+    Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL: "src.chat.private.screens.screen_devil_fruit_shop_detail",
+    Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL_BUY: (
+        "src.chat.private.screens.screen_devil_fruit_shop_detail_buy"
+    ),
+    Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL_REMOVE: (
+        "src.chat.private.screens.screen_devil_fruit_shop_detail_remove"
+    ),
+    Screen.PVT_CREW_MEMBER_DETAIL_CAPTAIN_PROMOTE: (
+        "src.chat.private.screens.screen_crew_member_detail_captain_promote"
+    ),
+}
+
+SCREEN_MODULES: dict[Screen, str] = GROUP_SCREEN_MODULES | PRIVATE_SCREEN_MODULES
+
+
+def get_screen_handler(screen: Screen) -> Callable[..., Coroutine] | None:
+    """
+    Get the manage function of a screen, importing its module if needed
+    :param screen: The screen
+    :return: The manage function, None if the screen has no handler
+    """
+
+    if screen not in SCREEN_MODULES:
+        return None
+
+    return import_screen_module(screen).manage
+
+
+def import_screen_module(screen: Screen) -> ModuleType:
+    """
+    Import the module of a screen handler
+    :param screen: The screen
+    :return: The module
+    """
+
+    return importlib.import_module(SCREEN_MODULES[screen])
+
+
+async def preload_screen_modules() -> dict[str, float]:
+    """
+    Import the modules of all the screen handlers, so that the first use of a screen is not slowed
+    down by the import. Updates can be processed between imports
+    :return: The import time in seconds by module, close to zero for modules already imported
+    """
+
+    import_times: dict[str, float] = {}
+    for screen, module in SCREEN_MODULES.items():
+        if module in import_times:
+            continue
+
+        start = time.perf_counter()
+        import_screen_module(screen)
+        import_times[module] = time.perf_counter() - start
+        await asyncio.sleep(0)
+
+    logging.info(
+        f"Preloaded {len(import_times)} screen modules in {sum(import_times.values()):.2f}s"
+    )
+    for module, seconds in sorted(import_times.items(), key=lambda item: item[1], reverse=True):
+        logging.debug(f"Imported {module} in {seconds * 1000:.1f} ms")
+
+    return import_times
@@ -0,0 +1,99 @@
+from peewee import Database
+
+from src.model.BountyGift import BountyGift
+from src.model.BountyLoan import BountyLoan
+from src.model.Crew import Crew
+from src.model.CrewAbility import CrewAbility
+from src.model.CrewChestSpendingRecord import CrewChestSpendingRecord
+from src.model.CrewJoinRequest import CrewJoinRequest
+from src.model.CrewMemberChestContribution import CrewMemberChestContribution
+from src.model.DailyReward import DailyReward
+from src.model.DavyBackFight import DavyBackFight
+from src.model.DavyBackFightParticipant import DavyBackFightParticipant
+from src.model.DevilFruit import DevilFruit
+from src.model.DevilFruitAbility import DevilFruitAbility
+from src.model.DevilFruitTrade import DevilFruitTrade
+from src.model.DisabledNotification import DisabledNotification
+from src.model.DocQGame import DocQGame
+from src.model.Fight import Fight
+from src.model.Game import Game
+from src.model.Group import Group
+from src.model.GroupChat import GroupChat
+from src.model.GroupChatAutoDelete import GroupChatAutoDelete
+from src.model.GroupChatDisabledFeature import GroupChatDisabledFeature
+from src.model.GroupChatEnabledFeaturePin import GroupChatEnabledFeaturePin
+from src.model.GroupChatFeaturePinMessage import GroupChatFeaturePinMessage
+from src.model.GroupUser import GroupUser
+from src.model.ImpelDownLog import ImpelDownLog
+from src.model.IncomeTaxEvent import IncomeTaxEvent
+from src.model.Leaderboard import Leaderboard
+from src.model.LeaderboardCrew import LeaderboardCrew
+from src.model.LeaderboardUser import LeaderboardUser
+from src.model.LegendaryPirate import LegendaryPirate
+from src.model.Plunder import Plunder
+from src.model.Prediction import Prediction
+from src.model.PredictionGroupChatMessage import PredictionGroupChatMessage
+from src.model.PredictionOption import PredictionOption
+from src.model.PredictionOptionUser import PredictionOptionUser
+from src.model.RedditGroupPost import RedditGroupPost
+from src.model.SystemUpdate import SystemUpdate
+from src.model.SystemUpdateUser import SystemUpdateUser
+from src.model.UnmutedUser import UnmutedUser
+from src.model.User import User
+from src.model.Warlord import Warlord
+
+
+def upgrade(db: Database) -> None:
+    """
+    Create the tables that were previously created when each model was imported. Existing tables
+    are left untouched
+    :param db: The database
+    :return: None
+    """
+
+    db.create_tables(
+        [
+            BountyGift,
+            BountyLoan,
+            Crew,
+            CrewAbility,
+            CrewChestSpendingRecord,
+            CrewJoinRequest,
+            CrewMemberChestContribution,
+            DailyReward,
+            DavyBackFight,
+            DavyBackFightParticipant,
+            DevilFruit,
+            DevilFruitAbility,
+            DevilFruitTrade,
+            DisabledNotification,
+            DocQGame,
+            Fight,
+            Game,
+            Group,
+            GroupChat,
+            GroupChatAutoDelete,
+            GroupChatDisabledFeature,
+            GroupChatEnabledFeaturePin,
+            GroupChatFeaturePinMessage,
+            GroupUser,
+            ImpelDownLog,
+            IncomeTaxEvent,
+            Leaderboard,
+            LeaderboardCrew,
+            LeaderboardUser,
+            LegendaryPirate,
+            Plunder,
+            Prediction,
+            PredictionGroupChatMessage,
+            PredictionOption,
+            PredictionOptionUser,
+            RedditGroupPost,
+            SystemUpdate,
+            SystemUpdateUser,
+            UnmutedUser,
+            User,
+            Warlord,
+        ],
+        safe=True,
+    )
@@ -0,0 +1,29 @@
+from peewee import Database
+
+from src.model.DevilFruit import DevilFruit
+from src.model.DisabledNotification import DisabledNotification
+from src.model.Game import Game
+from src.model.GroupChatAutoDelete import GroupChatAutoDelete
+from src.model.Leaderboard import Leaderboard
+from src.model.PredictionOptionUser import PredictionOptionUser
+from src.model.User import User
+from src.service.migration_service import create_missing_indexes
+
+
+def upgrade(db: Database) -> None:
+    """
+    Add the secondary indexes used by the most frequent queries
+    :param db: The database
+    :return: None
+    """
+
+    for model in [
+        User,
+        Game,
+        DevilFruit,
+        GroupChatAutoDelete,
+        PredictionOptionUser,
+        DisabledNotification,
+        Leaderboard,
+    ]:
+        create_missing_indexes(db, model)
@@ -0,0 +1,13 @@
+from peewee import Database
+
+from src.model.GameTimer import GameTimer
+
+
+def upgrade(db: Database) -> None:
+    """
+    Create the table of the pending game timers
+    :param db: The database
+    :return: None
+    """
+
+    db.create_tables([GameTimer])
@@ -0,0 +1,14 @@
+from peewee import Database
+
+from src.model.TimerLease import TimerLease
+from src.model.TimerRun import TimerRun
+
+
+def upgrade(db: Database) -> None:
+    """
+    Create the tables of the timer leases and runs
+    :param db: The database
+    :return: None
+    """
+
+    db.create_tables([TimerLease, TimerRun])
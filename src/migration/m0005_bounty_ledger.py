@@ -0,0 +1,13 @@
+from peewee import Database
+
+from src.model.BountyLedgerEntry import BountyLedgerEntry
+
+
+def upgrade(db: Database) -> None:
+    """
+    Create the table of the bounty ledger
+    :param db: The database
+    :return: None
+    """
+
+    db.create_tables([BountyLedgerEntry])
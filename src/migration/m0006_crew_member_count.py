@@ -0,0 +1,15 @@
+from peewee import Database
+
+from src.model.Crew import Crew
+from src.service.migration_service import add_missing_column
+
+
+def upgrade(db: Database) -> None:
+    """
+    Add the member count of the crews, counted from their current members
+    :param db: The database
+    :return: None
+    """
+
+    add_missing_column(db, Crew.member_count)
+    Crew.set_member_count_from_members()
@@ -0,0 +1,44 @@
+from peewee import Database, SqliteDatabase
+from playhouse.migrate import SchemaMigrator, migrate
+
+# Columns saved before having a value, by table
+NULLABLE_COLUMNS = [
+    # Set once the leaderboard is sent
+    ("leaderboard", "message_id"),
+    # Set only if the daily reward is limited
+    ("daily_reward", "limitation"),
+    # Cleared when the user leaves the private screens
+    ("user", "private_screen_list"),
+    ("user", "private_screen_step"),
+]
+
+
+def upgrade(db: Database) -> None:
+    """
+    Allow null in the columns that are saved before having a value
+    :param db: The database
+    :return: None
+    """
+
+    migrator = SchemaMigrator.from_database(db)
+    operations = []
+    for table, column in NULLABLE_COLUMNS:
+        # Already nullable if the table was created from the current models
+        if not next(c for c in db.get_columns(table) if c.name == column).null:
+            operations.append(migrator.drop_not_null(table, column))
+
+    if len(operations) == 0:
+        return
+
+    # SQLite recreates the tables, which fails if other tables reference their rows while the
+    # foreign keys are enforced. It can only be changed outside a transaction
+    is_sqlite = isinstance(db, SqliteDatabase)
+    if is_sqlite:
+        db.execute_sql("PRAGMA foreign_keys = OFF")
+
+    try:
+        with db.atomic():
+            migrate(*operations)
+    finally:
+        if is_sqlite:
+            db.execute_sql("PRAGMA foreign_keys = ON")
@@ -1,3 +1,5 @@
+from typing import Any
+
 from peewee import *
 
 from resources.Database import Database
@@ -14,3 +16,15 @@ class BaseModel(Model):
     class Meta:
         database = db_obj.get_db()
         only_save_dirty = True
+
+    def set_saved_values(self, values: dict[str, Any]) -> None:
+        """
+        Set field values as read from the database. They are not marked as dirty, so that saving
+        the instance doesn't overwrite the changes made by other processes in the meantime
+        :param values: The values by field name
+        :return: None
+        """
+
+        for name, value in values.items():
+            self.__data__[name] = value
+            self._dirty.discard(name)
@@ -135,6 +135,3 @@ class BountyGift(BaseModel):
 
     class Meta:
         db_table = "bounty_gift"
-
-
-BountyGift.create_table()
@@ -0,0 +1,35 @@
+import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.User import User
+
+
+class BountyLedgerEntry(BaseModel):
+    """
+    BountyLedgerEntry class
+    A change of the bounty of a user, applied as an atomic delta. Entries are never modified
+    """
+
+    id: int | PrimaryKeyField = PrimaryKeyField()
+    user: User | ForeignKeyField = ForeignKeyField(
+        User,
+        backref="bounty_ledger_entries",
+        on_delete="CASCADE",
+        on_update="CASCADE",
+    )
+    bounty_delta: int | BigIntegerField = BigIntegerField(default=0)
+    pending_bounty_delta: int | BigIntegerField = BigIntegerField(default=0)
+    total_gained_bounty_delta: int | BigIntegerField = BigIntegerField(default=0)
+    tax_amount: int | BigIntegerField = BigIntegerField(default=0)
+    event_type: str | CharField = CharField(max_length=20, null=True)
+    event_id: int | IntegerField = IntegerField(null=True)
+    date: datetime.datetime | DateTimeField = DateTimeField(default=datetime.datetime.now)
+
+    class Meta:
+        db_table = "bounty_ledger_entry"
+        indexes = (
+            (("user", "date"), False),
+            (("event_type", "event_id"), False),
+        )
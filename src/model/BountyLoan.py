@@ -159,6 +159,3 @@ class BountyLoan(BaseModel):
             raise ValueError("External id is required for deeplink")
 
         return self.get_source().get_deeplink(self.external_id)
-
-
-BountyLoan.create_table()
@@ -2,9 +2,11 @@ import datetime
 from typing import Any
 
 from peewee import *
+from peewee import Expression
 
 import resources.Environment as Env
-from src.model.BaseModel import BaseModel, db_obj
+import src.service.text_render_service as text_render_service
+from src.model.BaseModel import BaseModel
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.crew.CrewChestSpendingReason import CrewChestSpendingReason
 from src.model.enums.crew.CrewLevelUpgradeType import CrewLevelUpgradeType
@@ -37,6 +39,7 @@ class Crew(BaseModel):
     allow_view_in_search: bool | BooleanField = BooleanField(default=True)
     allow_join_from_search: bool | BooleanField = BooleanField(default=True)
     is_full: bool | BooleanField = BooleanField(default=False)
+    member_count: int | IntegerField = IntegerField(default=0)
     allow_davy_back_fight_request: bool | BooleanField = BooleanField(default=True)
     auto_accept_davy_back_fight: bool | BooleanField = BooleanField(default=False)
     auto_accept_join: bool | BooleanField = BooleanField(default=True)
@@ -165,7 +168,7 @@ class Crew(BaseModel):
         :return: The number of crew members
         """
 
-        return self.crew_members.select().count()
+        return self.member_count
 
     def get_chest_contributions(self) -> list:
         """
@@ -308,7 +311,7 @@ class Crew(BaseModel):
         ).execute()
 
         # Reset is full attribute
-        Crew.set_is_full_for_all_crews()
+        Crew.set_is_full_from_member_count()
 
     def get_name_escaped(self) -> str:
         """
@@ -316,9 +319,7 @@ class Crew(BaseModel):
         :return: The crew name escaped
         """
 
-        from src.service.message_service import escape_valid_markdown_chars
-
-        return escape_valid_markdown_chars(self.name)
+        return text_render_service.escape_valid_markdown_chars(self.name)
 
     def get_description_escaped(self) -> str:
         """
@@ -326,9 +327,7 @@ class Crew(BaseModel):
         :return: The crew description escaped
         """
 
-        from src.service.message_service import escape_valid_markdown_chars
-
-        return escape_valid_markdown_chars(self.description)
+        return text_render_service.escape_valid_markdown_chars(self.description)
 
     def get_required_bounty_formatted(self) -> str:
         """
@@ -345,30 +344,62 @@ class Crew(BaseModel):
         Set the crew as full
         :return: None
         """
-        if self.get_member_count() >= self.max_members:
-            self.is_full = True
-        else:
-            self.is_full = False
+        self.is_full = self.member_count >= self.max_members
 
         self.save()
 
         # Also set Davy Back Fight priority
         self.set_davy_back_fight_priority()
 
+    def add_to_member_count(self, amount: int) -> None:
+        """
+        Add to the member count with an atomic update, then set if the crew is full
+        :param amount: The amount to add, negative to remove
+        :return: None
+        """
+
+        Crew.update(member_count=Crew.member_count + amount).where(Crew.id == self.id).execute()
+        Crew.set_is_full_from_member_count(Crew.id == self.id)
+
+        self.set_saved_values(
+            Crew.select(Crew.member_count, Crew.is_full).where(Crew.id == self.id).dicts().get()
+        )
+
+        # Also set Davy Back Fight priority
+        self.set_davy_back_fight_priority()
+
     @staticmethod
-    def set_is_full_for_all_crews() -> None:
+    def set_is_full_from_member_count(condition: Expression = None) -> None:
         """
-        Set the crew as full for all crews
+        Set if the crews are full from their member count
+        :param condition: The condition on the crews to update, all if None
         :return: None
         """
 
-        raw_query = (
-            "update crew"
-            " set is_full = IF(((select count(*) from user where crew_id = crew.id) <"
-            " crew.max_members), 0, 1)"
-            " where true;"
+        query = Crew.update(is_full=(Crew.member_count >= Crew.max_members))
+        if condition is not None:
+            query = query.where(condition)
+
+        query.execute()
+
+    @staticmethod
+    def set_member_count_from_members(condition: Expression = None) -> None:
+        """
+        Set the member count of the crews by counting their members, then set if they are full
+        :param condition: The condition on the crews to update, all if None
+        :return: None
+        """
+
+        from src.model.User import User
+
+        query = Crew.update(
+            member_count=User.select(fn.COUNT(User.id)).where(User.crew == Crew.id)
         )
-        db_obj.get_db().execute_sql(raw_query)
+        if condition is not None:
+            query = query.where(condition)
+
+        query.execute()
+        Crew.set_is_full_from_member_count(condition)
 
     def get_active_davy_back_fight(self) -> Any:
         """
@@ -489,9 +520,11 @@ class Crew(BaseModel):
             else self.get_members_order_by_davy_back_fight_priority()
         )
 
-        for i, member in enumerate(members):
-            member.crew_davy_back_fight_priority = i + 1
-            member.save()
-
+        if len(members) == 0:
+            return
 
-Crew.create_table()
+        # Single update for all members
+        conditions = [(member.id, i + 1) for i, member in enumerate(members)]
+        User.update(crew_davy_back_fight_priority=Case(User.id, conditions)).where(
+            User.id.in_([member.id for member in members])
+        ).execute()
@@ -47,6 +47,3 @@ class CrewAbility(BaseModel):
         :return: The value with sign
         """
         return self.get_ability_type().get_sign() + str(self.value)
-
-
-CrewAbility.create_table()
@@ -22,6 +22,3 @@ class CrewChestSpendingRecord(BaseModel):
 
     class Meta:
         db_table = "crew_chest_spending_record"
-
-
-CrewChestSpendingRecord.create_table()
@@ -62,6 +62,3 @@ class CrewJoinRequest(BaseModel):
                 hours=Env.CREW_JOIN_REQUEST_COOLDOWN_SAME_CREW_DURATION.get_int()
             ),
         )
-
-
-CrewJoinRequest.create_table()
@@ -20,6 +20,3 @@ class CrewMemberChestContribution(BaseModel):
 
     class Meta:
         db_table = "crew_member_chest_contribution"
-
-
-CrewMemberChestContribution.create_table()
@@ -26,7 +26,7 @@ class DailyReward(BaseModel):
     bonus_list: str | TextField = TextField()
     total_amount: int | BigIntegerField = BigIntegerField()
     streak_count: int | IntegerField = IntegerField()
-    limitation: str | DailyRewardLimitation = CharField(max_length=20)
+    limitation: str | DailyRewardLimitation = CharField(max_length=20, null=True)
     prize_type: DailyRewardPrizeType | CharField = CharField(max_length=20, null=True)
     prize_value: str | CharField = CharField(max_length=50, null=True)
     prize_source: DailyRewardPrizeSource | CharField = CharField(max_length=20, null=True)
@@ -238,6 +238,3 @@ class DailyReward(BaseModel):
         )
 
         return rewards_today == 1
-
-
-DailyReward.create_table()
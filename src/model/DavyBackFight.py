@@ -313,26 +313,27 @@ class DavyBackFight(BaseModel):
         )
 
     @staticmethod
-    def get_crew_with_enough_members() -> list[Crew]:
+    def get_crew_with_enough_members() -> list[int]:
         """
-        Get the crews with enough members for Davy Back Fight
-        :return: The crews with enough members for Davy Back Fight
+        Get the ids of the crews with enough members for Davy Back Fight
+        :return: The query of the crew ids with enough members for Davy Back Fight
         """
-        return [
-            c
-            for c in Crew.select()
-            if c.get_member_count() >= Env.DAVY_BACK_FIGHT_MIN_PARTICIPANTS.get_int()
-        ]
+        return (
+            User.select(User.crew)
+            .where(User.crew.is_null(False))
+            .group_by(User.crew)
+            .having(fn.COUNT(User.id) >= Env.DAVY_BACK_FIGHT_MIN_PARTICIPANTS.get_int())
+        )
 
     @staticmethod
-    def get_crews_in_active() -> list[Crew]:
+    def get_crew_ids_in_active() -> list[int]:
         """
-        Returns the crew in active Davy Back Fight
-        :return: The crew in active Davy Back Fight
+        Returns the ids of the crews in active Davy Back Fight
+        :return: The ids of the crews in active Davy Back Fight
         """
 
         active = DavyBackFight.get_active()
-        return [d.challenger_crew for d in active] + [d.opponent_crew for d in active]
+        return [d.challenger_crew_id for d in active] + [d.opponent_crew_id for d in active]
 
     @staticmethod
     def get_ended_with_penalty() -> list["DavyBackFight"]:
@@ -346,16 +347,13 @@ class DavyBackFight(BaseModel):
         )
 
     @staticmethod
-    def get_crews_in_penalty() -> list[Crew]:
+    def get_crew_ids_in_penalty() -> list[int]:
         """
-        Returns the crew in Davy Back Fight penalty
-        :return: The crew in Davy Back Fight penalty
+        Returns the ids of the crews in Davy Back Fight penalty
+        :return: The ids of the crews in Davy Back Fight penalty
         """
 
         ended_with_penalty = DavyBackFight.get_ended_with_penalty()
-        return [d.challenger_crew for d in ended_with_penalty] + [
-            d.opponent_crew for d in ended_with_penalty
+        return [d.challenger_crew_id for d in ended_with_penalty] + [
+            d.opponent_crew_id for d in ended_with_penalty
         ]
-
-
-DavyBackFight.create_table()
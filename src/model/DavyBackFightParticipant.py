@@ -123,6 +123,3 @@ class DavyBackFightParticipant(BaseModel):
         from src.service.bounty_service import get_belly_formatted
 
         return get_belly_formatted(self.get_win_amount())
-
-
-DavyBackFightParticipant.create_table()
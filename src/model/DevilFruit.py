@@ -43,6 +43,7 @@ class DevilFruit(BaseModel):
 
     class Meta:
         db_table = "devil_fruit"
+        indexes = ((("status", "release_date"), False),)
 
     def get_full_name(self) -> str:
         """
@@ -92,6 +93,3 @@ class DevilFruit(BaseModel):
         :return: The status
         """
         return DevilFruitStatus(self.status)
-
-
-DevilFruit.create_table()
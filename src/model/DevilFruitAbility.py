@@ -48,6 +48,3 @@ class DevilFruitAbility(BaseModel):
             )
             .get_or_none()
         )
-
-
-DevilFruitAbility.create_table()
@@ -177,6 +177,3 @@ class DevilFruitTrade(BaseModel):
                 )
             )
         )
-
-
-DevilFruitTrade.create_table()
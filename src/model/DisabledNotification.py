@@ -17,6 +17,4 @@ class DisabledNotification(BaseModel):
 
     class Meta:
         db_table = "disabled_notification"
-
-
-DisabledNotification.create_table()
+        indexes = ((("user", "type"), False),)
@@ -97,6 +97,3 @@ class DocQGame(BaseModel):
         """
 
         return int((str(self.correct_choices_index).split(c.STANDARD_SPLIT_CHAR))[0]) + 1
-
-
-DocQGame.create_table()
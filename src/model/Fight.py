@@ -166,6 +166,3 @@ class Fight(BaseModel):
         """
 
         return GameStatus(self.status)
-
-
-Fight.create_table()
@@ -44,6 +44,7 @@ class Game(BaseModel):
 
     class Meta:
         db_table = "game"
+        indexes = ((("status",), False),)
 
     def is_player(self, user: User) -> bool:
         """
@@ -240,6 +241,3 @@ class Game(BaseModel):
         """
 
         return [self.challenger, self.opponent]
-
-
-Game.create_table()
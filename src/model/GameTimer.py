@@ -0,0 +1,35 @@
+import datetime
+import json
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.Game import Game
+from src.model.enums.GameTimerType import GameTimerType
+
+
+class GameTimer(BaseModel):
+    """
+    GameTimer class
+    A pending delayed action of a game, restored at startup
+    """
+
+    id: int | PrimaryKeyField = PrimaryKeyField()
+    game: Game | ForeignKeyField = ForeignKeyField(
+        Game, backref="game_timers", on_delete="CASCADE", on_update="CASCADE"
+    )
+    type: GameTimerType | SmallIntegerField = SmallIntegerField()
+    execution_date: datetime.datetime | DateTimeField = DateTimeField()
+    data: str | CharField = CharField(max_length=999, null=True)
+
+    class Meta:
+        db_table = "game_timer"
+        indexes = ((("game", "type"), True),)
+
+    def get_data(self) -> dict:
+        """
+        Get the data of the timer
+        :return: The data
+        """
+
+        return json.loads(self.data) if self.data is not None else {}
@@ -51,6 +51,3 @@ class Group(BaseModel):
         """
 
         return [user.id for user in self.get_active_users()]
-
-
-Group.create_table()
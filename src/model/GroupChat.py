@@ -44,6 +44,3 @@ class GroupChat(BaseModel):
             title += " - " + self.tg_topic_name
 
         return title
-
-
-GroupChat.create_table()
@@ -21,6 +21,4 @@ class GroupChatAutoDelete(BaseModel):
 
     class Meta:
         db_table = "group_chat_auto_delete"
-
-
-GroupChatAutoDelete.create_table()
+        indexes = ((("delete_date",), False),)
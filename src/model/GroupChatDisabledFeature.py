@@ -17,6 +17,3 @@ class GroupChatDisabledFeature(BaseModel):
 
     class Meta:
         db_table = "group_chat_disabled_feature"
-
-
-GroupChatDisabledFeature.create_table()
@@ -17,6 +17,3 @@ class GroupChatEnabledFeaturePin(BaseModel):
 
     class Meta:
         db_table = "group_chat_enabled_feature_pin"
-
-
-GroupChatEnabledFeaturePin.create_table()
@@ -24,6 +24,3 @@ class GroupChatFeaturePinMessage(BaseModel):
 
     class Meta:
         db_table = "group_chat_feature_pin_message"
-
-
-GroupChatFeaturePinMessage.create_table()
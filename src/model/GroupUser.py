@@ -41,6 +41,3 @@ class GroupUser(BaseModel):
         GroupUser.update(is_admin=False).where(
             (GroupUser.user == user) & (GroupUser.group == group)
         ).execute()
-
-
-GroupUser.create_table()
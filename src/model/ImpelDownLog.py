@@ -74,6 +74,3 @@ class ImpelDownLog(BaseModel):
             return 0
 
         return minutes * Env.IMPEL_DOWN_BAIL_PER_MINUTE.get_int()
-
-
-ImpelDownLog.create_table()
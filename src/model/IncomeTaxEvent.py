@@ -63,6 +63,3 @@ class IncomeTaxEvent(BaseModel):
         :return: The event type description
         """
         return self.get_event_type().get_description()
-
-
-IncomeTaxEvent.create_table()
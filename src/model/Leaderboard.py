@@ -13,7 +13,7 @@ class Leaderboard(BaseModel):
     year: int | SmallIntegerField = SmallIntegerField()
     week: int | SmallIntegerField = SmallIntegerField()
     group: Group | ForeignKeyField = ForeignKeyField(Group, null=True, backref="leaderboards")
-    message_id: int | IntegerField = IntegerField()
+    message_id: int | IntegerField = IntegerField(null=True)
     is_bounty_reset: bool | BooleanField = BooleanField(default=False)
 
     # Backref
@@ -22,6 +22,7 @@ class Leaderboard(BaseModel):
 
     class Meta:
         db_table = "leaderboard"
+        indexes = ((("group", "year", "week"), False),)
 
     @staticmethod
     def get_latest_n(n: int = 1, group: Group = None) -> list["Leaderboard"]:
@@ -39,6 +40,3 @@ class Leaderboard(BaseModel):
             .limit(n)
             .execute()
         )
-
-
-Leaderboard.create_table()
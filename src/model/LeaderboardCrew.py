@@ -27,6 +27,3 @@ class LeaderboardCrew(BaseModel):
 
     class Meta:
         db_table = "leaderboard_crew"
-
-
-LeaderboardCrew.create_table()
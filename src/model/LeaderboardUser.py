@@ -78,6 +78,3 @@ class LeaderboardUser(BaseModel):
             .order_by(LeaderboardUser.bounty.desc())
             .first()
         )
-
-
-LeaderboardUser.create_table()
@@ -21,6 +21,3 @@ class LegendaryPirate(BaseModel):
 
     class Meta:
         db_table = "legendary_pirate"
-
-
-LegendaryPirate.create_table()
@@ -199,6 +199,3 @@ class Plunder(BaseModel):
         return BountyLoan.get(
             BountyLoan.source == BountyLoanSource.PLUNDER, BountyLoan.external_id == self.id
         )
-
-
-Plunder.create_table()
@@ -58,6 +58,3 @@ class Prediction(BaseModel):
     def get_status(self) -> PredictionStatus:
         """Get the prediction status"""
         return PredictionStatus(self.status)
-
-
-Prediction.create_table()
@@ -30,6 +30,3 @@ class PredictionGroupChatMessage(BaseModel):
 
     class Meta:
         db_table = "prediction_group_chat_message"
-
-
-PredictionGroupChatMessage.create_table()
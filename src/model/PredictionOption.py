@@ -19,6 +19,3 @@ class PredictionOption(BaseModel):
 
     class Meta:
         db_table = "prediction_option"
-
-
-PredictionOption.create_table()
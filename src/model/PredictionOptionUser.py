@@ -40,6 +40,4 @@ class PredictionOptionUser(BaseModel):
 
     class Meta:
         db_table = "prediction_option_user"
-
-
-PredictionOptionUser.create_table()
+        indexes = ((("prediction", "user"), False),)
@@ -17,6 +17,3 @@ class RedditGroupPost(BaseModel):
 
     class Meta:
         db_table = "reddit_group_post"
-
-
-RedditGroupPost.create_table()
@@ -0,0 +1,37 @@
+import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+
+
+class SchemaMigration(BaseModel):
+    """
+    SchemaMigration class
+    Keeps track of the applied schema migrations
+    """
+
+    id = PrimaryKeyField()
+    version = IntegerField(unique=True)
+    name = CharField()
+    date = DateTimeField(default=datetime.datetime.now)
+
+    class Meta:
+        db_table = "schema_migration"
+
+    @staticmethod
+    def get_applied_versions() -> list[int]:
+        """
+        Get the versions of the applied migrations
+        :return: The versions
+        """
+
+        if not SchemaMigration.table_exists():
+            return []
+
+        return [
+            migration.version
+            for migration in SchemaMigration.select(SchemaMigration.version).order_by(
+                SchemaMigration.version.asc()
+            )
+        ]
@@ -23,6 +23,3 @@ class SystemUpdate(BaseModel):
     @staticmethod
     def get_latest_update():
         return SystemUpdate.select().order_by(SystemUpdate.date.desc()).get_or_none()
-
-
-SystemUpdate.create_table()
@@ -20,6 +20,3 @@ class SystemUpdateUser(BaseModel):
 
     class Meta:
         db_table = "system_update_user"
-
-
-SystemUpdateUser.create_table()
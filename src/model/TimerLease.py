@@ -0,0 +1,20 @@
+import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+
+
+class TimerLease(BaseModel):
+    """
+    TimerLease class
+    The process that runs a timer, until the lease expires without being renewed
+    """
+
+    id: int | PrimaryKeyField = PrimaryKeyField()
+    name: str | CharField = CharField(max_length=99, unique=True)
+    owner: str | CharField = CharField(max_length=99)
+    expiration_date: datetime.datetime | DateTimeField = DateTimeField()
+
+    class Meta:
+        db_table = "timer_lease"
@@ -0,0 +1,24 @@
+import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+
+
+class TimerRun(BaseModel):
+    """
+    TimerRun class
+    A run of a timer, by the process that held its lease
+    """
+
+    id: int | PrimaryKeyField = PrimaryKeyField()
+    name: str | CharField = CharField(max_length=99)
+    owner: str | CharField = CharField(max_length=99)
+    start_date: datetime.datetime | DateTimeField = DateTimeField()
+    end_date: datetime.datetime | DateTimeField = DateTimeField(null=True)
+    duration_milliseconds: int | IntegerField = IntegerField(null=True)
+    is_successful: bool | BooleanField = BooleanField(null=True)
+
+    class Meta:
+        db_table = "timer_run"
+        indexes = ((("name", "start_date"), False),)
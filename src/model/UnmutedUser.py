@@ -25,6 +25,3 @@ class UnmutedUser(BaseModel):
 
     class Meta:
         db_table = "unmuted_user"
-
-
-UnmutedUser.create_table()
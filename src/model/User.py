@@ -8,6 +8,7 @@ from telegram.ext import ContextTypes
 
 import constants as c
 import resources.Environment as Env
+import src.service.text_render_service as text_render_service
 from resources import phrases
 from src.model.BaseModel import BaseModel
 from src.model.Crew import Crew
@@ -73,8 +74,8 @@ class User(BaseModel):
         default=datetime.datetime.now
     )
     last_system_interaction_date: datetime.datetime | DateTimeField = DateTimeField(null=True)
-    private_screen_list: str | CharField | None = CharField(max_length=99)
-    private_screen_step: int | SmallIntegerField | None = SmallIntegerField()
+    private_screen_list: str | CharField | None = CharField(max_length=99, null=True)
+    private_screen_step: int | SmallIntegerField | None = SmallIntegerField(null=True)
     private_screen_in_edit_id: int | IntegerField | None = IntegerField(null=True)
     bounty_gift_tax: int | IntegerField = IntegerField(default=0)
     is_admin: bool | BooleanField = BooleanField(default=False)
@@ -118,6 +119,10 @@ class User(BaseModel):
 
     class Meta:
         db_table = "user"
+        indexes = (
+            (("last_message_date",), False),
+            (("crew_role",), False),
+        )
 
     def get_bounty_formatted(self) -> str:
         """
@@ -343,9 +348,7 @@ class User(BaseModel):
         :return: The markdown mention of the user
         """
 
-        from src.service.message_service import mention_markdown_v2
-
-        return mention_markdown_v2(self.tg_user_id, self.tg_first_name)
+        return text_render_service.mention_markdown_v2(self.tg_user_id, self.tg_first_name)
 
     def get_you_markdown_mention(self):
         """
@@ -353,9 +356,7 @@ class User(BaseModel):
         :return: The markdown mention of the user
         """
 
-        from src.service.message_service import mention_markdown_v2
-
-        return mention_markdown_v2(self.tg_user_id, phrases.TEXT_YOU)
+        return text_render_service.mention_markdown_v2(self.tg_user_id, phrases.TEXT_YOU)
 
     def get_markdown_name(self):
         """
@@ -363,9 +364,7 @@ class User(BaseModel):
         :return: The markdown name of the user
         """
 
-        from src.service.message_service import escape_valid_markdown_chars
-
-        return escape_valid_markdown_chars(self.tg_first_name)
+        return text_render_service.escape_valid_markdown_chars(self.tg_first_name)
 
     def get_max_bounty(self) -> int:
         """
@@ -749,8 +748,9 @@ class User(BaseModel):
         Returns True if the user is a Legendary Pirate
         :return: True if the user is a Legendary Pirate
         """
+        from src.model.LegendaryPirate import LegendaryPirate
 
-        return self.legendary_pirates.count() > 0
+        return LegendaryPirate.select().where(LegendaryPirate.user == self).count() > 0
 
     def is_warlord(self) -> bool:
         """
@@ -786,6 +786,3 @@ class User(BaseModel):
         """
 
         User.update(can_collect_daily_reward=True).execute()
-
-
-User.create_table()
@@ -53,7 +53,7 @@ class Warlord(BaseModel):
         :return: Active warlords
         """
 
-        return [warlord.user.id for warlord in Warlord.get_active()]
+        return [warlord.user_id for warlord in Warlord.get_active()]
 
     @staticmethod
     def get_latest_active_by_user(user: User) -> "Warlord":
@@ -70,5 +70,18 @@ class Warlord(BaseModel):
             .first()
         )
 
+    @staticmethod
+    def get_latest_active_by_user_ids(user_ids: list[int]) -> dict[int, "Warlord"]:
+        """
+        Get the latest active warlord of each user
+        :param user_ids: The user ids
+        :return: The warlords by user id
+        """
+        warlords: list[Warlord] = (
+            Warlord.select()
+            .where((Warlord.user.in_(user_ids)) & (Warlord.end_date > datetime.datetime.now()))
+            .order_by(Warlord.end_date.asc())
+        )
 
-Warlord.create_table()
+        # Ordered by end date, so the latest one of each user is kept
+        return {warlord.user_id: warlord for warlord in warlords}
@@ -1,18 +1,34 @@
 from enum import StrEnum
 
+import resources.Environment as Env
+
 
 class ContextDataKey(StrEnum):
     SAVED_MEDIA = "saved_media"
     BOUNTY_LOAN_REPAY_AMOUNT = "loan_repay_amount"
     CREATED_PREDICTION = "created_prediction"
     INLINE_QUERY = "inline_query"
-    PAST_MESSAGES_DATE = "past_messages_date"
     FILTER = "filter"
     INBOUND_KEYBOARD = "inbound_keyboard"
     KEYBOARD_DATA = "keyboard_data"
     AMOUNT = "amount"
     LAST_REQUEST = "last_request"
 
+    def get_ttl_seconds(self) -> int | None:
+        """
+        Get after how many seconds since the last update the data should be removed
+        :return: The seconds, None if the data should never be removed
+        """
+
+        match self:
+            case ContextDataKey.SAVED_MEDIA:
+                # Bounded by the number of saved media
+                return None
+            case ContextDataKey.KEYBOARD_DATA:
+                return Env.CONTEXT_DATA_KEYBOARD_DATA_TTL_SECONDS.get_int()
+            case _:
+                return Env.CONTEXT_DATA_TTL_SECONDS.get_int()
+
 
 class ContextDataType(StrEnum):
     BOT = "bot"
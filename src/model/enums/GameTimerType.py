@@ -0,0 +1,11 @@
+from enum import IntEnum
+
+
+class GameTimerType(IntEnum):
+    """
+    Enum class for the type of game timer.
+    """
+
+    TURN_NOTIFICATION = 1
+    CONFIRMATION_TIMEOUT = 2
+    COUNTDOWN_TO_START = 3
@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
 from enum import StrEnum
 
+from peewee import Select
+
 import constants as c
+import src.service.search_index_service as search_index_service
 from resources import phrases
 from src.model.BaseModel import BaseModel
 from src.model.User import User
 from src.model.enums.Emoji import Emoji
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
+from src.model.enums.SearchIndexType import SearchIndexType
 from src.model.error.CustomException import UnauthorizedToViewItemException
 
 
@@ -98,6 +102,9 @@ class ListPage(ABC):
         # Adding list of all items grouped by legend emoji, as to find out the emoji for each item
         self.legend_filter_results: dict[EmojiLegend, list[BaseModel]] = {}
 
+        # Last search index result, with the filters and page it was searched for
+        self.search_result: tuple[tuple, int | None, int, list[int], int] | None = None
+
     def init_legend_filter_results(self):
         """
         Init the legend filter results
@@ -162,7 +169,7 @@ class ListPage(ABC):
 
         active_filters = self.filter_list_active.copy()
         self.filter_list_active = []
-        count = len(self.get_all_items())
+        count = self.get_total_items_count()
         self.filter_list_active = active_filters
 
         return count
@@ -280,16 +287,70 @@ class ListPage(ABC):
             if filter_item.filter_type is ListFilterType.STRING:
                 return self.get_filter_key(index)
 
-    def get_active_filter_list_condition(self) -> any:
+    def get_active_filter_list_condition(self, include_string_filter: bool = True) -> any:
         """
         Get the active filter list condition
+
+        :param include_string_filter: Whether to include the string filter, False for lists
+            that search the string with a search index
         """
         condition = True
         for list_filter in self.filter_list_active:
+            if not include_string_filter and list_filter.filter_type is ListFilterType.STRING:
+                continue
+
             condition &= list_filter.condition
 
         return condition
 
+    def get_active_string_filter_value(self) -> str | None:
+        """
+        Get the value of the active string filter
+
+        :return: The value, None if no string filter is active
+        """
+
+        for list_filter in self.filter_list_active:
+            if list_filter.filter_type is ListFilterType.STRING:
+                return list_filter.value
+
+        return None
+
+    def search(
+        self, index_type: SearchIndexType, query: Select, page: int | None, limit: int
+    ) -> tuple[list[int], int]:
+        """
+        Search the active string filter with the search index. The result is kept for the active
+        filters and page, so that the items of a page and the total count are searched once
+
+        :param index_type: The index type
+        :param query: Query that selects the ids of the rows allowed in the results
+        :param page: The page, None if only the total count is needed
+        :param limit: The page size
+        :return: The ids of the page and the total number of results
+        """
+
+        filters_key = tuple(
+            (f.filter_type, f.description, f.value) for f in self.filter_list_active
+        )
+        if self.search_result is not None:
+            result_filters_key, result_page, result_limit, ids, total_count = self.search_result
+            if result_filters_key == filters_key and (
+                page is None or (result_page, result_limit) == (page, limit)
+            ):
+                return ids, total_count
+
+        ids, total_count = search_index_service.search(
+            index_type,
+            self.get_active_string_filter_value(),
+            page if page is not None else 1,
+            limit if page is not None else 0,
+            query,
+        )
+        self.search_result = (filters_key, page, limit, ids, total_count)
+
+        return ids, total_count
+
     def get_filter_list(self) -> list[ListFilter]:
         """
         Get the filter list
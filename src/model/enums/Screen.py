@@ -150,6 +150,6 @@ DEPRECATED = [
     Screen.GRP_DEVIL_FRUIT_COLLECT,
 ]
 
-ALLOW_SEARCH_INPUT = [Screen.PVT_CREW_SEARCH]
+ALLOW_SEARCH_INPUT = [Screen.PVT_CREW_SEARCH, Screen.PVT_DEVIL_FRUIT_SHOP]
 
-HAS_CONTEXT_FILTER = [Screen.PVT_CREW_SEARCH]
+HAS_CONTEXT_FILTER = [Screen.PVT_CREW_SEARCH, Screen.PVT_DEVIL_FRUIT_SHOP]
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class SearchIndexType(StrEnum):
+    """
+    Enum class for the in memory search indexes of the lists with a string filter
+    """
+
+    # Crews visible in search, by name and description
+    CREW = "crew"
+    # Devil Fruits on sale in the shop, by fruit name and category
+    DEVIL_FRUIT_SHOP = "devil_fruit_shop"
@@ -0,0 +1,79 @@
+from enum import StrEnum
+
+import resources.Environment as Env
+
+
+class TaskSheddingPolicy(StrEnum):
+    """
+    Enum class for what a task pool does with a new task when its queue is full
+    """
+
+    # Drop the oldest queued task, for tasks that become useless when stale
+    DROP_OLDEST = "drop_oldest"
+    # Drop the new task
+    REJECT_NEW = "reject_new"
+
+
+class TaskPoolType(StrEnum):
+    """
+    Enum class for the pools in which background tasks run
+    """
+
+    # Management of the received updates
+    UPDATES = "updates"
+    # Notifications and other private messages that can be lost under load
+    NOTIFICATIONS = "notifications"
+    # Messages sent to many chats
+    BROADCASTS = "broadcasts"
+    # Work started by the timers
+    TIMERS = "timers"
+    # Follow-up work that must not be lost, like the messages of a game or bounty updates
+    BACKGROUND = "background"
+
+    def get_max_concurrency(self) -> int:
+        """
+        Get how many tasks of the pool can run at the same time
+        :return: The maximum concurrency
+        """
+
+        match self:
+            case TaskPoolType.UPDATES:
+                return Env.TASK_POOL_UPDATES_MAX_CONCURRENCY.get_int()
+            case TaskPoolType.NOTIFICATIONS:
+                return Env.TASK_POOL_NOTIFICATIONS_MAX_CONCURRENCY.get_int()
+            case TaskPoolType.BROADCASTS:
+                return Env.TASK_POOL_BROADCASTS_MAX_CONCURRENCY.get_int()
+            case TaskPoolType.TIMERS:
+                return Env.TASK_POOL_TIMERS_MAX_CONCURRENCY.get_int()
+            case TaskPoolType.BACKGROUND:
+                return Env.TASK_POOL_BACKGROUND_MAX_CONCURRENCY.get_int()
+
+    def get_max_queue_size(self) -> int:
+        """
+        Get how many tasks of the pool can wait to run
+        :return: The maximum queue size, 0 if unbounded
+        """
+
+        match self:
+            case TaskPoolType.UPDATES:
+                return Env.TASK_POOL_UPDATES_MAX_QUEUE_SIZE.get_int()
+            case TaskPoolType.NOTIFICATIONS:
+                return Env.TASK_POOL_NOTIFICATIONS_MAX_QUEUE_SIZE.get_int()
+            case TaskPoolType.BROADCASTS:
+                return Env.TASK_POOL_BROADCASTS_MAX_QUEUE_SIZE.get_int()
+            case _:
+                # Never shed
+                return 0
+
+    def get_shedding_policy(self) -> TaskSheddingPolicy:
+        """
+        Get what the pool does with a new task when its queue is full
+        :return: The shedding policy
+        """
+
+        match self:
+            case TaskPoolType.UPDATES:
+                # Users repeat what went unanswered, the most recent updates are kept
+                return TaskSheddingPolicy.DROP_OLDEST
+            case _:
+                return TaskSheddingPolicy.REJECT_NEW
@@ -186,3 +186,27 @@ DAILY_REWARD = Timer(
     Env.SHOULD_RUN_ON_STARTUP_DAILY_REWARD.get_bool(),
 )
 TIMERS.append(DAILY_REWARD)
+
+# Context data cleanup
+CONTEXT_DATA_CLEANUP = Timer(
+    "context_data_cleanup",
+    Env.CRON_CONTEXT_DATA_CLEANUP.get(),
+    Env.ENABLE_TIMER_CONTEXT_DATA_CLEANUP.get_bool(),
+    Env.SHOULD_LOG_TIMER_CONTEXT_DATA_CLEANUP.get_bool(),
+    Env.SHOULD_RUN_ON_STARTUP_CONTEXT_DATA_CLEANUP.get_bool(),
+)
+TIMERS.append(CONTEXT_DATA_CLEANUP)
+
+# Reconcile crew member count
+RECONCILE_CREW_MEMBER_COUNT = Timer(
+    "reconcile_crew_member_count",
+    Env.CRON_RECONCILE_CREW_MEMBER_COUNT.get(),
+    Env.ENABLE_TIMER_RECONCILE_CREW_MEMBER_COUNT.get_bool(),
+    Env.SHOULD_LOG_TIMER_RECONCILE_CREW_MEMBER_COUNT.get_bool(),
+    Env.SHOULD_RUN_ON_STARTUP_RECONCILE_CREW_MEMBER_COUNT.get_bool(),
+)
+TIMERS.append(RECONCILE_CREW_MEMBER_COUNT)
+
+# Timers on the state of the process, they run in every process instead of only in the one
+# holding their lease
+WORKER_TIMERS: list[Timer] = [TEMP_DIR_CLEANUP, CONTEXT_DATA_CLEANUP]
@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class TraceKind(StrEnum):
+    """
+    Enum class for the kind of traced operation.
+    """
+
+    UPDATE = "update"
+    SCREEN = "screen"
+    TIMER = "timer"
@@ -99,3 +99,9 @@ class AnonymousAdminException(Exception):
     def __init__(self, message=None):
         self.message = message
         super().__init__(message)
+
+
+class DownloadException(Exception):
+    def __init__(self, message=None):
+        self.message = message
+        super().__init__(message)
@@ -0,0 +1,44 @@
+from src.model.User import User
+from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
+
+
+class BountyDelta:
+    """
+    A change of the bounty of a user, applied as an increment of the current values
+    """
+
+    def __init__(
+        self,
+        user: User,
+        bounty: int = 0,
+        pending_bounty: int = 0,
+        total_gained_bounty: int = 0,
+        tax_amount: int = 0,
+        event_type: IncomeTaxEventType = None,
+        event_id: int = None,
+    ):
+        """
+        Initialize the delta
+        :param user: The user
+        :param bounty: How much to add to the bounty, negative to remove
+        :param pending_bounty: How much to add to the pending bounty, negative to remove
+        :param total_gained_bounty: How much to add to the total gained bounty
+        :param tax_amount: How much was paid in taxes, for auditing
+        :param event_type: The event that caused the change
+        :param event_id: The id of the event
+        """
+        self.user: User = user
+        self.bounty: int = int(bounty)
+        self.pending_bounty: int = int(pending_bounty)
+        self.total_gained_bounty: int = int(total_gained_bounty)
+        self.tax_amount: int = int(tax_amount)
+        self.event_type: IncomeTaxEventType | None = event_type
+        self.event_id: int | None = event_id
+
+    def is_empty(self) -> bool:
+        """
+        If the delta doesn't change anything
+        :return: True if empty
+        """
+
+        return self.bounty == 0 and self.pending_bounty == 0 and self.total_gained_bounty == 0
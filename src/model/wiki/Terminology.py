@@ -1,4 +1,4 @@
-from src.service.message_service import escape_valid_markdown_chars
+from src.service.text_render_service import escape_valid_markdown_chars
 
 
 class Terminology:
@@ -0,0 +1,205 @@
+import logging
+import os
+import time
+
+import constants as c
+import resources.Environment as Env
+
+
+class Artifact:
+    """
+    A generated or downloaded file in the temp folder
+    """
+
+    def __init__(self, path: str, ttl_seconds: int | None):
+        """
+        Initialize the artifact
+        :param path: The path of the file
+        :param ttl_seconds: After how many idle seconds the file is deleted. If None, the file is
+        kept while it has owners
+        """
+        self.path: str = path
+        self.ttl_seconds: int | None = ttl_seconds
+        self.owners: set[str] = set()
+        self.last_access: float = time.time()
+        try:
+            self.size: int = os.path.getsize(path)
+        except OSError:
+            self.size: int = 0
+
+    def is_pinned(self) -> bool:
+        """
+        If the artifact can't be deleted, because it's owned without a TTL
+        :return: True if pinned
+        """
+
+        return len(self.owners) > 0 and self.ttl_seconds is None
+
+    def is_expired(self, now: float) -> bool:
+        """
+        If the artifact has been idle for longer than its TTL
+        :param now: The current time
+        :return: True if expired
+        """
+
+        if self.is_pinned():
+            return False
+
+        ttl_seconds = (
+            self.ttl_seconds
+            if self.ttl_seconds is not None
+            else Env.TEMP_DIR_CLEANUP_TIME_SECONDS.get_int()
+        )
+        return now - self.last_access > ttl_seconds
+
+
+# Artifacts by path
+_artifacts: dict[str, Artifact] = {}
+# Artifact paths by owner
+_owned_paths: dict[str, set[str]] = {}
+
+
+def get_game_owner(game_id: int) -> str:
+    """
+    Get the owner key of the artifacts of a game
+    :param game_id: The game id
+    :return: The owner key
+    """
+
+    return f"game:{game_id}"
+
+
+def get_bounty_poster_owner(user_id: int) -> str:
+    """
+    Get the owner key of the bounty poster artifacts of a user
+    :param user_id: The user id
+    :return: The owner key
+    """
+
+    return f"bounty_poster:{user_id}"
+
+
+def register(path: str | os.PathLike, owner: str = None, ttl_seconds: int = None) -> str:
+    """
+    Register a file of the temp folder, or add an owner to an already registered one. Files owned
+    without a TTL are kept until all their owners release them
+    :param path: The path of the file
+    :param owner: The owner key
+    :param ttl_seconds: After how many idle seconds the file is deleted. Default for files without
+    an owner: TEMP_DIR_CLEANUP_TIME_SECONDS
+    :return: The path
+    """
+
+    path = str(path)
+    artifact = _artifacts.get(path)
+    if artifact is None:
+        artifact = Artifact(path, ttl_seconds)
+        _artifacts[path] = artifact
+    else:
+        artifact.last_access = time.time()
+        if owner is not None and len(artifact.owners) == 0:
+            artifact.ttl_seconds = ttl_seconds
+
+    if owner is not None:
+        artifact.owners.add(owner)
+        _owned_paths.setdefault(owner, set()).add(path)
+
+    return path
+
+
+def touch(path: str) -> None:
+    """
+    Mark a file as used, delaying its idle expiry and eviction
+    :param path: The path of the file
+    :return: None
+    """
+
+    artifact = _artifacts.get(path)
+    if artifact is not None:
+        artifact.last_access = time.time()
+
+
+def release(owner: str) -> None:
+    """
+    Release the files of an owner. Files with no more owners are deleted by the next cleanup
+    after a grace time, so that they can still be sent in the meantime
+    :param owner: The owner key
+    :return: None
+    """
+
+    for path in _owned_paths.pop(owner, set()):
+        artifact = _artifacts.get(path)
+        if artifact is None:
+            continue
+
+        artifact.owners.discard(owner)
+        if len(artifact.owners) == 0:
+            artifact.ttl_seconds = Env.ARTIFACT_RELEASE_GRACE_SECONDS.get_int()
+            artifact.last_access = time.time()
+
+
+def delete(artifact: Artifact) -> None:
+    """
+    Delete the file of an artifact and forget it
+    :param artifact: The artifact
+    :return: None
+    """
+
+    _artifacts.pop(artifact.path, None)
+    for owner in artifact.owners:
+        owned_paths = _owned_paths.get(owner)
+        if owned_paths is not None:
+            owned_paths.discard(artifact.path)
+
+    try:
+        os.unlink(artifact.path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.error(f"Error while deleting temp file {artifact.path}: {e}")
+
+
+def cleanup() -> int:
+    """
+    Delete the expired files of the temp folder, then the least recently used ones if the folder
+    is over its size budget. Files never deleted: the ones owned by active games
+    :return: How many files were deleted
+    """
+
+    if not os.path.exists(c.TEMP_DIR):
+        return 0
+
+    now = time.time()
+    deleted_count = 0
+
+    # Files created before the start or outside the store, by modification time
+    for entry in os.scandir(c.TEMP_DIR):
+        if entry.path in _artifacts or not entry.is_file():
+            continue
+
+        artifact = Artifact(entry.path, None)
+        artifact.last_access = entry.stat().st_mtime
+        _artifacts[entry.path] = artifact
+
+    for artifact in list(_artifacts.values()):
+        if artifact.is_expired(now) or not os.path.exists(artifact.path):
+            delete(artifact)
+            deleted_count += 1
+
+    # Over budget, evict the least recently used
+    max_bytes = Env.ARTIFACT_STORE_MAX_BYTES.get_int()
+    total_bytes = sum(artifact.size for artifact in _artifacts.values())
+    if total_bytes > max_bytes:
+        evictable = sorted(
+            (artifact for artifact in _artifacts.values() if not artifact.is_pinned()),
+            key=lambda artifact: artifact.last_access,
+        )
+        for artifact in evictable:
+            if total_bytes <= max_bytes:
+                break
+
+            delete(artifact)
+            total_bytes -= artifact.size
+            deleted_count += 1
+
+    return deleted_count
@@ -0,0 +1,205 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime
+
+from telegram.error import TelegramError
+from telegram.ext import Application
+
+import resources.Environment as Env
+import src.service.task_service as task_service
+from src.model.Group import Group
+from src.model.GroupChat import GroupChat
+from src.model.GroupChatAutoDelete import GroupChatAutoDelete
+from src.model.enums.TaskPoolType import TaskPoolType
+from src.service.group_service import save_group_chat_error
+
+# Maximum number of messages that can be deleted with a single deleteMessages call
+MAX_MESSAGES_PER_DELETE_REQUEST = 100
+
+# Pending deletions as (delete date, auto delete id, group chat id, message id), earliest first
+_pending: list[tuple[datetime, int, int, int]] = []
+_wakeup: asyncio.Event | None = None
+_scheduler_task: asyncio.Task | None = None
+
+
+def load_pending() -> int:
+    """
+    Load all the pending deletions from the database
+    :return: How many deletions are pending
+    """
+
+    global _pending
+
+    _pending = list(
+        GroupChatAutoDelete.select(
+            GroupChatAutoDelete.delete_date,
+            GroupChatAutoDelete.id,
+            GroupChatAutoDelete.group_chat,
+            GroupChatAutoDelete.message_id,
+        ).tuples()
+    )
+    heapq.heapify(_pending)
+
+    return len(_pending)
+
+
+def enqueue(auto_delete: GroupChatAutoDelete) -> None:
+    """
+    Add a saved deletion to the schedule. Ignored if the scheduler is not running, the deletion
+    is then loaded from the database when it starts
+    :param auto_delete: The auto delete item
+    :return: None
+    """
+
+    if _scheduler_task is None:
+        return
+
+    item = (
+        auto_delete.delete_date,
+        auto_delete.id,
+        auto_delete.group_chat_id,
+        auto_delete.message_id,
+    )
+    heapq.heappush(_pending, item)
+
+    # New earliest deletion, the scheduler has to wake up sooner
+    if _pending[0] is item:
+        _wakeup.set()
+
+
+def pop_due(now: datetime) -> list[tuple[datetime, int, int, int]]:
+    """
+    Remove the deletions that are due from the schedule
+    :param now: The current date
+    :return: The due deletions
+    """
+
+    due = []
+    while len(_pending) > 0 and _pending[0][0] <= now:
+        due.append(heapq.heappop(_pending))
+
+    return due
+
+
+async def run_scheduler(application: Application) -> None:
+    """
+    Delete the messages at their due date, until cancelled
+    :param application: The application
+    :return: None
+    """
+
+    semaphore = asyncio.Semaphore(Env.AUTO_DELETE_MAX_CONCURRENT_REQUESTS.get_int())
+
+    while True:
+        _wakeup.clear()
+        timeout = None
+        if len(_pending) > 0:
+            timeout = max(0.0, (_pending[0][0] - datetime.now()).total_seconds())
+
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout)
+            continue
+        except asyncio.TimeoutError:
+            pass
+
+        try:
+            due = pop_due(datetime.now())
+            # Group chat, message ids and auto delete ids by group chat id
+            batches: dict[int, tuple[GroupChat | None, list[int], list[int]]] = {}
+            group_chats: dict[int, GroupChat] = {
+                group_chat.id: group_chat
+                for group_chat in GroupChat.select(GroupChat, Group)
+                .join(Group)
+                .where(GroupChat.id.in_({group_chat_id for _, _, group_chat_id, _ in due}))
+            }
+            for _, auto_delete_id, group_chat_id, message_id in due:
+                _, message_ids, auto_delete_ids = batches.setdefault(
+                    group_chat_id, (group_chats.get(group_chat_id), [], [])
+                )
+                message_ids.append(message_id)
+                auto_delete_ids.append(auto_delete_id)
+
+            for group_chat, message_ids, auto_delete_ids in batches.values():
+                for start in range(0, len(message_ids), MAX_MESSAGES_PER_DELETE_REQUEST):
+                    end = start + MAX_MESSAGES_PER_DELETE_REQUEST
+                    task_service.submit(
+                        TaskPoolType.BACKGROUND,
+                        delete_messages(
+                            application,
+                            semaphore,
+                            group_chat,
+                            message_ids[start:end],
+                            auto_delete_ids[start:end],
+                        ),
+                    )
+        except Exception as e:
+            logging.error(f"Error while running auto delete: {e}", exc_info=True)
+
+
+async def delete_messages(
+    application: Application,
+    semaphore: asyncio.Semaphore,
+    group_chat: GroupChat | None,
+    message_ids: list[int],
+    auto_delete_ids: list[int],
+) -> None:
+    """
+    Delete messages of a group chat with a single request and remove their auto delete items
+    :param application: The application
+    :param semaphore: The semaphore that limits the concurrent requests
+    :param group_chat: The group chat, None if it was deleted in the meantime
+    :param message_ids: The message ids
+    :param auto_delete_ids: The auto delete item ids
+    :return: None
+    """
+
+    if group_chat is not None:
+        async with semaphore:
+            try:
+                await application.bot.delete_messages(group_chat.group.tg_group_id, message_ids)
+            except TelegramError as te:
+                logging.error(
+                    f"Failed to delete {len(message_ids)} messages in chat"
+                    f" {group_chat.group.tg_group_id}: {te}"
+                )
+                save_group_chat_error(group_chat, str(te))
+
+    GroupChatAutoDelete.delete().where(GroupChatAutoDelete.id.in_(auto_delete_ids)).execute()
+
+
+def start(application: Application, should_load_pending: bool = True) -> None:
+    """
+    Load the pending deletions and start the scheduler
+    :param application: The application
+    :param should_load_pending: If the pending deletions should be loaded from the database
+    :return: None
+    """
+
+    global _wakeup, _scheduler_task
+
+    if _scheduler_task is not None:
+        return
+
+    if should_load_pending:
+        pending_count = load_pending()
+        logging.info(f"Loaded {pending_count} pending auto deletes")
+
+    _wakeup = asyncio.Event()
+    # Not created with the application, which waits for its tasks when stopping
+    _scheduler_task = asyncio.create_task(run_scheduler(application))
+
+
+def stop() -> None:
+    """
+    Stop the scheduler
+    :return: None
+    """
+
+    global _scheduler_task
+
+    if _scheduler_task is None:
+        return
+
+    _scheduler_task.cancel()
+    _scheduler_task = None
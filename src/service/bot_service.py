@@ -1,7 +1,8 @@
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime
 
-from telegram.ext import CallbackContext, ContextTypes
+from telegram.ext import CallbackContext, ContextTypes, Application
 
 from resources import phrases
 from src.model.enums.ContextDataKey import ContextDataKey, ContextDataType
@@ -26,13 +27,19 @@ def get_context_data(
     :return: The data
     """
 
-    data = context.bot_data if data_type is ContextDataType.BOT else context.user_data
-
     try:
+        entry = _store.get_entry(context, data_type, key)
+        if entry is None:
+            raise KeyError(key)
+
         if inner_key is not None:
-            return data[key]["value"][inner_key]["value"]
-        else:
-            return data[key]["value"]
+            entry = entry["value"][inner_key]
+
+        if is_expired(entry, key):
+            remove_context_data(context, data_type, key, inner_key)
+            raise KeyError(key)
+
+        return entry["value"]
     except KeyError as e:
         if tolerate_key_exception:
             logging.debug(
@@ -60,17 +67,16 @@ def set_context_data(
     :return: None
     """
 
-    data = context.bot_data if data_type is ContextDataType.BOT else context.user_data
-
-    if key not in data:
-        data[key] = {"value": {}}
-
     if inner_key is not None:
-        data[key]["value"][inner_key] = {"value": value}
-        data[key]["value"][inner_key]["last_updated"] = datetime.now()
+        entry = _store.get_entry(context, data_type, key)
+        if entry is None:
+            entry = {"value": {}}
+
+        entry["value"][inner_key] = {"value": value, "last_updated": datetime.now()}
     else:
-        data[key]["value"] = value
-        data[key]["last_updated"] = datetime.now()
+        entry = {"value": value, "last_updated": datetime.now()}
+
+    _store.set_entry(context, data_type, key, entry)
 
 
 def remove_context_data(
@@ -88,15 +94,30 @@ def remove_context_data(
     :return: None
     """
 
-    data = context.bot_data if data_type is ContextDataType.BOT else context.user_data
+    if inner_key is None:
+        _store.remove_entry(context, data_type, key)
+        return
 
-    if key not in data:
+    entry = _store.get_entry(context, data_type, key)
+    if entry is None:
         return
 
-    if inner_key is not None:
-        data[key]["value"].pop(inner_key)
-    else:
-        data.pop(key)
+    entry["value"].pop(inner_key)
+    _store.set_entry(context, data_type, key, entry)
+
+
+def has_context_data(
+    context: ContextTypes.DEFAULT_TYPE, data_type: ContextDataType, key: ContextDataKey
+) -> bool:
+    """
+    Check if the bot context data is set, even if expired
+    :param context: The context
+    :param data_type: The type
+    :param key: The key
+    :return: True if set
+    """
+
+    return _store.get_entry(context, data_type, key) is not None
 
 
 def remove_user_context_data(
@@ -179,3 +200,197 @@ def set_user_context_data(
     """
 
     set_context_data(context, ContextDataType.USER, key, value, inner_key)
+
+
+def is_expired(entry: dict, key: ContextDataKey, now: datetime = None) -> bool:
+    """
+    Check if a context data entry is expired
+    :param entry: The entry, with the value and last update date
+    :param key: The key
+    :param now: The current date, to be reused when checking multiple entries
+    :return: True if the entry is expired
+    """
+
+    ttl_seconds = key.get_ttl_seconds()
+    if ttl_seconds is None or "last_updated" not in entry:
+        return False
+
+    now = now if now is not None else datetime.now()
+    return (now - entry["last_updated"]).total_seconds() > ttl_seconds
+
+
+def remove_expired_entries(data: dict, now: datetime) -> int:
+    """
+    Remove the expired entries from a bot or user data dictionary
+    :param data: The data
+    :param now: The current date
+    :return: How many entries were removed
+    """
+
+    removed_count = 0
+    for key in list(data.keys()):
+        try:
+            key = ContextDataKey(key)
+        except ValueError:  # Key no longer in use
+            data.pop(key)
+            removed_count += 1
+            continue
+
+        # Entry set without inner key
+        if "last_updated" in data[key]:
+            if is_expired(data[key], key, now):
+                data.pop(key)
+                removed_count += 1
+            continue
+
+        inner_data: dict = data[key]["value"]
+        expired_inner_keys = [k for k, v in inner_data.items() if is_expired(v, key, now)]
+        for inner_key in expired_inner_keys:
+            inner_data.pop(inner_key)
+        removed_count += len(expired_inner_keys)
+
+        if len(inner_data) == 0:
+            data.pop(key)
+
+    return removed_count
+
+
+def remove_expired_context_data(application: Application) -> int:
+    """
+    Remove the expired bot and user context data
+    :param application: The application
+    :return: How many entries were removed
+    """
+
+    return _store.remove_expired_entries(application, datetime.now())
+
+
+class ContextDataStore(ABC):
+    """
+    Storage of the bot and user context data entries. An entry is a dict with the value and
+    the last update date, or with a dict of such entries by inner key as value.
+    Implementations must return copies or the stored dicts themselves, changes are always saved
+    back with set_entry
+    """
+
+    @abstractmethod
+    def get_entry(
+        self, context: ContextTypes.DEFAULT_TYPE, data_type: ContextDataType, key: ContextDataKey
+    ) -> dict | None:
+        """
+        Get an entry
+        :param context: The context
+        :param data_type: The type
+        :param key: The key
+        :return: The entry, None if not set
+        """
+        pass
+
+    @abstractmethod
+    def set_entry(
+        self,
+        context: ContextTypes.DEFAULT_TYPE,
+        data_type: ContextDataType,
+        key: ContextDataKey,
+        entry: dict,
+    ) -> None:
+        """
+        Set an entry
+        :param context: The context
+        :param data_type: The type
+        :param key: The key
+        :param entry: The entry
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def remove_entry(
+        self, context: ContextTypes.DEFAULT_TYPE, data_type: ContextDataType, key: ContextDataKey
+    ) -> None:
+        """
+        Remove an entry, ignored if not set
+        :param context: The context
+        :param data_type: The type
+        :param key: The key
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def remove_expired_entries(self, application: Application, now: datetime) -> int:
+        """
+        Remove the expired entries
+        :param application: The application
+        :param now: The current date
+        :return: How many entries were removed
+        """
+        pass
+
+
+class LocalContextDataStore(ContextDataStore):
+    """
+    Context data kept in the bot_data and user_data of the application, and so in its
+    persistence if enabled. Only visible to the process that set it
+    """
+
+    @staticmethod
+    def get_data(context: ContextTypes.DEFAULT_TYPE, data_type: ContextDataType) -> dict:
+        """
+        Get the bot or user data of the context
+        :param context: The context
+        :param data_type: The type
+        :return: The data
+        """
+
+        return context.bot_data if data_type is ContextDataType.BOT else context.user_data
+
+    def get_entry(
+        self, context: ContextTypes.DEFAULT_TYPE, data_type: ContextDataType, key: ContextDataKey
+    ) -> dict | None:
+        return self.get_data(context, data_type).get(key)
+
+    def set_entry(
+        self,
+        context: ContextTypes.DEFAULT_TYPE,
+        data_type: ContextDataType,
+        key: ContextDataKey,
+        entry: dict,
+    ) -> None:
+        self.get_data(context, data_type)[key] = entry
+
+    def remove_entry(
+        self, context: ContextTypes.DEFAULT_TYPE, data_type: ContextDataType, key: ContextDataKey
+    ) -> None:
+        self.get_data(context, data_type).pop(key, None)
+
+    def remove_expired_entries(self, application: Application, now: datetime) -> int:
+        removed_count = remove_expired_entries(application.bot_data, now)
+
+        updated_user_ids = []
+        for user_id, user_data in application.user_data.items():
+            user_removed_count = remove_expired_entries(user_data, now)
+            if user_removed_count > 0:
+                updated_user_ids.append(user_id)
+                removed_count += user_removed_count
+
+        # Make sure the removal is also written to the persistence, if enabled
+        if application.persistence is not None and removed_count > 0:
+            application.mark_data_for_update_persistence(user_ids=updated_user_ids)
+
+        return removed_count
+
+
+_store: ContextDataStore = LocalContextDataStore()
+
+
+def set_context_data_store(store: ContextDataStore) -> None:
+    """
+    Set the storage of the context data, to be called before the bot starts
+    :param store: The store
+    :return: None
+    """
+
+    global _store
+
+    _store = store
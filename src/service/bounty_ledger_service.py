@@ -0,0 +1,145 @@
+from peewee import Case
+
+from src.model.BountyLedgerEntry import BountyLedgerEntry
+from src.model.User import User
+from src.model.pojo.BountyDelta import BountyDelta
+
+# Maximum number of users settled by a single statement
+CHUNK_SIZE = 500
+
+# Fields changed only through the ledger
+BOUNTY_FIELDS = (
+    User.bounty,
+    User.pending_bounty,
+    User.total_gained_bounty,
+    User.total_gained_bounty_unmodified,
+)
+
+
+def refresh(users: list[User]) -> None:
+    """
+    Refresh the bounty fields of users from the database
+    :param users: The users, the same user can appear more than once
+    :return: None
+    """
+
+    users_by_id: dict[int, list[User]] = {}
+    for user in users:
+        users_by_id.setdefault(user.id, []).append(user)
+
+    user_ids = list(users_by_id.keys())
+    for index in range(0, len(user_ids), CHUNK_SIZE):
+        rows = (
+            User.select(User.id, *BOUNTY_FIELDS)
+            .where(User.id.in_(user_ids[index : index + CHUNK_SIZE]))
+            .dicts()
+        )
+        for row in rows:
+            for user in users_by_id[row.pop("id")]:
+                user.set_saved_values(row)
+
+
+def get_ledger_row(delta: BountyDelta) -> dict:
+    """
+    Get the ledger entry of a delta
+    :param delta: The delta
+    :return: The entry, as insert values
+    """
+
+    return {
+        BountyLedgerEntry.user: delta.user.id,
+        BountyLedgerEntry.bounty_delta: delta.bounty,
+        BountyLedgerEntry.pending_bounty_delta: delta.pending_bounty,
+        BountyLedgerEntry.total_gained_bounty_delta: delta.total_gained_bounty,
+        BountyLedgerEntry.tax_amount: delta.tax_amount,
+        BountyLedgerEntry.event_type: (
+            str(delta.event_type) if delta.event_type is not None else None
+        ),
+        BountyLedgerEntry.event_id: delta.event_id,
+    }
+
+
+def apply(delta: BountyDelta, min_bounty: int = None) -> bool:
+    """
+    Apply a delta to the bounty of a user with a single atomic update, record it in the ledger
+    and refresh the user
+    :param delta: The delta
+    :param min_bounty: If not None, the delta is applied only if the bounty after it is at
+    least this amount
+    :return: False if not applied because the bounty would have been under min_bounty
+    """
+
+    if delta.is_empty():
+        return True
+
+    user = delta.user
+    condition = User.id == user.id
+    if min_bounty is not None:
+        condition &= (User.bounty + delta.bounty) >= min_bounty
+
+    with User._meta.database.atomic():
+        updated_count = (
+            User.update({
+                User.bounty: User.bounty + delta.bounty,
+                User.pending_bounty: User.pending_bounty + delta.pending_bounty,
+                User.total_gained_bounty: User.total_gained_bounty + delta.total_gained_bounty,
+                User.total_gained_bounty_unmodified: (
+                    User.total_gained_bounty_unmodified + delta.total_gained_bounty
+                ),
+            })
+            .where(condition)
+            .execute()
+        )
+        if updated_count == 0:
+            return False
+
+        BountyLedgerEntry.insert(get_ledger_row(delta)).execute()
+
+    refresh([user])
+    return True
+
+
+def apply_batch(deltas: list[BountyDelta]) -> None:
+    """
+    Apply the deltas of many users, with one update statement per chunk of users and one insert
+    for the ledger entries. Deltas of the same user are summed
+    :param deltas: The deltas
+    :return: None
+    """
+
+    deltas = [delta for delta in deltas if not delta.is_empty()]
+    if len(deltas) == 0:
+        return
+
+    totals: dict[int, list[int]] = {}
+    for delta in deltas:
+        total = totals.setdefault(delta.user.id, [0, 0, 0])
+        total[0] += delta.bounty
+        total[1] += delta.pending_bounty
+        total[2] += delta.total_gained_bounty
+
+    user_ids = list(totals.keys())
+    with User._meta.database.atomic():
+        for index in range(0, len(user_ids), CHUNK_SIZE):
+            chunk = user_ids[index : index + CHUNK_SIZE]
+            bounty_case = Case(User.id, [(user_id, totals[user_id][0]) for user_id in chunk], 0)
+            pending_bounty_case = Case(
+                User.id, [(user_id, totals[user_id][1]) for user_id in chunk], 0
+            )
+            total_gained_bounty_case = Case(
+                User.id, [(user_id, totals[user_id][2]) for user_id in chunk], 0
+            )
+            User.update({
+                User.bounty: User.bounty + bounty_case,
+                User.pending_bounty: User.pending_bounty + pending_bounty_case,
+                User.total_gained_bounty: User.total_gained_bounty + total_gained_bounty_case,
+                User.total_gained_bounty_unmodified: (
+                    User.total_gained_bounty_unmodified + total_gained_bounty_case
+                ),
+            }).where(User.id.in_(chunk)).execute()
+
+        ledger_rows = [get_ledger_row(delta) for delta in deltas]
+        for index in range(0, len(ledger_rows), CHUNK_SIZE):
+            BountyLedgerEntry.insert_many(ledger_rows[index : index + CHUNK_SIZE]).execute()
+
+    refresh([delta.user for delta in deltas])
@@ -8,7 +8,8 @@ from src.model.User import User
 from src.model.enums.BountyLoanSource import BountyLoanSource
 from src.model.enums.BountyLoanStatus import BountyLoanStatus
 from src.model.enums.Notification import BountyLoanExpiredNotification
-from src.service.notification_service import send_notification
+from src.service.expiry_service import run_expiry
+from src.service.notification_service import send_notifications
 
 
 async def set_expired_bounty_loans(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -17,24 +18,33 @@ async def set_expired_bounty_loans(context: ContextTypes.DEFAULT_TYPE) -> None:
     :param context: The context
     :return: None
     """
-    # Get all expired bounty loans
-    expired_bounty_loans: list[BountyLoan] = BountyLoan.select().where(
-        (BountyLoan.status == BountyLoanStatus.ACTIVE)
-        & (BountyLoan.deadline_date < datetime.now())
-    )
 
-    for expired_bounty_loan in expired_bounty_loans:
-        # Set expired
-        expired_bounty_loan.status = BountyLoanStatus.EXPIRED
-        expired_bounty_loan.save()
-
-        # Send notification to the borrower
-        await send_notification(
+    async def notify_borrowers(bounty_loan_ids: list[int]) -> None:
+        borrower, loaner = User.alias(), User.alias()
+        bounty_loans: list[BountyLoan] = (
+            BountyLoan.select(BountyLoan, borrower, loaner)
+            .join(borrower, on=(BountyLoan.borrower == borrower.id), attr="borrower")
+            .switch(BountyLoan)
+            .join(loaner, on=(BountyLoan.loaner == loaner.id), attr="loaner")
+            .where(BountyLoan.id.in_(bounty_loan_ids))
+        )
+        send_notifications(
             context,
-            expired_bounty_loan.borrower,
-            BountyLoanExpiredNotification(expired_bounty_loan),
+            [
+                (bounty_loan.borrower, BountyLoanExpiredNotification(bounty_loan))
+                for bounty_loan in bounty_loans
+            ],
         )
 
+    await run_expiry(
+        "bounty loans",
+        BountyLoan,
+        (BountyLoan.status == BountyLoanStatus.ACTIVE)
+        & (BountyLoan.deadline_date < datetime.now()),
+        {BountyLoan.status: BountyLoanStatus.EXPIRED},
+        notify_borrowers,
+    )
+
 
 def add_loan(
     loaner: User,
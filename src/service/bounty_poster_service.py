@@ -8,6 +8,8 @@ from wantedposter.wantedposter import (
 )
 
 import constants as c
+import resources.Environment as Env
+import src.service.artifact_service as artifact_service
 from src.model.Leaderboard import Leaderboard
 from src.model.LeaderboardUser import LeaderboardUser
 from src.model.User import User
@@ -27,8 +29,16 @@ async def get_bounty_poster(update: Update, user: User) -> str:
 
     from src.service.user_service import get_user_profile_photo, get_boss_type
 
+    # The previous poster of the user is no longer needed
+    owner = artifact_service.get_bounty_poster_owner(user.id)
+    artifact_service.release(owner)
+
+    portrait_path = await get_user_profile_photo(update)
+    if portrait_path is not None:
+        artifact_service.register(portrait_path, owner=owner, ttl_seconds=0)
+
     wanted_poster = WantedPoster(
-        portrait=await get_user_profile_photo(update),
+        portrait=portrait_path,
         first_name=user.tg_first_name,
         last_name=user.tg_last_name,
         bounty=user.bounty,
@@ -63,7 +73,7 @@ async def get_bounty_poster(update: Update, user: User) -> str:
             else:
                 stamp = Stamp.DO_NOT_ENGAGE
 
-    return wanted_poster.generate(
+    poster_path = wanted_poster.generate(
         output_poster_path=generate_temp_file_path(c.BOUNTY_POSTER_EXTENSION),
         portrait_vertical_align=VerticalAlignment.TOP,
         capture_condition=capture_condition,
@@ -71,6 +81,10 @@ async def get_bounty_poster(update: Update, user: User) -> str:
         stamp=stamp,
     )
 
+    return artifact_service.register(
+        poster_path, owner=owner, ttl_seconds=Env.TEMP_DIR_CLEANUP_TIME_SECONDS.get_int()
+    )
+
 
 def get_bounty_poster_limit(leaderboard_user: LeaderboardUser) -> int:
     """
@@ -10,6 +10,8 @@ from telegram.ext import ContextTypes
 import constants as c
 import resources.Environment as Env
 import resources.phrases as phrases
+import src.service.bounty_ledger_service as bounty_ledger_service
+import src.service.task_service as task_service
 from src.model.BountyGift import BountyGift
 from src.model.BountyLoan import BountyLoan
 from src.model.Crew import Crew
@@ -22,6 +24,7 @@ from src.model.enums.BountyGiftStatus import BountyGiftStatus
 from src.model.enums.BountyLoanStatus import BountyLoanStatus
 from src.model.enums.Location import get_first_new_world
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
 from src.model.enums.income_tax.IncomeTaxBracket import IncomeTaxBracket
 from src.model.enums.income_tax.IncomeTaxBreakdown import IncomeTaxBreakdown
@@ -29,6 +32,7 @@ from src.model.enums.income_tax.IncomeTaxContribution import IncomeTaxContributi
 from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
 from src.model.error.CommonChatError import CommonChatException
 from src.model.error.CustomException import BellyValidationException
+from src.model.pojo.BountyDelta import BountyDelta
 from src.model.pojo.Keyboard import Keyboard
 from src.service.date_service import get_next_run, get_previous_run, get_remaining_duration
 from src.service.davy_back_fight_service import add_contribution as add_dbf_contribution
@@ -134,7 +138,7 @@ async def reset_bounty(context: ContextTypes.DEFAULT_TYPE) -> None:
     Crew.update(can_promote_captain=True).execute()
 
     # Disband inactive crews
-    context.application.create_task(disband_inactive_crews(context))
+    task_service.submit(TaskPoolType.TIMERS, disband_inactive_crews(context))
 
 
 async def add_or_remove_bounty(
@@ -155,7 +159,8 @@ async def add_or_remove_bounty(
     should_tax: bool = True,
 ) -> None:
     """
-    Adds a bounty to a user
+    Adds a bounty to a user. The change is applied immediately as an atomic delta and recorded in
+    the bounty ledger, the bounty fields of the user are refreshed with the resulting values
     :param context: Telegram context
     :param user: The user to add the bounty to
     :param amount: The amount to add to the bounty
@@ -164,7 +169,7 @@ async def add_or_remove_bounty(
     :param pending_belly_amount: How much of the amount is from pending belly, so not newly
     acquired. Will be used to calculate eventual taxes
     :param add: Whether to add or remove the bounty
-    :param should_save: Whether to save the user
+    :param should_save: Whether to save the other changes of the user
     :param should_affect_pending_bounty: Whether to affect the pending bounty
     :param check_for_loan: Whether to check for an expired bounty loan when adding bounty
     :param tax_event_type: The tax event type
@@ -192,138 +197,70 @@ async def add_or_remove_bounty(
     elif should_affect_pending_bounty:
         pending_belly_amount = amount
 
-    from src.chat.manage_message import init
-
-    db = init()
-
-    with db.atomic():
-        # Refresh user, only bounty and pending bounty is needed
-        refreshed_user: User = User.get_by_id(user.id)
-        user.bounty = refreshed_user.bounty
-        user.pending_bounty = refreshed_user.pending_bounty
-        user.total_gained_bounty = refreshed_user.total_gained_bounty
-        user.total_gained_bounty_unmodified = refreshed_user.total_gained_bounty_unmodified
-        previous_pending_bounty = user.pending_bounty
-
-        # Should remove bounty
-        if not add:
-            user.bounty -= amount
-            if should_affect_pending_bounty:
-                user.pending_bounty += (
-                    amount if pending_belly_amount is None else pending_belly_amount
-                )
-
-            if user.bounty < 0 and raise_error_if_negative_bounty:
-                logging.exception(
-                    f"User {user.id} has negative bounty: {user.bounty} after removing "
-                    f"{amount} bounty in event "
-                    f"{update.to_dict() if update is not None else 'None'}"
-                    f"\n{traceback.print_stack()}"
-                )
-
-                raise CommonChatException("Negative bounty after requested action")
-
-            if should_save:
-                user.save()
-            return
+    # Current values, needed for the taxes
+    bounty_ledger_service.refresh([user])
+    previous_pending_bounty = user.pending_bounty
+
+    # Should remove bounty
+    if not add:
+        delta = BountyDelta(
+            user,
+            bounty=-amount,
+            pending_bounty=pending_belly_amount if should_affect_pending_bounty else 0,
+            event_type=tax_event_type,
+            event_id=event_id,
+        )
 
-        if should_affect_pending_bounty:
-            user.pending_bounty -= amount if pending_belly_amount is None else pending_belly_amount
+        # Not applied if the bounty would become negative
+        if not bounty_ledger_service.apply(
+            delta, min_bounty=0 if raise_error_if_negative_bounty else None
+        ):
+            logging.exception(
+                f"User {user.id} has negative bounty: {user.bounty - amount} after removing "
+                f"{amount} bounty in event "
+                f"{update.to_dict() if update is not None else 'None'}"
+                f"\n{traceback.print_stack()}"
+            )
 
-            if user.pending_bounty < 0 and previous_pending_bounty >= 0:
-                logging.exception(
-                    f"User {user.id} has negative pending bounty: {user.pending_bounty}"
-                    f"(previous was {previous_pending_bounty} after removing"
-                    f" {amount} pending bounty in event "
-                    f"{update.to_dict() if update is not None else 'None'}"
-                    f"\n{traceback.print_stack()}"
-                )
+            raise CommonChatException("Negative bounty after requested action")
 
-            if should_save:
-                user.save()
+        if should_save:
+            user.save()
+        return
 
-        if amount <= 0 and not should_update_location:
-            return
+    is_bounty_gained = amount > 0 and not user.is_arrested()  # Arrested, no bounty is gained
+    delta = get_bounty_gain_delta(
+        user,
+        amount if is_bounty_gained else 0,
+        pending_belly_amount if should_affect_pending_bounty else None,
+        tax_event_type=tax_event_type,
+        event_id=event_id,
+        should_tax=should_tax,
+    )
+    bounty_ledger_service.apply(delta)
+
+    if should_affect_pending_bounty and user.pending_bounty < 0 and previous_pending_bounty >= 0:
+        logging.exception(
+            f"User {user.id} has negative pending bounty: {user.pending_bounty}"
+            f"(previous was {previous_pending_bounty} after removing"
+            f" {amount} pending bounty in event "
+            f"{update.to_dict() if update is not None else 'None'}"
+            f"\n{traceback.print_stack()}"
+        )
 
-        # User is arrested, no bounty is gained
-        if user.is_arrested():
-            return
+    if is_bounty_gained:
+        if check_for_loan:
+            await pay_expired_loans(user, delta.total_gained_bounty, update)
 
-        if amount > 0:
-            # Amount that will be used to calculate eventual taxes
-            net_amount_without_pending = amount - (
-                pending_belly_amount if pending_belly_amount is not None else 0
+        # Active Davy Back Fight, add net amount to participant contribution
+        if tax_event_type in DavyBackFight.get_contribution_events():
+            task_service.submit(
+                TaskPoolType.BACKGROUND,
+                add_dbf_contribution(user, amount - (pending_belly_amount or 0), opponent),
             )
-            net_amount_after_tax = net_amount_without_pending
-            amount_to_add = amount
 
-            # Get net amount after taxes
-            tax_breakdown: list[IncomeTaxBreakdown] = IncomeTaxBracket.get_tax_breakdown(
-                user.total_gained_bounty, net_amount_without_pending
-            )
-            if should_tax:
-                tax_amount = IncomeTaxBreakdown.get_amount_from_list(tax_breakdown)
-                if tax_amount > 0 and not user_has_complete_tax_deduction(user):
-                    tax_amount = get_tax_amount(
-                        user, net_amount_without_pending
-                    )  # Recalculate with eventual deductions
-                    net_amount_after_tax = net_amount_without_pending - tax_amount
-                    amount_to_add -= tax_amount
-
-                    # Create tax event
-                    tax_event: IncomeTaxEvent | None = None
-                    if tax_event_type is not None:
-                        tax_event: IncomeTaxEvent = IncomeTaxEvent()
-                        tax_event.user = user
-                        tax_event.event_type = tax_event_type.value
-                        tax_event.event_id = event_id
-                        tax_event.starting_amount = user.total_gained_bounty
-                        tax_event.amount = net_amount_without_pending
-                        tax_event.breakdown_list = object_to_json_string(tax_breakdown)
-                        tax_event.deduction_list = object_to_json_string(get_tax_deductions(user))
-                        tax_event.save()
-
-                    # Add tax to crew chest
-                    if user.is_crew_member():
-                        # Add crew chest contribution
-                        add_contribution(
-                            IncomeTaxContributionType.CREW_CHEST,
-                            tax_amount,
-                            tax_event=tax_event,
-                            user=user,
-                        )
-
-            user.total_gained_bounty += net_amount_after_tax
-            user.total_gained_bounty_unmodified += net_amount_after_tax
-
-            if check_for_loan:
-                # If user has an expired bounty loan, use n% of the bounty to repay the loan
-                expired_loans = user.get_expired_bounty_loans()
-                amount_for_loans = net_amount_after_tax
-                for loan in expired_loans:
-                    amount_for_repay = subtract_percentage_from_value(
-                        amount_for_loans, Env.BOUNTY_LOAN_GARNISH_PERCENTAGE.get_float()
-                    )
-                    # Cap to remaining amount
-                    amount_for_repay = loan.get_maximum_payable_amount(int(amount_for_repay))
-
-                    # Pay loan
-                    await loan.pay(amount_for_repay, update)
-
-                    # Subtract from amount
-                    amount_to_add -= amount_for_repay
-                    amount_for_loans -= amount_for_repay
-
-            user.bounty += amount_to_add
-
-            if should_save:
-                user.save()
-
-            # Active Davy Back Fight, add net amount to participant contribution
-            if tax_event_type in DavyBackFight.get_contribution_events():
-                context.application.create_task(
-                    add_dbf_contribution(user, net_amount_without_pending, opponent)
-                )
+    if should_save:
+        user.save()
 
     # Update the user's location
     if should_update_location:
@@ -332,6 +269,179 @@ async def add_or_remove_bounty(
         await update_location(user, context, update)
 
 
+async def add_bounty_batch(
+    user_amounts: list[tuple[User, int, int | None]],
+    update: Update = None,
+    tax_event_type: IncomeTaxEventType = None,
+    event_id: int = None,
+    should_tax: bool = True,
+) -> None:
+    """
+    Add bounty to many users, e.g. the payouts of a prediction, settled with a single statement
+    :param user_amounts: For each addition, the user, the amount and how much of the amount is
+    from pending belly. Users can appear more than once
+    :param update: Telegram update
+    :param tax_event_type: The tax event type
+    :param event_id: The event id
+    :param should_tax: Whether to tax the bounty
+    :return: None
+    """
+
+    if len(user_amounts) == 0:
+        return
+
+    bounty_ledger_service.refresh([user for user, _, _ in user_amounts])
+
+    deltas: list[BountyDelta] = []
+    # Net amount gained by user id, to repay eventual expired loans
+    gained_amounts: dict[int, list[User, int]] = {}
+    for user, amount, pending_belly_amount in user_amounts:
+        is_bounty_gained = amount > 0 and not user.is_arrested()  # Arrested, no bounty is gained
+        delta = get_bounty_gain_delta(
+            user,
+            amount if is_bounty_gained else 0,
+            pending_belly_amount if pending_belly_amount else None,
+            tax_event_type=tax_event_type,
+            event_id=event_id,
+            should_tax=should_tax,
+        )
+        deltas.append(delta)
+
+        # So that the next additions of the same user are taxed with the updated bracket
+        user.set_saved_values(
+            {"total_gained_bounty": user.total_gained_bounty + delta.total_gained_bounty}
+        )
+
+        if is_bounty_gained:
+            gained_amounts.setdefault(user.id, [user, 0])[1] += delta.total_gained_bounty
+
+    bounty_ledger_service.apply_batch(deltas)
+
+    # Only users with expired loans, found with a single query
+    borrower_ids = [
+        borrower_id
+        for (borrower_id,) in BountyLoan.select(BountyLoan.borrower)
+        .where(
+            (BountyLoan.borrower.in_(list(gained_amounts.keys())))
+            & (BountyLoan.status == BountyLoanStatus.EXPIRED)
+        )
+        .distinct()
+        .tuples()
+    ]
+    for borrower_id in borrower_ids:
+        user, gained_amount = gained_amounts[borrower_id]
+        await pay_expired_loans(user, gained_amount, update)
+
+
+def get_bounty_gain_delta(
+    user: User,
+    amount: int,
+    pending_belly_amount: int | None,
+    tax_event_type: IncomeTaxEventType = None,
+    event_id: int = None,
+    should_tax: bool = True,
+) -> BountyDelta:
+    """
+    Get the delta of a bounty gain, after taxes. The tax event and the crew chest contribution
+    are created
+    :param user: The user, with up-to-date bounty fields
+    :param amount: The amount gained
+    :param pending_belly_amount: How much of the amount is from pending belly, removed from the
+    pending bounty and not taxed. None if the pending bounty is not affected
+    :param tax_event_type: The tax event type
+    :param event_id: The event id
+    :param should_tax: Whether to tax the bounty
+    :return: The delta
+    """
+
+    delta = BountyDelta(
+        user,
+        pending_bounty=-pending_belly_amount if pending_belly_amount is not None else 0,
+        event_type=tax_event_type,
+        event_id=event_id,
+    )
+
+    if amount <= 0:
+        return delta
+
+    # Amount that will be used to calculate eventual taxes
+    net_amount_without_pending = amount - (
+        pending_belly_amount if pending_belly_amount is not None else 0
+    )
+    net_amount_after_tax = net_amount_without_pending
+    amount_to_add = amount
+
+    # Get net amount after taxes
+    tax_breakdown: list[IncomeTaxBreakdown] = IncomeTaxBracket.get_tax_breakdown(
+        user.total_gained_bounty, net_amount_without_pending
+    )
+    if should_tax:
+        tax_amount = IncomeTaxBreakdown.get_amount_from_list(tax_breakdown)
+        if tax_amount > 0 and not user_has_complete_tax_deduction(user):
+            tax_amount = get_tax_amount(
+                user, net_amount_without_pending
+            )  # Recalculate with eventual deductions
+            net_amount_after_tax = net_amount_without_pending - tax_amount
+            amount_to_add -= tax_amount
+            delta.tax_amount = tax_amount
+
+            # Create tax event
+            tax_event: IncomeTaxEvent | None = None
+            if tax_event_type is not None:
+                tax_event: IncomeTaxEvent = IncomeTaxEvent()
+                tax_event.user = user
+                tax_event.event_type = tax_event_type.value
+                tax_event.event_id = event_id
+                tax_event.starting_amount = user.total_gained_bounty
+                tax_event.amount = net_amount_without_pending
+                tax_event.breakdown_list = object_to_json_string(tax_breakdown)
+                tax_event.deduction_list = object_to_json_string(get_tax_deductions(user))
+                tax_event.save()
+
+            # Add tax to crew chest
+            if user.is_crew_member():
+                # Add crew chest contribution
+                add_contribution(
+                    IncomeTaxContributionType.CREW_CHEST,
+                    tax_amount,
+                    tax_event=tax_event,
+                    user=user,
+                )
+
+    delta.bounty = amount_to_add
+    delta.total_gained_bounty = net_amount_after_tax
+    return delta
+
+
+async def pay_expired_loans(user: User, amount: int, update: Update = None) -> None:
+    """
+    Use part of a bounty gain to repay the expired bounty loans of a user
+    :param user: The user
+    :param amount: The net amount gained
+    :param update: Telegram update
+    :return: None
+    """
+
+    amount_for_loans = amount
+    expired_loans = list(user.get_expired_bounty_loans())
+    if len(expired_loans) == 0:
+        return
+
+    for loan in expired_loans:
+        amount_for_repay = subtract_percentage_from_value(
+            amount_for_loans, Env.BOUNTY_LOAN_GARNISH_PERCENTAGE.get_float()
+        )
+        # Cap to remaining amount
+        amount_for_repay = loan.get_maximum_payable_amount(int(amount_for_repay))
+
+        # Pay loan, removing the amount from the borrower
+        await loan.pay(amount_for_repay, update)
+        amount_for_loans -= amount_for_repay
+
+    # Removed from the borrower instance of the loans
+    bounty_ledger_service.refresh([user])
+
+
 def get_amount_from_string(amount: str, user: User) -> int:
     """
     Get the wager amount
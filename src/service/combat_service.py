@@ -0,0 +1,198 @@
+import datetime
+
+from peewee import fn
+
+from src.model.CrewAbility import CrewAbility
+from src.model.DevilFruit import DevilFruit
+from src.model.DevilFruitAbility import DevilFruitAbility
+from src.model.Leaderboard import Leaderboard
+from src.model.LeaderboardUser import LeaderboardUser
+from src.model.User import User
+from src.model.enums.LeaderboardRank import LeaderboardRank, get_rank_by_leaderboard_user
+from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
+from src.model.enums.devil_fruit.DevilFruitStatus import DevilFruitStatus
+from src.service.date_service import get_datetime_in_future_hours
+from src.service.devil_fruit_service import apply_ability_values
+
+
+class CombatContext:
+    """
+    Snapshot of the data needed to compute the odds and outcome of a fight or plunder between two
+    users, loaded with a fixed number of queries
+    """
+
+    def __init__(self, challenger: User, opponent: User):
+        """
+        Initialize the combat context
+        :param challenger: The challenger
+        :param opponent: The opponent
+        """
+        self.challenger: User = challenger
+        self.opponent: User = opponent
+        # Average bounty by crew id
+        self.crew_average_bounties: dict[int, int] = {}
+        # Current global leaderboard rank by user id
+        self.leaderboard_ranks: dict[int, LeaderboardRank] = {}
+        # Devil Fruit and crew ability values by user id and ability type
+        self.ability_values: dict[tuple[int, DevilFruitAbilityType], list[int]] = {}
+
+    def get_max_bounty(self, user: User) -> int:
+        """
+        Returns the max bounty between the user and the crew average, same as User.get_max_bounty
+        :param user: The user
+        :return: The max bounty
+        """
+
+        if user.is_crew_member():
+            return max(user.bounty, self.crew_average_bounties.get(user.crew_id, 0))
+
+        return user.bounty
+
+    def has_higher_bounty_than_crew_average(self, user: User) -> bool:
+        """
+        Returns True if the user has a higher bounty than the crew average, same as
+        User.has_higher_bounty_than_crew_average
+        :param user: The user
+        :return: True if the user has a higher bounty than the crew average
+        """
+
+        if user.is_crew_member():
+            return user.bounty > self.crew_average_bounties.get(user.crew_id, 0)
+
+        return False
+
+    def get_leaderboard_rank(self, user: User) -> LeaderboardRank:
+        """
+        Returns the rank of the user in the current global leaderboard
+        :param user: The user
+        :return: The rank
+        """
+
+        return self.leaderboard_ranks.get(user.id, get_rank_by_leaderboard_user(None))
+
+    def get_ability_value(
+        self,
+        user: User,
+        ability_type: DevilFruitAbilityType,
+        value: float,
+        add_to_value: bool = False,
+    ) -> float:
+        """
+        Given a value, gets the updated value if the user has a Devil Fruit or crew ability that
+        modifies it, same as devil_fruit_service.get_ability_value
+        :param user: The user
+        :param ability_type: The ability type, must be one of those loaded
+        :param value: The value
+        :param add_to_value: Whether to add to the value
+        :return: The value
+        """
+
+        return apply_ability_values(
+            ability_type,
+            self.ability_values.get((user.id, ability_type), []),
+            value,
+            add_to_value=add_to_value,
+        )
+
+    def get_ability_adjusted_datetime(
+        self, user: User, ability_type: DevilFruitAbilityType, hours: int
+    ) -> datetime.datetime:
+        """
+        Given a duration, get the datetime in the future adjusted by the user abilities, same as
+        devil_fruit_service.get_ability_adjusted_datetime
+        :param user: The user
+        :param ability_type: The ability type, must be one of those loaded
+        :param hours: The hours
+        :return: The datetime
+        """
+
+        return get_datetime_in_future_hours(self.get_ability_value(user, ability_type, hours))
+
+
+def load_combat_context(
+    challenger: User,
+    opponent: User,
+    ability_types: list[DevilFruitAbilityType],
+    load_leaderboard_ranks: bool = False,
+) -> CombatContext:
+    """
+    Load the combat context of two users: crew average bounties, leaderboard ranks and the
+    Devil Fruit and crew abilities of the given types, with one query each
+    :param challenger: The challenger
+    :param opponent: The opponent
+    :param ability_types: The ability types that will be applied
+    :param load_leaderboard_ranks: Whether to load the current leaderboard ranks
+    :return: The combat context
+    """
+
+    context = CombatContext(challenger, opponent)
+    users: list[User] = list({user.id: user for user in (challenger, opponent)}.values())
+    user_ids: list[int] = [user.id for user in users]
+    crew_ids: list[int] = list({user.crew_id for user in users if user.is_crew_member()})
+    ability_type_values: list[int] = [ability_type.value for ability_type in ability_types]
+
+    # Crew average bounties
+    if len(crew_ids) > 0:
+        context.crew_average_bounties = {
+            crew_id: int(average_bounty)
+            for crew_id, average_bounty in User.select(User.crew, fn.AVG(User.bounty))
+            .where(User.crew.in_(crew_ids))
+            .group_by(User.crew)
+            .tuples()
+        }
+
+    # Current global leaderboard ranks
+    if load_leaderboard_ranks:
+        current_leaderboard = (
+            Leaderboard.select(Leaderboard.id)
+            .where(Leaderboard.group.is_null())
+            .order_by(Leaderboard.year.desc(), Leaderboard.week.desc())
+            .limit(1)
+        )
+        for leaderboard_user in LeaderboardUser.select().where(
+            (LeaderboardUser.leaderboard == current_leaderboard)
+            & (LeaderboardUser.user.in_(user_ids))
+        ):
+            context.leaderboard_ranks[leaderboard_user.user_id] = get_rank_by_leaderboard_user(
+                leaderboard_user
+            )
+
+    if len(ability_type_values) == 0:
+        return context
+
+    # Abilities of the non-defective Devil Fruits eaten by the users
+    for owner_id, ability_type, value in (
+        DevilFruitAbility.select(
+            DevilFruit.owner, DevilFruitAbility.ability_type, DevilFruitAbility.value
+        )
+        .join(DevilFruit)
+        .where(
+            (DevilFruit.owner.in_(user_ids))
+            & (DevilFruit.is_defective == False)
+            & (DevilFruit.status == DevilFruitStatus.EATEN)
+            & (DevilFruitAbility.ability_type.in_(ability_type_values))
+        )
+        .tuples()
+    ):
+        context.ability_values.setdefault(
+            (owner_id, DevilFruitAbilityType(ability_type)), []
+        ).append(value)
+
+    # Active crew abilities, applied to every user of the crew
+    if len(crew_ids) > 0:
+        for crew_id, ability_type, value in (
+            CrewAbility.select(CrewAbility.crew, CrewAbility.ability_type, CrewAbility.value)
+            .where(
+                (CrewAbility.crew.in_(crew_ids))
+                & (CrewAbility.expiration_date > datetime.datetime.now())
+                & (CrewAbility.ability_type.in_(ability_type_values))
+            )
+            .tuples()
+        ):
+            for user in users:
+                if user.crew_id == crew_id:
+                    context.ability_values.setdefault(
+                        (user.id, DevilFruitAbilityType(ability_type)), []
+                    ).append(value)
+
+    return context
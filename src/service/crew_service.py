@@ -1,5 +1,7 @@
+import logging
 from datetime import datetime
 
+from peewee import fn
 from telegram.ext import ContextTypes
 
 from resources import phrases as phrases, Environment as Env
@@ -27,14 +29,20 @@ from src.model.enums.crew.CrewRole import CrewRole
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
 from src.model.error.ChatWarning import ChatWarning
 from src.model.pojo.Keyboard import Keyboard
+from src.service.crew_summary_service import (
+    CrewSummary,
+    get_crew_summary,
+    invalidate_crew_summary,
+)
 from src.service.date_service import (
     get_remaining_duration,
     get_datetime_in_future_days,
     get_elapsed_duration,
 )
+from src.service.expiry_service import run_expiry
 from src.service.location_service import update_location
 from src.service.message_service import get_deeplink
-from src.service.notification_service import send_notification
+from src.service.notification_service import send_notification, send_notifications
 from src.utils.math_utils import get_value_from_percentage
 from src.utils.string_utils import get_belly_formatted
 
@@ -62,7 +70,8 @@ async def add_member(
     await update_location(crew_member, should_passive_update=True)
 
     crew_member.save()
-    crew.set_is_full()
+    invalidate_crew_summary(crew)
+    crew.add_to_member_count(1)
 
 
 async def remove_member(
@@ -109,7 +118,8 @@ async def remove_member(
     await update_location(crew_member, should_passive_update=True, can_scale_down=True)
 
     crew_member.save()
-    crew.set_is_full()
+    invalidate_crew_summary(crew)
+    crew.add_to_member_count(-1)
 
     if disable_crew_can_accept_new_members:
         crew.can_accept_new_members = False
@@ -213,6 +223,7 @@ async def disband_crew(
     crew.is_active = False
     crew.disband_date = datetime.now()
     crew.save()
+    invalidate_crew_summary(crew)
 
 
 async def disband_inactive_crews(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -418,6 +429,7 @@ async def add_crew_ability(
         Env.CREW_ABILITY_DURATION_DAYS.get_int(), start_time=now
     )
     ability.save()
+    invalidate_crew_summary(crew)
 
     # Notify crew members
     await notify_crew_members(
@@ -498,20 +510,22 @@ def get_crew_overview_text(crew: Crew, user: User, from_search: bool = True) ->
     no_new_members_allowed_text = ""
     davy_back_fight_penalty_active = ""
 
-    if from_search:
-        if not crew.allow_view_in_search:
-            return phrases.CREW_SEARCH_NOT_ALLOWED_TO_VIEW
+    if from_search and not crew.allow_view_in_search:
+        return phrases.CREW_SEARCH_NOT_ALLOWED_TO_VIEW
 
+    crew_summary: CrewSummary = get_crew_summary(crew)
+
+    if from_search:
         if crew.required_bounty > 0:
             required_bounty_text = phrases.CREW_OVERVIEW_REQUIRED_BOUNTY.format(
                 get_belly_formatted(crew.required_bounty)
             )
 
         active_abilities_count_text = phrases.CREW_OVERVIEW_ACTIVE_ABILITIES_COUNT.format(
-            len(crew.get_active_abilities()), crew.max_abilities
+            crew_summary.active_abilities_count, crew.max_abilities
         )
     else:
-        first_mate: User = crew.get_first_mate()
+        first_mate: User = crew_summary.first_mate
         if first_mate is not None:
             first_mate_text = phrases.CREW_OVERVIEW_FIRST_MATE.format(
                 first_mate.get_markdown_mention()
@@ -531,15 +545,14 @@ def get_crew_overview_text(crew: Crew, user: User, from_search: bool = True) ->
             )
 
     # Crew has a Davy Back Fight penalty
-    dbf_penalty: DavyBackFight = crew.get_penalty_davy_back_fight()
-    if dbf_penalty is not None:
+    if crew_summary.has_penalty_davy_back_fight():
         davy_back_fight_penalty_active = (
             phrases.CREW_OVERVIEW_DAVY_BACK_FIGHT_PENALTY_ACTIVE.format(
-                get_remaining_duration(dbf_penalty.penalty_end_date)
+                get_remaining_duration(crew_summary.penalty_end_date)
             )
         )
 
-    captain: User = crew.get_captain()
+    captain: User = crew_summary.captain
 
     ot_text = phrases.CREW_OVERVIEW.format(
         crew.get_name_escaped(),
@@ -553,7 +566,7 @@ def get_crew_overview_text(crew: Crew, user: User, from_search: bool = True) ->
         first_mate_text,
         user.get_date_formatted(crew.creation_date),
         get_elapsed_duration(crew.creation_date),
-        len(crew.get_members()),
+        crew_summary.member_count,
         crew.max_members,
         active_abilities_count_text,
         required_bounty_text,
@@ -593,15 +606,50 @@ async def end_all_conscription(context: ContextTypes.DEFAULT_TYPE):
     :param context: The context
     :return: None
     """
-    conscripts = User.select().where(
-        User.crew_role == CrewRole.CONSCRIPT,
-        User.conscription_end_date.is_null(False),
-        User.conscription_end_date < datetime.now(),
+
+    async def notify_conscripts(user_ids: list[int]) -> None:
+        conscripts: list[User] = User.select(User, Crew).join(Crew).where(User.id.in_(user_ids))
+        invalidate_crew_summary(*{conscript.crew for conscript in conscripts})
+        send_notifications(
+            context,
+            [(conscript, CrewConscriptionEndNotification(conscript)) for conscript in conscripts],
+        )
+
+    await run_expiry(
+        "conscriptions",
+        User,
+        (User.crew_role == CrewRole.CONSCRIPT)
+        & (User.conscription_end_date.is_null(False))
+        & (User.conscription_end_date < datetime.now()),
+        {User.crew_role: None},
+        notify_conscripts,
     )
 
-    for conscript in conscripts:
-        conscript.crew_role = None
-        conscript.save()
 
-        # Send notification
-        await send_notification(context, conscript, CrewConscriptionEndNotification(conscript))
+def reconcile_member_count() -> int:
+    """
+    Check the member count of the crews against their members, and correct the ones that
+    drifted. Should find none, since the count is updated when members join or leave
+    :return: The number of corrected crews
+    """
+
+    member_counts: dict[int, int] = dict(
+        User.select(User.crew, fn.COUNT(User.id))
+        .where(User.crew.is_null(False))
+        .group_by(User.crew)
+        .tuples()
+    )
+
+    drifted_crew_ids: list[int] = []
+    for crew_id, member_count in Crew.select(Crew.id, Crew.member_count).tuples():
+        actual_member_count = member_counts.get(crew_id, 0)
+        if member_count != actual_member_count:
+            logging.warning(
+                f"Crew {crew_id} has member count {member_count} but {actual_member_count} members"
+            )
+            drifted_crew_ids.append(crew_id)
+
+    if len(drifted_crew_ids) > 0:
+        Crew.set_member_count_from_members(Crew.id.in_(drifted_crew_ids))
+
+    return len(drifted_crew_ids)
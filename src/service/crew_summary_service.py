@@ -0,0 +1,163 @@
+import datetime
+from decimal import Decimal
+
+from peewee import fn, Case, JOIN
+
+import resources.Environment as Env
+from src.model.Crew import Crew
+from src.model.CrewAbility import CrewAbility
+from src.model.DavyBackFight import DavyBackFight
+from src.model.User import User
+from src.model.enums.GameStatus import GameStatus
+from src.model.enums.crew.CrewRole import CrewRole
+
+
+class CrewSummary:
+    """
+    Aggregated data of a crew, computed with a single grouped query
+    """
+
+    def __init__(self, crew_id: int):
+        """
+        Initialize the crew summary
+        :param crew_id: The crew id
+        """
+        self.crew_id: int = crew_id
+        self.member_count: int = 0
+        self.average_bounty: Decimal | None = None
+        self.average_location_level: Decimal | None = None
+        self.captain: User | None = None
+        self.first_mate: User | None = None
+        self.active_abilities_count: int = 0
+        self.penalty_end_date: datetime.datetime | None = None
+        self.valid_until: datetime.datetime = datetime.datetime.now()
+
+    def is_valid(self) -> bool:
+        """
+        Check if the summary can still be used
+        :return: True if the summary is valid
+        """
+        return datetime.datetime.now() < self.valid_until
+
+    def has_penalty_davy_back_fight(self) -> bool:
+        """
+        Check if the crew has a Davy Back Fight penalty
+        :return: True if the crew has a Davy Back Fight penalty
+        """
+        return self.penalty_end_date is not None
+
+
+# Summaries by crew id
+_summaries: dict[int, CrewSummary] = {}
+
+
+def get_crew_summary(crew: Crew) -> CrewSummary:
+    """
+    Get the summary of a crew. A missing or expired summary is computed with a single grouped
+    query, plus one for the captain and first mate
+    :param crew: The crew
+    :return: The summary
+    """
+
+    summary = _summaries.get(crew.id)
+    if summary is None or not summary.is_valid():
+        summary = compute_crew_summary(crew.id)
+        _summaries[crew.id] = summary
+
+    return summary
+
+
+def compute_crew_summary(crew_id: int) -> CrewSummary:
+    """
+    Compute the summary of a crew
+    :param crew_id: The crew id
+    :return: The summary
+    """
+
+    now = datetime.datetime.now()
+    active_ability_condition = (CrewAbility.crew == Crew.id) & (CrewAbility.expiration_date > now)
+    active_abilities_count = CrewAbility.select(fn.COUNT(CrewAbility.id)).where(
+        active_ability_condition
+    )
+    next_ability_expiration_date = CrewAbility.select(fn.MIN(CrewAbility.expiration_date)).where(
+        active_ability_condition
+    )
+    penalty_end_date = DavyBackFight.select(fn.MAX(DavyBackFight.penalty_end_date)).where(
+        (
+            (
+                (DavyBackFight.challenger_crew == Crew.id)
+                & (DavyBackFight.status == GameStatus.LOST)
+            )
+            | ((DavyBackFight.opponent_crew == Crew.id) & (DavyBackFight.status == GameStatus.WON))
+        )
+        & (DavyBackFight.penalty_end_date > now)
+    )
+
+    row = (
+        Crew.select(
+            Crew.id,
+            fn.COUNT(User.id),
+            fn.AVG(User.bounty),
+            fn.AVG(User.location_level),
+            fn.MAX(Case(None, [(User.crew_role == CrewRole.CAPTAIN, User.id)])),
+            fn.MAX(Case(None, [(User.crew_role == CrewRole.FIRST_MATE, User.id)])),
+            active_abilities_count,
+            next_ability_expiration_date,
+            penalty_end_date,
+        )
+        .join(User, JOIN.LEFT_OUTER, on=(User.crew == Crew.id))
+        .where(Crew.id == crew_id)
+        .group_by(Crew.id)
+        .tuples()
+        .get()
+    )
+
+    (
+        _,
+        member_count,
+        average_bounty,
+        average_location_level,
+        captain_id,
+        first_mate_id,
+        abilities_count,
+        next_expiration_date,
+        penalty_end,
+    ) = row
+    summary = CrewSummary(crew_id)
+    summary.member_count = member_count
+    summary.average_bounty = average_bounty
+    summary.average_location_level = average_location_level
+    summary.active_abilities_count = abilities_count
+    summary.penalty_end_date = penalty_end
+
+    # Stop using the summary as soon as an ability or the penalty expires
+    default_valid_until = now + datetime.timedelta(
+        seconds=Env.CREW_SUMMARY_CACHE_TTL_SECONDS.get_int()
+    )
+    summary.valid_until = min(
+        d for d in (default_valid_until, next_expiration_date, penalty_end) if d is not None
+    )
+
+    # Captain and first mate
+    role_user_ids = [i for i in (captain_id, first_mate_id) if i is not None]
+    if len(role_user_ids) > 0:
+        users_by_id: dict[int, User] = {
+            user.id: user for user in User.select().where(User.id.in_(role_user_ids))
+        }
+        summary.captain = users_by_id.get(captain_id)
+        summary.first_mate = users_by_id.get(first_mate_id)
+
+    return summary
+
+
+def invalidate_crew_summary(*crews: Crew) -> None:
+    """
+    Remove the cached summary of the crews, to be called when members join or leave, roles
+    change, abilities are activated or the Davy Back Fight state changes
+    :param crews: The crews
+    :return: None
+    """
+
+    for crew in crews:
+        if crew is not None:
+            _summaries.pop(crew.id, None)
@@ -1,7 +1,10 @@
 import datetime
+import time
 
 from telegram.ext import CallbackContext, ContextTypes
 
+import src.service.task_service as task_service
+import src.service.webhook_service as webhook_service
 from resources import phrases
 from src.model.Crew import Crew
 from src.model.DavyBackFight import DavyBackFight
@@ -12,13 +15,46 @@ from src.model.enums.Notification import (
     DavyBackFightStartNotification,
     DavyBackFightEndNotification,
 )
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
 from src.model.error.CustomException import CrewValidationException
 from src.model.game.GameOutcome import GameOutcome
+from src.service.crew_summary_service import invalidate_crew_summary
 from src.service.date_service import get_datetime_in_future_days
 from src.service.notification_service import send_notification
 
 
+class InProgressDavyBackFight:
+    """
+    Lightweight view of an in progress Davy Back Fight, used to route contributions without
+    querying the database
+    """
+
+    __slots__ = ("davy_back_fight_id", "crew_ids", "participant_ids_by_user_id")
+
+    def __init__(
+        self,
+        davy_back_fight_id: int,
+        crew_ids: tuple[int, int],
+        participant_ids_by_user_id: dict[int, int],
+    ):
+        """
+        Initialize the entry
+        :param davy_back_fight_id: The Davy Back Fight id
+        :param crew_ids: The challenger and opponent crew ids
+        :param participant_ids_by_user_id: The participant ids by user id, for both crews
+        """
+        self.davy_back_fight_id: int = davy_back_fight_id
+        self.crew_ids: tuple[int, int] = crew_ids
+        self.participant_ids_by_user_id: dict[int, int] = participant_ids_by_user_id
+
+
+# In progress Davy Back Fights by crew id, loaded on first use and reloaded periodically if
+# other webhook workers can start or end them
+_in_progress_by_crew_id: dict[int, InProgressDavyBackFight] = {}
+_in_progress_index_load_time: float | None = None
+
+
 def add_participant(user: User, davy_back_fight: DavyBackFight):
     """
     Add a participant to the Davy Back Fight
@@ -69,11 +105,20 @@ def set_default_participants(crew: Crew, davy_back_fight: DavyBackFight) -> None
         & (DavyBackFightParticipant.crew == crew)
     ).execute()
 
+    # Davy Back Fight not in countdown
+    if davy_back_fight.get_status() is not GameStatus.COUNTDOWN_TO_START:
+        raise CrewValidationException(phrases.ITEM_IN_WRONG_STATUS)
+
     # Add participants
-    for index, user in enumerate(crew.get_members_order_by_davy_back_fight_priority()):
-        if index >= davy_back_fight.participants_count:
-            break
-        add_participant(user=user, davy_back_fight=davy_back_fight)
+    members: list[User] = crew.get_members_order_by_davy_back_fight_priority()
+    DavyBackFightParticipant.insert_many([
+        {
+            DavyBackFightParticipant.davy_back_fight: davy_back_fight,
+            DavyBackFightParticipant.user: user,
+            DavyBackFightParticipant.crew: crew,
+        }
+        for user in members[: davy_back_fight.participants_count]
+    ]).execute()
 
 
 def swap_participant(
@@ -108,7 +153,7 @@ async def start_all(context: ContextTypes.DEFAULT_TYPE):
         (DavyBackFight.status == GameStatus.COUNTDOWN_TO_START)
         & (DavyBackFight.start_date < datetime.datetime.now())
     ):
-        context.application.create_task(start(context, davy_back_fight))
+        task_service.submit(TaskPoolType.TIMERS, start(context, davy_back_fight))
 
 
 async def start(context: CallbackContext, davy_back_fight: DavyBackFight):
@@ -121,6 +166,8 @@ async def start(context: CallbackContext, davy_back_fight: DavyBackFight):
 
     davy_back_fight.status = GameStatus.IN_PROGRESS
     davy_back_fight.save()
+    invalidate_crew_summary(davy_back_fight.challenger_crew, davy_back_fight.opponent_crew)
+    index_in_progress(davy_back_fight)
 
     # Send notification to players
     for participant in davy_back_fight.get_participants():
@@ -141,22 +188,20 @@ async def add_contribution(user: User, amount: int, opponent: User = None):
     :param opponent: The opponent from which bounty is taken
     :return: None
     """
-    crew: Crew = user.crew
-
     # User not in a crew
-    if crew is None:
+    if user.crew_id is None:
         return
 
-    dbf: DavyBackFight = crew.get_in_progress_davy_back_fight()
+    dbf: InProgressDavyBackFight = get_in_progress_by_crew_id(user.crew_id)
 
     # Crew not in an active Davy Back Fight
     if dbf is None:
         return
 
-    participant: DavyBackFightParticipant = dbf.get_participant(user)
+    participant_id: int = dbf.participant_ids_by_user_id.get(user.id)
 
     # User not a participant
-    if participant is None:
+    if participant_id is None:
         return
 
     # By default, always valued at 50% apart from case in which opponent is an adversary.
@@ -166,15 +211,26 @@ async def add_contribution(user: User, amount: int, opponent: User = None):
     amount //= 2
     if opponent is not None:
         # Bounty gained from fellow Crew members is not counted
-        if opponent.crew == crew:
+        if opponent.crew_id == user.crew_id:
             return
 
         # Bounty gained from someone that's not a participant is valued at 100%
-        if dbf.is_participant(opponent):
+        if opponent.id in dbf.participant_ids_by_user_id:
             amount *= 2
 
-    participant.contribution += amount
-    participant.save()
+    # Atomic increment, concurrent contributions don't overwrite each other. Only if still in
+    # progress, since the index can be behind the webhook worker that ended the fight
+    DavyBackFightParticipant.update(
+        contribution=DavyBackFightParticipant.contribution + amount
+    ).where(
+        (DavyBackFightParticipant.id == participant_id)
+        & DavyBackFightParticipant.davy_back_fight.in_(
+            DavyBackFight.select(DavyBackFight.id).where(
+                (DavyBackFight.id == dbf.davy_back_fight_id)
+                & (DavyBackFight.status == GameStatus.IN_PROGRESS)
+            )
+        )
+    ).execute()
 
 
 async def end_all(context: ContextTypes.DEFAULT_TYPE):
@@ -188,7 +244,7 @@ async def end_all(context: ContextTypes.DEFAULT_TYPE):
         (DavyBackFight.status == GameStatus.IN_PROGRESS)
         & (DavyBackFight.end_date < datetime.datetime.now())
     ):
-        context.application.create_task(end(context, davy_back_fight))
+        task_service.submit(TaskPoolType.TIMERS, end(context, davy_back_fight))
 
 
 async def end(context: CallbackContext, davy_back_fight: DavyBackFight):
@@ -198,7 +254,7 @@ async def end(context: CallbackContext, davy_back_fight: DavyBackFight):
     :param davy_back_fight: The Davy Back Fight object
     :return: None
     """
-    from src.service.bounty_service import add_or_remove_bounty
+    from src.service.bounty_service import add_bounty_batch
 
     outcome: GameOutcome = davy_back_fight.get_outcome()
     if outcome is GameOutcome.CHALLENGER_WON:
@@ -212,26 +268,31 @@ async def end(context: CallbackContext, davy_back_fight: DavyBackFight):
         davy_back_fight.penalty_days, start_time=davy_back_fight.end_date
     )
     davy_back_fight.save()
+    invalidate_crew_summary(davy_back_fight.challenger_crew, davy_back_fight.opponent_crew)
+    remove_from_in_progress_index(davy_back_fight)
 
     # Send notification to players
-    participants: list[DavyBackFightParticipant] = davy_back_fight.get_participants()
+    participants: list[DavyBackFightParticipant] = list(davy_back_fight.get_participants())
     for participant in participants:
         if participant.crew == winner_crew:
             participant.win_amount = participant.get_win_amount()
             participant.save()
 
-        # Add amount
-        context.application.create_task(
-            add_or_remove_bounty(
-                participant.user,
-                amount=participant.win_amount,
-                context=context,
-                should_save=True,
-                tax_event_type=IncomeTaxEventType.DAVY_BACK_FIGHT,
-                event_id=davy_back_fight.id,
-            )
-        )
+    # Add amounts
+    task_service.submit(
+        TaskPoolType.BACKGROUND,
+        add_bounty_batch(
+            [
+                (participant.user, participant.win_amount, None)
+                for participant in participants
+                if participant.win_amount is not None
+            ],
+            tax_event_type=IncomeTaxEventType.DAVY_BACK_FIGHT,
+            event_id=davy_back_fight.id,
+        ),
+    )
 
+    for participant in participants:
         await send_notification(
             context,
             participant.user,
@@ -239,3 +300,68 @@ async def end(context: CallbackContext, davy_back_fight: DavyBackFight):
                 davy_back_fight.get_opponent_crew(participant.crew), participant
             ),
         )
+
+
+def index_in_progress(davy_back_fight: DavyBackFight) -> None:
+    """
+    Add or refresh an in progress Davy Back Fight in the in-memory index
+    :param davy_back_fight: The Davy Back Fight object
+    :return: None
+    """
+
+    participant_ids_by_user_id: dict[int, int] = {
+        user_id: participant_id
+        for participant_id, user_id in DavyBackFightParticipant.select(
+            DavyBackFightParticipant.id, DavyBackFightParticipant.user
+        )
+        .where(DavyBackFightParticipant.davy_back_fight == davy_back_fight)
+        .tuples()
+    }
+
+    crew_ids = (davy_back_fight.challenger_crew_id, davy_back_fight.opponent_crew_id)
+    entry = InProgressDavyBackFight(davy_back_fight.id, crew_ids, participant_ids_by_user_id)
+    for crew_id in crew_ids:
+        _in_progress_by_crew_id[crew_id] = entry
+
+
+def remove_from_in_progress_index(davy_back_fight: DavyBackFight) -> None:
+    """
+    Remove a Davy Back Fight from the in-memory index
+    :param davy_back_fight: The Davy Back Fight object
+    :return: None
+    """
+
+    for crew_id in (davy_back_fight.challenger_crew_id, davy_back_fight.opponent_crew_id):
+        entry = _in_progress_by_crew_id.get(crew_id)
+        if entry is not None and entry.davy_back_fight_id == davy_back_fight.id:
+            _in_progress_by_crew_id.pop(crew_id)
+
+
+def load_in_progress_index() -> None:
+    """
+    Load all the in progress Davy Back Fights in the in-memory index
+    :return: None
+    """
+
+    global _in_progress_index_load_time
+
+    _in_progress_by_crew_id.clear()
+    for davy_back_fight in DavyBackFight.select().where(
+        DavyBackFight.status == GameStatus.IN_PROGRESS
+    ):
+        index_in_progress(davy_back_fight)
+
+    _in_progress_index_load_time = time.monotonic()
+
+
+def get_in_progress_by_crew_id(crew_id: int) -> InProgressDavyBackFight | None:
+    """
+    Get the in progress Davy Back Fight of a crew from the in-memory index
+    :param crew_id: The crew id
+    :return: The in progress Davy Back Fight, None if the crew is not in one
+    """
+
+    if webhook_service.is_shared_state_stale(_in_progress_index_load_time):
+        load_in_progress_index()
+
+    return _in_progress_by_crew_id.get(crew_id)
@@ -1,4 +1,5 @@
 import logging
+import time
 from datetime import datetime
 
 from telegram import Update, Message
@@ -6,6 +7,7 @@ from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
 import resources.Environment as Env
+import src.service.webhook_service as webhook_service
 from resources import phrases
 from src.model.Crew import Crew
 from src.model.DevilFruit import DevilFruit
@@ -56,6 +58,12 @@ from src.utils.math_utils import (
     get_random_int,
 )
 
+# Next scheduled Devil Fruit as (id, release date), kept in memory so that the appearance roll
+# doesn't need to access the database. Reloaded periodically if other webhook workers can
+# schedule or release it
+_next_scheduled_release: tuple[int, datetime] | None = None
+_next_scheduled_release_load_time: float | None = None
+
 
 def give_devil_fruit_to_user(
     devil_fruit: DevilFruit,
@@ -207,6 +215,9 @@ async def schedule_devil_fruit_release(context: ContextTypes.DEFAULT_TYPE) -> No
     :param context: The context
     """
 
+    # Fruits could have been scheduled or collected by other means
+    refresh_next_scheduled_release()
+
     if not should_release_devil_fruit():
         return
 
@@ -263,38 +274,49 @@ async def release_devil_fruit_to_user(
     from src.chat.manage_message import init
     from src.service.bounty_service import get_next_bounty_reset_time
 
-    db = init()
-
     if not datetime_is_before(user.devil_fruit_collection_cooldown_end_date):
         return
 
-    with db.atomic() as transaction:
-        # Check if there are any Devil Fruits to release, lock the row
-        devil_fruit: DevilFruit = (
-            DevilFruit.select()
-            .where(DevilFruit.status == DevilFruitStatus.SCHEDULED)
-            .for_update()
-            .order_by(DevilFruit.release_date.asc())
-            .get_or_none()
-        )
+    next_release = get_next_scheduled_release()
+    if next_release is None:
+        return
 
-        if not devil_fruit:
-            return
+    devil_fruit_id, release_date = next_release
+    minutes_to_release: int = get_remaining_time_in_minutes(release_date)
 
-        minutes_to_release: int = get_remaining_time_in_minutes(devil_fruit.release_date)
+    # Probability of releasing the Devil Fruit
+    try:
+        probability: float = (1 / minutes_to_release) * 100
+    except ZeroDivisionError:
+        probability = 100
 
-        # Probability of releasing the Devil Fruit
-        try:
-            probability: float = (1 / minutes_to_release) * 100
-        except ZeroDivisionError:
-            probability = 100
+    if not get_random_win(probability):
+        user.devil_fruit_collection_cooldown_end_date = get_datetime_in_future_hours(
+            Env.DEVIL_FRUIT_COLLECT_COOLDOWN_DURATION.get_int()
+        )
+        return
+
+    db = init()
 
-        if not get_random_win(probability):
-            user.devil_fruit_collection_cooldown_end_date = get_datetime_in_future_hours(
-                Env.DEVIL_FRUIT_COLLECT_COOLDOWN_DURATION.get_int()
+    with db.atomic() as transaction:
+        # Claim the Devil Fruit, only succeeds if it's still scheduled. The row lock is held by
+        # the winner until the end of the transaction
+        claimed_count: int = (
+            DevilFruit.update(status=DevilFruitStatus.COLLECTED)
+            .where(
+                (DevilFruit.id == devil_fruit_id)
+                & (DevilFruit.status == DevilFruitStatus.SCHEDULED)
             )
+            .execute()
+        )
+        refresh_next_scheduled_release()
+
+        # Already claimed or no longer scheduled
+        if claimed_count == 0:
             return
 
+        devil_fruit: DevilFruit = DevilFruit.get_by_id(devil_fruit_id)
+
         # Release the Devil Fruit to the user
         text = phrases.DEVIL_FRUIT_RELEASE_MESSAGE_INFO.format(
             user.get_markdown_mention(),
@@ -325,9 +347,40 @@ async def release_devil_fruit_to_user(
             user.devil_fruit_collection_cooldown_end_date = get_next_bounty_reset_time()
         except (TelegramError, DevilFruitValidationException) as e:
             transaction.rollback()
+            refresh_next_scheduled_release()
             logging.error(f"Error giving devil fruit to user {user.tg_user_id}: {e}")
 
 
+def refresh_next_scheduled_release() -> None:
+    """
+    Load the next scheduled Devil Fruit release in memory
+    :return: None
+    """
+
+    global _next_scheduled_release, _next_scheduled_release_load_time
+
+    _next_scheduled_release = (
+        DevilFruit.select(DevilFruit.id, DevilFruit.release_date)
+        .where(DevilFruit.status == DevilFruitStatus.SCHEDULED)
+        .order_by(DevilFruit.release_date.asc())
+        .tuples()
+        .first()
+    )
+    _next_scheduled_release_load_time = time.monotonic()
+
+
+def get_next_scheduled_release() -> tuple[int, datetime] | None:
+    """
+    Get the next scheduled Devil Fruit release from memory
+    :return: A tuple of (Devil Fruit id, release date), None if no Devil Fruit is scheduled
+    """
+
+    if webhook_service.is_shared_state_stale(_next_scheduled_release_load_time):
+        refresh_next_scheduled_release()
+
+    return _next_scheduled_release
+
+
 def set_devil_fruit_release_date(devil_fruit: DevilFruit, is_new_release: bool = False) -> None:
     """
     Set the release date of a devil fruit
@@ -367,6 +420,7 @@ def set_devil_fruit_release_date(devil_fruit: DevilFruit, is_new_release: bool =
     devil_fruit.release_message_id = None
     devil_fruit.status = DevilFruitStatus.SCHEDULED
     devil_fruit.save()
+    refresh_next_scheduled_release()
 
 
 async def respawn_devil_fruit(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -421,13 +475,31 @@ def get_ability_value(
         crew: Crew = user.crew
         abilities.extend(crew.get_active_ability(ability_type))
 
-    if len(abilities) == 0:
+    return apply_ability_values(
+        ability_type, [ability.value for ability in abilities], value, add_to_value=add_to_value
+    )
+
+
+def apply_ability_values(
+    ability_type: DevilFruitAbilityType,
+    ability_values: list[int],
+    value: float,
+    add_to_value: bool = False,
+) -> float:
+    """
+    Given a value, gets the updated value after applying the abilities of a type
+    :param ability_type: The ability type
+    :param ability_values: The values of the Devil Fruit and crew abilities of the type
+    :param value: The value
+    :param add_to_value: Whether to add to the value
+    :return: The value
+    """
+
+    if len(ability_values) == 0:
         return value
 
     ability_type_sign: DevilFruitAbilityTypeSign = ability_type.get_sign()
-    ability_value = format_percentage_value(
-        get_cumulative_percentage_sum([ability.value for ability in abilities])
-    )
+    ability_value = format_percentage_value(get_cumulative_percentage_sum(ability_values))
 
     # Positive sign
     if ability_type_sign == DevilFruitAbilityTypeSign.POSITIVE:
@@ -0,0 +1,200 @@
+import asyncio
+import os
+import pathlib
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import httpx
+
+import constants as c
+import resources.Environment as Env
+import src.service.artifact_service as artifact_service
+from src.model.error.CustomException import DownloadException
+from src.utils.download_utils import generate_temp_file_path
+
+
+class ContentCache:
+    """
+    Content by key, the least recently used are evicted when the total size goes over the limit.
+    Thread safe, so that it can also be used from worker threads
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache
+        :param max_bytes: Maximum total size of the cached content
+        """
+        self.max_bytes: int = max_bytes
+        self.total_bytes: int = 0
+        self.items: OrderedDict[str, bytes] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a cached content
+        :param key: The key
+        :return: The content, None if not cached
+        """
+
+        with self.lock:
+            data = self.items.get(key)
+            if data is not None:
+                self.items.move_to_end(key)
+
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Cache a content, ignored if bigger than the cache
+        :param key: The key
+        :param data: The content
+        :return: None
+        """
+
+        if len(data) > self.max_bytes:
+            return
+
+        with self.lock:
+            previous = self.items.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+
+            self.items[key] = data
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.items.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+
+_client: httpx.AsyncClient | None = None
+_cache = ContentCache(Env.DOWNLOAD_CACHE_MAX_BYTES.get_int())
+# Downloads in progress by url, so that concurrent requests of the same url share one download
+_in_progress: dict[str, asyncio.Future] = {}
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the http client, created on first use and kept open until close is called
+    :return: The http client
+    """
+
+    global _client
+
+    if _client is None:
+        max_connections = Env.DOWNLOAD_MAX_CONNECTIONS.get_int()
+        _client = httpx.AsyncClient(
+            timeout=Env.DOWNLOAD_TIMEOUT_SECONDS.get_float(),
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            follow_redirects=True,
+        )
+
+    return _client
+
+
+async def close() -> None:
+    """
+    Close the http client
+    :return: None
+    """
+
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def fetch(url: str) -> bytes:
+    """
+    Download a url, without cache. The response is streamed and the download is interrupted as
+    soon as it goes over the maximum size
+    :param url: The url
+    :return: The content
+    """
+
+    max_bytes = Env.DOWNLOAD_MAX_BYTES.get_int()
+    chunks: list[bytes] = []
+    size = 0
+    try:
+        async with get_client().stream("GET", url) as response:
+            response.raise_for_status()
+            if int(response.headers.get("content-length", 0)) > max_bytes:
+                raise DownloadException(f"Download of {url} is larger than {max_bytes} bytes")
+
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    raise DownloadException(f"Download of {url} is larger than {max_bytes} bytes")
+                chunks.append(chunk)
+    except httpx.HTTPError as e:
+        raise DownloadException(f"Download of {url} failed: {e}") from e
+
+    return b"".join(chunks)
+
+
+async def download(url: str) -> bytes:
+    """
+    Download a url. The content is cached and concurrent downloads of the same url are merged
+    :param url: The url
+    :return: The content
+    """
+
+    data = _cache.get(url)
+    if data is not None:
+        return data
+
+    # Already being downloaded, wait for it
+    if url in _in_progress:
+        return await asyncio.shield(_in_progress[url])
+
+    future = asyncio.get_running_loop().create_future()
+    _in_progress[url] = future
+    try:
+        data = await fetch(url)
+        _cache.put(url, data)
+        future.set_result(data)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Retrieve the exception so that it's not logged if no one else was waiting
+        future.exception()
+        raise
+    finally:
+        _in_progress.pop(url, None)
+
+    return data
+
+
+async def download_temp_file(url: str, extension: str = None) -> str:
+    """
+    Download a url to the temp folder
+    :param url: The url
+    :param extension: File extension, if None it's taken from the url
+    :return: The path of the downloaded file
+    """
+
+    data = await download(url)
+
+    extension = pathlib.Path(urlparse(url).path).suffix if extension is None else extension
+    file_path = generate_temp_file_path(extension)
+    await asyncio.to_thread(write_file, file_path, data)
+
+    return artifact_service.register(file_path)
+
+
+def write_file(file_path: str, data: bytes) -> None:
+    """
+    Write a file, creating the temp folder if needed
+    :param file_path: The path of the file
+    :param data: The content
+    :return: None
+    """
+
+    os.makedirs(c.TEMP_DIR, exist_ok=True)
+    with open(file_path, "wb") as file:
+        file.write(data)
@@ -0,0 +1,111 @@
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Type
+
+from peewee import Expression
+
+from src.model.BaseModel import BaseModel
+
+# Maximum number of rows updated or handed to the expired handler at once
+CHUNK_SIZE = 500
+
+
+class ExpiryRun:
+    """
+    Result of a run of an expiry job
+    """
+
+    def __init__(self, name: str, processed_count: int, duration_seconds: float):
+        """
+        Initialize the expiry run
+        :param name: The name of the job
+        :param processed_count: How many rows were expired
+        :param duration_seconds: How long the run took
+        """
+        self.name: str = name
+        self.date: datetime = datetime.now()
+        self.processed_count: int = processed_count
+        self.duration_seconds: float = duration_seconds
+
+
+# Last run by job name
+_last_runs: dict[str, ExpiryRun] = {}
+
+
+def expire(model: Type[BaseModel], condition: Expression, values: dict[Any, Any]) -> list[int]:
+    """
+    Apply a state transition to all the rows matching the condition. The ids are selected and
+    locked, then updated in chunks, so that exactly the returned rows were transitioned
+    :param model: The model
+    :param condition: The condition of the expired rows
+    :param values: The values to set, as with Model.update
+    :return: The ids of the expired rows
+    """
+
+    database = model._meta.database
+    with database.atomic():
+        query = model.select(model.id).where(condition)
+        if database.for_update:
+            query = query.for_update()
+
+        ids: list[int] = [row_id for (row_id,) in query.tuples()]
+        for chunk in get_chunks(ids):
+            model.update(values).where(model.id.in_(chunk)).execute()
+
+    return ids
+
+
+async def run_expiry(
+    name: str,
+    model: Type[BaseModel],
+    condition: Expression,
+    values: dict[Any, Any],
+    on_expired: Callable[[list[int]], Awaitable[None]],
+) -> int:
+    """
+    Expire the rows matching the condition, then pass their ids to the handler in chunks
+    :param name: The name of the job, used for logging
+    :param model: The model
+    :param condition: The condition of the expired rows
+    :param values: The values to set, as with Model.update
+    :param on_expired: The handler of a chunk of expired ids, for example to send notifications
+    :return: How many rows were expired
+    """
+
+    start = time.perf_counter()
+    ids = expire(model, condition, values)
+
+    for chunk in get_chunks(ids):
+        try:
+            await on_expired(chunk)
+        except Exception as e:
+            logging.error(f"Error while handling expired {name} {chunk}: {e}", exc_info=True)
+
+    run = ExpiryRun(name, len(ids), time.perf_counter() - start)
+    _last_runs[name] = run
+    if run.processed_count > 0:
+        logging.info(
+            f"Expired {run.processed_count} {name} in {run.duration_seconds * 1000:.0f} ms"
+        )
+
+    return run.processed_count
+
+
+def get_chunks(ids: list[int]) -> list[list[int]]:
+    """
+    Split the ids in chunks of at most CHUNK_SIZE
+    :param ids: The ids
+    :return: The chunks
+    """
+
+    return [ids[i : i + CHUNK_SIZE] for i in range(0, len(ids), CHUNK_SIZE)]
+
+
+def get_last_runs() -> list[ExpiryRun]:
+    """
+    Get the last run of each expiry job
+    :return: The runs
+    """
+
+    return list(_last_runs.values())
@@ -1,37 +1,45 @@
-import asyncio
+import hashlib
 import json
 import logging
+import os
 from datetime import datetime, timedelta
 from typing import Tuple, Callable
 
-from peewee import DoesNotExist
 from telegram import Update
 from telegram.error import RetryAfter
 from telegram.ext import ContextTypes
 
+import constants as c
 import resources.Environment as Env
+import src.service.artifact_service as artifact_service
+import src.service.download_service as download_service
+import src.service.game_timer_service as game_timer_service
+import src.service.task_service as task_service
 from resources import phrases as phrases
 from src.model.Game import Game
+from src.model.GameTimer import GameTimer
 from src.model.GroupChat import GroupChat
 from src.model.User import User
 from src.model.enums.GameStatus import GameStatus
+from src.model.enums.GameTimerType import GameTimerType
 from src.model.enums.Notification import GameTurnNotification
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaType import SavedMediaType
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
 from src.model.error.GroupChatError import GroupChatError, GroupChatException
 from src.model.game.GameOutcome import GameOutcome
 from src.model.game.GameTurn import GameTurn
 from src.model.game.GameType import GameType
 from src.model.game.shambles.Shambles import Shambles
-from src.model.game.whoswho.WhosWho import WhosWho
 from src.model.pojo.Keyboard import Keyboard
 from src.model.wiki.Character import Character
 from src.model.wiki.Terminology import Terminology
 from src.service.bounty_service import add_or_remove_bounty, validate_amount
 from src.service.date_service import convert_seconds_to_duration, get_remaining_duration
+from src.service.expiry_service import run_expiry
 from src.service.message_service import (
     mention_markdown_user,
     delete_message,
@@ -130,6 +138,9 @@ async def end_game(
         opponent.save()
     game.save()
 
+    # Kept for a grace time, the final image may still be sent
+    artifact_service.release(artifact_service.get_game_owner(game.id))
+
     return game
 
 
@@ -203,7 +214,7 @@ def get_text(
 
 async def delete_game(
     context: ContextTypes.DEFAULT_TYPE,
-    update: Update,
+    update: Update | None,
     game: Game,
     should_delete_message: bool = True,
     show_timeout_message: bool = False,
@@ -211,7 +222,7 @@ async def delete_game(
     """
     Delete game
     :param context: The context
-    :param update: The update
+    :param update: The update, None if not triggered by a user
     :param game: The game
     :param should_delete_message: If the message should be deleted
     :param show_timeout_message: If the message should be edited showing timeout
@@ -229,7 +240,9 @@ async def delete_game(
             caption=phrases.GAME_TIMEOUT,
             edit_message_id=game.message_id,
             edit_only_caption_and_keyboard=True,
-            add_delete_button=True,
+            # Without an update, as when timed out by the game timer, the authorized users are
+            # unknown
+            add_delete_button=update is not None,
         )
     elif should_delete_message:
         # Try to delete message
@@ -239,6 +252,7 @@ async def delete_game(
             )
 
     # Delete game
+    artifact_service.release(artifact_service.get_game_owner(game.id))
     game.delete_instance()
 
 
@@ -331,23 +345,37 @@ async def end_inactive_games(context: ContextTypes.DEFAULT_TYPE) -> None:
     :return: None
     """
 
-    # Game
-    inactive_games = Game.select().where(
+    async def settle_games(game_ids: list[int]) -> None:
+        # Already set as forced end, so players can no longer interact with them
+        for game in Game.select().where(Game.id.in_(game_ids)):
+            try:
+                # All or nothing, so that a retry doesn't pay a player twice
+                with Game._meta.database.atomic():
+                    await end_game(game, GameOutcome.NONE, context, is_forced_end=True)
+                logging.info(f"Game {game.id} was ended due to inactivity")
+            except Exception as e:
+                logging.error(f"Error while ending inactive game {game.id}: {e}", exc_info=True)
+                # Settlement rolled back, back in progress so that it's settled by the next run
+                Game.update(status=GameStatus.IN_PROGRESS).where(
+                    (Game.id == game.id) & (Game.status == GameStatus.FORCED_END)
+                ).execute()
+
+    await run_expiry(
+        "inactive games",
+        Game,
         (Game.status == GameStatus.IN_PROGRESS)
         & (
             Game.last_interaction_date
             < (datetime.now() - timedelta(seconds=Env.GAME_INACTIVE_TIME.get_int()))
-        )
+        ),
+        {Game.status: GameStatus.FORCED_END},
+        settle_games,
     )
 
-    for game in inactive_games:
-        await end_game(game, GameOutcome.NONE, context, is_forced_end=True)
-        logging.info(f"Game {game.id} was ended due to inactivity")
-
 
 async def notify_game_turn(context: ContextTypes.DEFAULT_TYPE, game: Game, game_turn: GameTurn):
     """
-    Notify a user that it's their turn
+    Notify a user that it's their turn, if the game board is unchanged after N time
 
     :param context: The context
     :param game: The game
@@ -362,61 +390,101 @@ async def notify_game_turn(context: ContextTypes.DEFAULT_TYPE, game: Game, game_
         user_turn: User = game.opponent
         opponent: User = game.challenger
 
-    # Fire and forget
-    context.application.create_task(
-        enqueue_game_turn_notification(context, user_turn, opponent, game)
+    game_timer_service.schedule(
+        game,
+        GameTimerType.TURN_NOTIFICATION,
+        Env.GAME_TURN_NOTIFICATION_TIME.get_int(),
+        {"user_id": user_turn.id, "opponent_id": opponent.id, "board_hash": get_board_hash(game)},
     )
 
 
-async def enqueue_game_turn_notification(
-    context: ContextTypes.DEFAULT_TYPE, user: User, opponent: User, game: Game
-):
+async def send_game_turn_notification(
+    context: ContextTypes.DEFAULT_TYPE, game: Game, data: dict
+) -> None:
     """
-    Enqueue a game turn notification. Waits for N time and if the game board stays unchanged,
-    sends the notification
+    Send a scheduled game turn notification, if the game board is still the same
 
     :param context: The context
-    :param user: The user
-    :param opponent: The opponent
     :param game: The game
+    :param data: The data of the timer
     :return: None
     """
 
-    # Wait for N time
-    await asyncio.sleep(Env.GAME_TURN_NOTIFICATION_TIME.get_int())
+    if get_board_hash(game) != data["board_hash"]:
+        return
 
-    updated_game = Game.get_by_id(game.id)
+    user: User = User.get_by_id(data["user_id"])
+    opponent: User = User.get_by_id(data["opponent_id"])
+    await send_notification(context, user, GameTurnNotification(game, opponent))
 
-    # Check if the game board is still the same
-    if updated_game.board == game.board:
-        await send_notification(context, user, GameTurnNotification(game, opponent))
 
+def get_board_hash(game: Game) -> str | None:
+    """
+    Get the hash of the game board, to detect if it changed
 
-async def enqueue_game_timeout(context: ContextTypes.DEFAULT_TYPE, update: Update, game: Game):
+    :param game: The game
+    :return: The hash, None if the game has no board
     """
-    Enqueue a game timeout. Waits for N time and if the opponent doesn't accept,
-    the game is deleted
-    :param context: The context
-    :param update: The update
+
+    if game.board is None:
+        return None
+
+    return hashlib.sha1(game.board.encode()).hexdigest()
+
+
+def enqueue_game_timeout(game: Game) -> None:
+    """
+    Enqueue a game timeout. If the opponent doesn't accept within N time, the game is deleted
     :param game: The game
     :return: None
     """
 
-    # Wait for N time
-    await asyncio.sleep(Env.GAME_CONFIRMATION_TIMEOUT.get_int())
+    game_timer_service.schedule(
+        game, GameTimerType.CONFIRMATION_TIMEOUT, Env.GAME_CONFIRMATION_TIMEOUT.get_int()
+    )
 
-    try:
-        updated_game = Game.get_by_id(game.id)
-    except DoesNotExist:
-        return  # Game was cancelled
 
-    # Check if the game is still in the same state
-    if GameStatus(updated_game.status) == GameStatus.AWAITING_OPPONENT_CONFIRMATION:
+async def timeout_game_confirmation(context: ContextTypes.DEFAULT_TYPE, game: Game) -> None:
+    """
+    Delete a game if it's still waiting for the opponent confirmation
+    :param context: The context
+    :param game: The game
+    :return: None
+    """
+
+    if GameStatus(game.status) == GameStatus.AWAITING_OPPONENT_CONFIRMATION:
         await delete_game(
-            context, update, updated_game, should_delete_message=False, show_timeout_message=True
+            context, None, game, should_delete_message=False, show_timeout_message=True
         )
 
 
+async def run_game_timer(context: ContextTypes.DEFAULT_TYPE, game_timer: GameTimer) -> None:
+    """
+    Run an expired game timer
+    :param context: The context
+    :param game_timer: The game timer
+    :return: None
+    """
+
+    game: Game = game_timer.game
+    data: dict = game_timer.get_data()
+
+    match GameTimerType(game_timer.type):
+        case GameTimerType.TURN_NOTIFICATION:
+            await send_game_turn_notification(context, game, data)
+        case GameTimerType.CONFIRMATION_TIMEOUT:
+            await timeout_game_confirmation(context, game)
+        case GameTimerType.COUNTDOWN_TO_START:
+            await guess_game_countdown_to_start(
+                context,
+                game,
+                data["remaining_seconds"],
+                is_played_in_private_chat=data["is_played_in_private_chat"],
+            )
+        case _:
+            raise ValueError(f"Unknown game timer type {game_timer.type}")
+
+
 def get_players(game: Game) -> Tuple[User, User]:
     """
     Get the players of a game
@@ -459,7 +527,7 @@ async def set_user_private_screen(
     return
 
 
-def get_guess_game_final_image_path(game: Game) -> str:
+async def get_guess_game_final_image_path(game: Game) -> str:
     """
     Get the path of the final image of a guess game
 
@@ -471,7 +539,13 @@ def get_guess_game_final_image_path(game: Game) -> str:
 
     match game.type:
         case GameType.WHOS_WHO:
-            return WhosWho(**json_dict).image_path
+            image_path = json_dict.get("image_path")
+            if image_path is None or not os.path.isfile(image_path):
+                image_path = await download_service.download_temp_file(
+                    json_dict["character"]["anime_image_url"], "jpg"
+                )
+
+            return image_path
 
         case GameType.SHAMBLES:
             shambles: Shambles = Shambles(**json_dict)
@@ -499,20 +573,17 @@ def get_guess_game_result_term_text(terminology: Terminology):
 
 
 async def guess_game_countdown_to_start(
-    update: Update,
     context: ContextTypes.DEFAULT_TYPE,
     game: Game,
     remaining_seconds: int,
-    run_game_function: Callable,
     is_played_in_private_chat: bool = True,
 ) -> None:
     """
-    Countdown to start
-    :param update: The update object
+    Countdown to start. Updates the game message and schedules the next update, then runs the
+    game when the countdown is over
     :param context: The context object
     :param game: The game object
     :param remaining_seconds: The remaining time
-    :param run_game_function: The function to run when the countdown is over
     :param is_played_in_private_chat: If True, the game is played in private chat
     :return: None
     """
@@ -531,13 +602,14 @@ async def guess_game_countdown_to_start(
             await full_media_send(
                 context,
                 caption=ot_text,
-                update=update,
+                group_chat=game.group_chat,
+                edit_message_id=game.message_id,
                 keyboard=play_deeplink_button,
                 edit_only_caption_and_keyboard=True,
             )
 
         # Run game
-        await run_game_function(context, game)
+        await get_guess_game_run_function(GameType(game.type))(context, game)
         return
 
     # Update message
@@ -548,7 +620,8 @@ async def guess_game_countdown_to_start(
         await full_media_send(
             context,
             caption=ot_text,
-            update=update,
+            group_chat=game.group_chat,
+            edit_message_id=game.message_id,
             keyboard=play_deeplink_button,
             saved_media_name=game.get_saved_media_name(),
             ignore_bad_request_exception=True,
@@ -558,26 +631,39 @@ async def guess_game_countdown_to_start(
 
     # Update every 10 seconds if remaining time is more than 10 seconds, otherwise
     # update every 5 seconds
-    if remaining_seconds > 10:
-        await asyncio.sleep(10)
-        await guess_game_countdown_to_start(
-            update,
-            context,
-            game,
-            remaining_seconds - 10,
-            run_game_function,
-            is_played_in_private_chat=is_played_in_private_chat,
-        )
-    else:
-        await asyncio.sleep(5)
-        await guess_game_countdown_to_start(
-            update,
-            context,
-            game,
-            remaining_seconds - 5,
-            run_game_function,
-            is_played_in_private_chat=is_played_in_private_chat,
-        )
+    delay_seconds = 10 if remaining_seconds > 10 else 5
+    game_timer_service.schedule(
+        game,
+        GameTimerType.COUNTDOWN_TO_START,
+        delay_seconds,
+        {
+            "remaining_seconds": remaining_seconds - delay_seconds,
+            "is_played_in_private_chat": is_played_in_private_chat,
+        },
+    )
+
+
+def get_guess_game_run_function(game_type: GameType) -> Callable:
+    """
+    Get the function that runs a guess game once the countdown is over
+    :param game_type: The game type
+    :return: The function
+    """
+
+    # Imported here since the game screens depend on this module
+    match game_type:
+        case GameType.WHOS_WHO:
+            from src.chat.group.screens.screen_game_ww import run_game
+        case GameType.SHAMBLES:
+            from src.chat.group.screens.screen_game_shambles import run_game
+        case GameType.GUESS_OR_LIFE:
+            from src.chat.group.screens.screen_game_gol import run_game
+        case GameType.PUNK_RECORDS:
+            from src.chat.group.screens.screen_game_pr import run_game
+        case _:
+            raise ValueError(f"Game type {game_type} is not a guess game")
+
+    return run_game
 
 
 async def get_guess_game_users_to_send_message_to(
@@ -647,7 +733,7 @@ async def guess_game_validate_answer(
     ]]
 
     term_text_addition = get_guess_game_result_term_text(terminology)
-    image_path: str = get_guess_game_final_image_path(game)
+    image_path: str = await get_guess_game_final_image_path(game)
 
     # Send message to winner
     await set_user_private_screen(user, should_reset=True)
@@ -733,6 +819,44 @@ def save_game(game: Game, board: str) -> None:
     game.last_interaction_date = datetime.now()
     game.save()
 
+    register_game_artifacts(game)
+
+
+def register_game_artifacts(game: Game) -> None:
+    """
+    Register the temp files referenced by the game board as owned by the game, so that they are
+    kept until the game ends
+    :param game: The game
+    :return: None
+    """
+
+    if game.board is None:
+        return
+
+    board = json.loads(game.board)
+    if not isinstance(board, dict):
+        return
+
+    owner = artifact_service.get_game_owner(game.id)
+    for value in board.values():
+        if isinstance(value, str) and value.startswith(c.TEMP_DIR) and os.path.isfile(value):
+            artifact_service.register(value, owner=owner)
+
+
+def register_active_game_artifacts() -> int:
+    """
+    Register the temp files of all the games that are not finished, for example after a restart
+    :return: How many games were registered
+    """
+
+    games = Game.select(Game.id, Game.board).where(
+        (Game.status.not_in(GameStatus.get_finished())) & (Game.board.is_null(False))
+    )
+    for game in games:
+        register_game_artifacts(game)
+
+    return len(games)
+
 
 async def end_text_based_game(
     context: ContextTypes.DEFAULT_TYPE,
@@ -780,18 +904,20 @@ async def end_text_based_game(
 
     # Send message to winner
     await set_user_private_screen(winner, should_reset=True)
-    context.application.create_task(
+    task_service.submit(
+        TaskPoolType.BACKGROUND,
         full_message_send(
             context, winner_text, chat_id=winner.tg_user_id, keyboard=outbound_keyboard
-        )
+        ),
     )
 
     # Send message to loser
     await set_user_private_screen(loser, should_reset=True)
-    context.application.create_task(
+    task_service.submit(
+        TaskPoolType.BACKGROUND,
         full_message_send(
             context, loser_text, chat_id=loser.tg_user_id, keyboard=outbound_keyboard
-        )
+        ),
     )
 
     # Update group message
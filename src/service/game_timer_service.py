@@ -0,0 +1,327 @@
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from telegram.ext import Application, CallbackContext, ContextTypes
+
+import src.service.task_service as task_service
+from src.model.Game import Game
+from src.model.GameTimer import GameTimer
+from src.model.enums.GameTimerType import GameTimerType
+from src.model.enums.TaskPoolType import TaskPoolType
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel with a resolution of one tick. Each level has 2^slot_bits slots,
+    and a slot of a level spans a full rotation of the level below. Insert and cancel are O(1),
+    timers of the higher levels move to the lower ones when their slot is reached
+    """
+
+    def __init__(self, current_tick: int, slot_bits: int = 6, levels: int = 4):
+        """
+        Initialize the wheel
+        :param current_tick: The current tick
+        :param slot_bits: Number of bits of the slot index of each level
+        :param levels: Number of levels. Timers farther than the top level are kept in it and
+        re-inserted at each of its rotations
+        """
+        self.current_tick: int = current_tick
+        self.slot_bits: int = slot_bits
+        self.slot_mask: int = (1 << slot_bits) - 1
+        self.levels: int = levels
+        # Tick of each timer by timer id, for every slot of every level
+        self.slots: list[list[dict[int, int]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        # Slot of each timer, by timer id
+        self.locations: dict[int, dict[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def insert(self, timer_id: int, tick: int) -> None:
+        """
+        Insert a timer, replacing it if already present. A tick in the past expires on the next
+        advance
+        :param timer_id: The timer id
+        :param tick: The tick at which the timer expires
+        :return: None
+        """
+
+        self.cancel(timer_id)
+        self.place(timer_id, max(tick, self.current_tick + 1))
+
+    def place(self, timer_id: int, tick: int) -> None:
+        """
+        Put a timer in the slot of its tick
+        :param timer_id: The timer id
+        :param tick: The tick at which the timer expires, not before the current tick
+        :return: None
+        """
+
+        delta = tick - self.current_tick
+        level = 0
+        while level < self.levels - 1 and delta >> (self.slot_bits * (level + 1)) > 0:
+            level += 1
+
+        slot = self.slots[level][(tick >> (self.slot_bits * level)) & self.slot_mask]
+        slot[timer_id] = tick
+        self.locations[timer_id] = slot
+
+    def cancel(self, timer_id: int) -> bool:
+        """
+        Cancel a timer
+        :param timer_id: The timer id
+        :return: True if the timer was present
+        """
+
+        slot = self.locations.pop(timer_id, None)
+        if slot is None:
+            return False
+
+        del slot[timer_id]
+        return True
+
+    def advance(self, tick: int) -> list[int]:
+        """
+        Advance the wheel up to a tick
+        :param tick: The tick
+        :return: The ids of the expired timers
+        """
+
+        # Nothing to expire, skip the ticks in between
+        if len(self.locations) == 0:
+            self.current_tick = max(self.current_tick, tick)
+            return []
+
+        expired: list[int] = []
+        while self.current_tick < tick:
+            self.current_tick += 1
+            current_tick = self.current_tick
+
+            # Move the timers of the higher level slots that start at this tick
+            for level in range(1, self.levels):
+                if current_tick & ((1 << (self.slot_bits * level)) - 1) != 0:
+                    break
+
+                slot = self.slots[level][
+                    (current_tick >> (self.slot_bits * level)) & self.slot_mask
+                ]
+                timers = list(slot.items())
+                slot.clear()
+                for timer_id, timer_tick in timers:
+                    self.place(timer_id, timer_tick)
+
+            slot = self.slots[0][current_tick & self.slot_mask]
+            for timer_id in list(slot):
+                del slot[timer_id]
+                del self.locations[timer_id]
+                expired.append(timer_id)
+
+        return expired
+
+
+_wheel: TimingWheel = TimingWheel(int(time.time()))
+# Timer id by game id and timer type, a game has at most one timer of each type
+_timer_ids: dict[tuple[int, GameTimerType], int] = {}
+_wakeup: asyncio.Event | None = None
+_runner_task: asyncio.Task | None = None
+
+
+def get_tick(date: datetime) -> int:
+    """
+    Get the tick of a date
+    :param date: The date
+    :return: The tick, in seconds
+    """
+
+    return int(date.timestamp())
+
+
+def add_to_wheel(game_timer: GameTimer) -> None:
+    """
+    Add a saved timer to the wheel
+    :param game_timer: The timer
+    :return: None
+    """
+
+    key = (game_timer.game_id, GameTimerType(game_timer.type))
+    previous_timer_id = _timer_ids.get(key)
+    if previous_timer_id is not None:
+        _wheel.cancel(previous_timer_id)
+
+    # Not advanced while empty, catch up without going through the ticks in between
+    if len(_wheel) == 0:
+        _wheel.advance(int(time.time()))
+
+    _timer_ids[key] = game_timer.id
+    _wheel.insert(game_timer.id, get_tick(game_timer.execution_date))
+
+    # The runner waits without ticking while the wheel is empty
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+def schedule(
+    game: Game, timer_type: GameTimerType, delay_seconds: int, data: dict = None
+) -> GameTimer:
+    """
+    Schedule a timer of a game, replacing the pending timer of the same type
+    :param game: The game
+    :param timer_type: The timer type
+    :param delay_seconds: After how many seconds the timer expires
+    :param data: The data passed to the handler
+    :return: The timer
+    """
+
+    cancel(game, timer_type)
+
+    game_timer: GameTimer = GameTimer.create(
+        game=game,
+        type=timer_type,
+        execution_date=datetime.now() + timedelta(seconds=delay_seconds),
+        data=json.dumps(data) if data is not None else None,
+    )
+    add_to_wheel(game_timer)
+
+    return game_timer
+
+
+def cancel(game: Game, timer_type: GameTimerType) -> None:
+    """
+    Cancel the pending timer of a game
+    :param game: The game
+    :param timer_type: The timer type
+    :return: None
+    """
+
+    timer_id = _timer_ids.pop((game.id, timer_type), None)
+    if timer_id is not None:
+        _wheel.cancel(timer_id)
+
+    GameTimer.delete().where((GameTimer.game == game) & (GameTimer.type == timer_type)).execute()
+
+
+def load_pending() -> int:
+    """
+    Load all the pending timers from the database
+    :return: How many timers are pending
+    """
+
+    for game_timer in GameTimer.select():
+        add_to_wheel(game_timer)
+
+    return len(_wheel)
+
+
+async def run_timers(
+    application: Application,
+    handler: Callable[[ContextTypes.DEFAULT_TYPE, GameTimer], Awaitable[None]],
+) -> None:
+    """
+    Advance the wheel every second and run the expired timers, until cancelled
+    :param application: The application
+    :param handler: The handler of an expired timer
+    :return: None
+    """
+
+    while True:
+        if len(_wheel) == 0:
+            _wakeup.clear()
+            await _wakeup.wait()
+
+        # Wake up at the start of the next second
+        now = time.time()
+        await asyncio.sleep(int(now) + 1 - now)
+
+        for timer_id in _wheel.advance(int(time.time())):
+            task_service.submit(TaskPoolType.TIMERS, execute(application, handler, timer_id))
+
+
+async def execute(
+    application: Application,
+    handler: Callable[[ContextTypes.DEFAULT_TYPE, GameTimer], Awaitable[None]],
+    timer_id: int,
+) -> None:
+    """
+    Run an expired timer
+    :param application: The application
+    :param handler: The handler of an expired timer
+    :param timer_id: The timer id
+    :return: None
+    """
+
+    from src.chat.manage_message import init, end
+
+    db = init()
+    try:
+        game_timer: GameTimer = (
+            GameTimer.select(GameTimer, Game)
+            .join(Game)
+            .where(GameTimer.id == timer_id)
+            .get_or_none()
+        )
+        # Cancelled or game deleted in the meantime
+        if game_timer is None:
+            return
+
+        key = (game_timer.game_id, GameTimerType(game_timer.type))
+        if _timer_ids.get(key) == timer_id:
+            del _timer_ids[key]
+
+        # Deleted before running, so that it runs at most once
+        if GameTimer.delete().where(GameTimer.id == timer_id).execute() == 0:
+            return
+
+        await handler(CallbackContext(application), game_timer)
+    except Exception as e:
+        logging.error(f"Error while running game timer {timer_id}: {e}", exc_info=True)
+    finally:
+        end(db)
+
+
+def start(
+    application: Application,
+    handler: Callable[[ContextTypes.DEFAULT_TYPE, GameTimer], Awaitable[None]],
+    should_load_pending: bool = True,
+) -> None:
+    """
+    Load the pending timers and start running them
+    :param application: The application
+    :param handler: The handler of an expired timer
+    :param should_load_pending: If the pending timers should be loaded from the database
+    :return: None
+    """
+
+    global _wakeup, _runner_task
+
+    if _runner_task is not None:
+        return
+
+    _wheel.advance(int(time.time()))
+    if should_load_pending:
+        pending_count = load_pending()
+        logging.info(f"Loaded {pending_count} pending game timers")
+
+    _wakeup = asyncio.Event()
+    # Not created with the application, which waits for its tasks when stopping
+    _runner_task = asyncio.create_task(run_timers(application, handler))
+
+
+def stop() -> None:
+    """
+    Stop running the timers
+    :return: None
+    """
+
+    global _runner_task
+
+    if _runner_task is None:
+        return
+
+    _runner_task.cancel()
+    _runner_task = None
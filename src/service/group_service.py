@@ -5,11 +5,11 @@ from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
 import resources.Environment as Env
+import src.service.task_service as task_service
 from resources import phrases
 from src.model.BaseModel import BaseModel
 from src.model.Group import Group
 from src.model.GroupChat import GroupChat
-from src.model.GroupChatAutoDelete import GroupChatAutoDelete
 from src.model.GroupChatDisabledFeature import GroupChatDisabledFeature
 from src.model.GroupChatEnabledFeaturePin import GroupChatEnabledFeaturePin
 from src.model.GroupChatFeaturePinMessage import GroupChatFeaturePinMessage
@@ -19,8 +19,9 @@ from src.model.Prediction import Prediction
 from src.model.PredictionGroupChatMessage import PredictionGroupChatMessage
 from src.model.User import User
 from src.model.enums.Feature import Feature
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.pojo.Keyboard import Keyboard
-from src.service.message_service import full_message_send, delete_message
+from src.service.message_service import full_message_send
 
 
 def is_main_group(group_chat: GroupChat) -> bool:
@@ -135,7 +136,8 @@ async def broadcast_to_chats_with_feature_enabled_dispatch(
     :param filter_by_groups: The groups to filter by
     """
 
-    context.application.create_task(
+    task_service.submit(
+        TaskPoolType.BROADCASTS,
         broadcast_to_chats_with_feature_enabled(
             context,
             feature,
@@ -144,7 +146,7 @@ async def broadcast_to_chats_with_feature_enabled_dispatch(
             excluded_group_chats=excluded_group_chats,
             external_item=external_item,
             filter_by_groups=filter_by_groups,
-        )
+        ),
     )
 
 
@@ -243,7 +245,9 @@ async def unpin_feature_messages_dispatch(
     :param messages_to_unpin: The messages to unpin
     """
 
-    context.application.create_task(unpin_feature_messages(context, messages_to_unpin))
+    task_service.submit(
+        TaskPoolType.BROADCASTS, unpin_feature_messages(context, messages_to_unpin)
+    )
 
 
 async def unpin_feature_messages(
@@ -324,40 +328,3 @@ def save_group_chat_error(group_chat: GroupChat, error: str) -> None:
     group.last_error_date = datetime.now()
     group.last_error_message = error
     group.save()
-
-
-async def auto_delete(context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Auto delete messages
-    :param context: The context
-    """
-
-    # Get maximum 20 messages to auto delete
-    auto_deletes: list[GroupChatAutoDelete] = (
-        GroupChatAutoDelete.select()
-        .where(GroupChatAutoDelete.delete_date < datetime.now())
-        .limit(20)
-    )
-
-    for auto_delete_item in auto_deletes:
-        context.application.create_task(auto_delete_process(context, auto_delete_item))
-
-
-async def auto_delete_process(
-    context: ContextTypes.DEFAULT_TYPE, auto_delete_item: GroupChatAutoDelete
-) -> None:
-    """
-    Auto delete process
-    :param context: The context
-    :param auto_delete_item: The message
-    """
-
-    group_chat: GroupChat = auto_delete_item.group_chat
-    try:
-        await delete_message(
-            context=context, group_chat=group_chat, message_id=auto_delete_item.message_id
-        )
-    except TelegramError as te:
-        save_group_chat_error(group_chat, str(te))
-
-    auto_delete_item.delete_instance()
@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Type, TypeVar
+
+from src.model.BaseModel import BaseModel
+from src.model.User import User
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class IdentityMap:
+    """
+    Models already loaded while managing an update, so that they are not selected again.
+    Keys by model: User -> tg_user_id, Group -> tg_group_id, GroupChat -> (tg_group_id,
+    tg_topic_id), with Telegram ids as strings
+    """
+
+    def __init__(self):
+        self.items: dict[tuple[Type[BaseModel], Any], BaseModel] = {}
+        self.effective_user: User | None = None
+
+
+_current_identity_map: ContextVar[IdentityMap | None] = ContextVar(
+    "current_identity_map", default=None
+)
+
+
+@contextmanager
+def scope() -> Iterator[IdentityMap]:
+    """
+    Create the identity map of an update, available until the end of the block. Tasks created in
+    the block share it
+    :return: The identity map
+    """
+
+    identity_map = IdentityMap()
+    token = _current_identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current_identity_map.reset(token)
+
+
+def add(instance: BaseModel, key: Any) -> None:
+    """
+    Add a loaded model to the identity map of the current update, ignored if there is none
+    :param instance: The model instance
+    :param key: The key
+    :return: None
+    """
+
+    identity_map = _current_identity_map.get()
+    if identity_map is not None:
+        identity_map.items[(type(instance), key)] = instance
+
+
+def get(model: Type[T], key: Any) -> T | None:
+    """
+    Get a model from the identity map of the current update
+    :param model: The model class
+    :param key: The key
+    :return: The model instance, None if it was not loaded or there is no identity map
+    """
+
+    identity_map = _current_identity_map.get()
+    if identity_map is None:
+        return None
+
+    return identity_map.items.get((model, key))
+
+
+def set_effective_user(user: User) -> None:
+    """
+    Set the user that sent the current update and add it to the identity map
+    :param user: The user
+    :return: None
+    """
+
+    identity_map = _current_identity_map.get()
+    if identity_map is not None:
+        identity_map.effective_user = user
+        add(user, user.tg_user_id)
+
+
+def get_effective_user() -> User | None:
+    """
+    Get the user that sent the current update
+    :return: The user, None if not set or there is no identity map
+    """
+
+    identity_map = _current_identity_map.get()
+    if identity_map is None:
+        return None
+
+    return identity_map.effective_user
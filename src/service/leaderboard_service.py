@@ -1,11 +1,13 @@
 import datetime
 import logging
 
+from peewee import Value
 from telegram import Message
 from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
 import src.model.enums.LeaderboardRank as LeaderboardRank
+import src.service.task_service as task_service
 from resources import phrases as phrases, Environment as Env
 from src.model.Crew import Crew
 from src.model.Group import Group
@@ -18,6 +20,8 @@ from src.model.Warlord import Warlord
 from src.model.enums.Feature import Feature
 from src.model.enums.LeaderboardRank import LeaderboardRankIndex
 from src.model.enums.Location import get_first_new_world, get_last_paradise
+from src.model.enums.TaskPoolType import TaskPoolType
+from src.model.enums.crew.CrewRole import CrewRole
 from src.service.bounty_poster_service import reset_bounty_poster_limit
 from src.service.crew_service import warn_inactive_captains
 from src.service.date_service import (
@@ -58,16 +62,35 @@ def get_leaderboard_message(
 
     is_global = leaderboard.group is None
 
+    # Users are fetched together with the leaderboard users to avoid a query per row
+    leaderboard_users: list[LeaderboardUser] = list(
+        LeaderboardUser.select(LeaderboardUser, User)
+        .join(User)
+        .where(LeaderboardUser.leaderboard == leaderboard)
+        .order_by(LeaderboardUser.id.asc())
+    )
+
+    # Warlords of all warlord rows, in a single query
+    warlord_user_ids = [
+        lu.user.id
+        for lu in leaderboard_users
+        if LeaderboardRankIndex(lu.rank_index) is LeaderboardRankIndex.WARLORD
+    ]
+    warlords_by_user_id: dict[int, Warlord] = (
+        Warlord.get_latest_active_by_user_ids(warlord_user_ids)
+        if len(warlord_user_ids) > 0
+        else {}
+    )
+
     content_text = ""
     warlords_text = ""
     effective_users_count = 0
-    for index, leaderboard_user in enumerate(leaderboard.leaderboard_users):
-        leaderboard_user: LeaderboardUser = leaderboard_user
+    for leaderboard_user in leaderboard_users:
         user: User = leaderboard_user.user
 
         # Warlords
         if LeaderboardRankIndex(leaderboard_user.rank_index) is LeaderboardRankIndex.WARLORD:
-            warlord: Warlord = Warlord.get_latest_active_by_user(user)
+            warlord: Warlord = warlords_by_user_id[user.id]
             warlords_text += phrases.LEADERBOARD_WARLORD_ROW.format(
                 escape_valid_markdown_chars(warlord.epithet),
                 Log.get_deeplink_by_type(LogType.WARLORD, warlord.id),
@@ -96,18 +119,7 @@ def get_leaderboard_message(
     if warlords_text != "":
         warlords_text = phrases.LEADERBOARD_WARLORDS + warlords_text
 
-    crew_text = ""
-    crew_items_text = ""
-    total_crews = len(leaderboard.leaderboard_crews)
-    if is_global and total_crews > 0:
-        for index, leaderboard_crew in enumerate(leaderboard.leaderboard_crews):
-            leaderboard_crew: LeaderboardCrew = leaderboard_crew
-            crew_items_text += phrases.LEADERBOARD_CREW_ROW.format(
-                leaderboard_crew.position,
-                leaderboard_crew.crew.get_name_with_deeplink(add_level=True),
-                leaderboard_crew.captain.get_markdown_mention(),
-            )
-        crew_text = phrases.LEADERBOARD_CREW.format(total_crews, crew_items_text)
+    crew_text = get_leaderboard_crews_text(leaderboard) if is_global else ""
 
     return phrases.LEADERBOARD.format(
         local_global_text,
@@ -124,6 +136,37 @@ def get_leaderboard_message(
     )
 
 
+def get_leaderboard_crews_text(leaderboard: Leaderboard) -> str:
+    """
+    Gets the crews section of the leaderboard message
+    :param leaderboard: The leaderboard
+    :return: The crews section, empty if there are no crews
+    """
+
+    # Crews and captains are fetched together with the leaderboard crews
+    leaderboard_crews: list[LeaderboardCrew] = list(
+        LeaderboardCrew.select(LeaderboardCrew, Crew, User)
+        .join(Crew)
+        .switch(LeaderboardCrew)
+        .join(User)
+        .where(LeaderboardCrew.leaderboard == leaderboard)
+        .order_by(LeaderboardCrew.position.asc())
+    )
+
+    if len(leaderboard_crews) == 0:
+        return ""
+
+    crew_items_text = ""
+    for leaderboard_crew in leaderboard_crews:
+        crew_items_text += phrases.LEADERBOARD_CREW_ROW.format(
+            leaderboard_crew.position,
+            leaderboard_crew.crew.get_name_with_deeplink(add_level=True),
+            leaderboard_crew.captain.get_markdown_mention(),
+        )
+
+    return phrases.LEADERBOARD_CREW.format(len(leaderboard_crews), crew_items_text)
+
+
 async def send_leaderboard(context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Sends the weekly leaderboard to the group chat
@@ -140,7 +183,9 @@ async def send_leaderboard(context: ContextTypes.DEFAULT_TYPE) -> None:
     await manage_leaderboard(context, is_bounty_reset)
 
     # Reset bounty poster limit
-    context.application.create_task(reset_bounty_poster_limit(reset_previous_leaderboard=True))
+    task_service.submit(
+        TaskPoolType.TIMERS, reset_bounty_poster_limit(reset_previous_leaderboard=True)
+    )
 
     # Reset can join crew flag
     User.update(can_join_crew=True).execute()
@@ -151,7 +196,7 @@ async def send_leaderboard(context: ContextTypes.DEFAULT_TYPE) -> None:
     # Reset bounty if last leaderboard of the month
     now: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
     if is_bounty_reset:
-        context.application.create_task(reset_bounty(context))
+        task_service.submit(TaskPoolType.TIMERS, reset_bounty(context))
     # Second last leaderboard of the month
     elif should_reset_bounty(
         get_next_run(
@@ -160,13 +205,13 @@ async def send_leaderboard(context: ContextTypes.DEFAULT_TYPE) -> None:
         )
     ):
         # Warn captains about inactive crews
-        context.application.create_task(warn_inactive_captains(context))
+        task_service.submit(TaskPoolType.TIMERS, warn_inactive_captains(context))
 
     # Revoke eaten Devil Fruits from inactive users
-    context.application.create_task(revoke_devil_fruit_from_inactive_users(context))
+    task_service.submit(TaskPoolType.TIMERS, revoke_devil_fruit_from_inactive_users(context))
 
     # Warn inactive users with eaten Devil Fruits
-    context.application.create_task(warn_inactive_users_with_eaten_devil_fruit(context))
+    task_service.submit(TaskPoolType.TIMERS, warn_inactive_users_with_eaten_devil_fruit(context))
 
 
 async def manage_leaderboard(context: ContextTypes.DEFAULT_TYPE, is_bounty_reset: bool) -> None:
@@ -183,10 +228,12 @@ async def manage_leaderboard(context: ContextTypes.DEFAULT_TYPE, is_bounty_reset
     # Get all active groups
     groups: list[Group] = Group.select().where(Group.is_active == True).order_by(Group.id.asc())
 
-    # Create and send local leaderboards
+    # Create and send local leaderboards. They are saved as the weekly state of the group, so they
+    # wait for room in the pool instead of being shed
     for group in groups:
-        context.application.create_task(
-            create_and_send_leaderboard(context, is_bounty_reset, group, global_leaderboard)
+        await task_service.submit_with_backpressure(
+            TaskPoolType.BROADCASTS,
+            create_and_send_leaderboard(context, is_bounty_reset, group, global_leaderboard),
         )
 
 
@@ -246,7 +293,7 @@ async def create_and_send_leaderboard(
 
     # Create the leaderboard users and crew
     create_leaderboard_users(leaderboard, group)
-    create_leaderboard_crews(leaderboard)
+    create_leaderboard_crews(leaderboard, global_leaderboard)
 
     # Send message to chats
     if Env.SEND_MESSAGE_LEADERBOARD.get_bool():
@@ -329,8 +376,8 @@ def create_leaderboard_users(
 
     # Eligible users for Pirate King position - Those who were Emperor or higher in the previous
     # leaderboard
-    eligible_pk_users: list[User] = [
-        leaderboard_user.user
+    eligible_pk_user_ids: list[int] = [
+        leaderboard_user.user_id
         for leaderboard_user in previous_leaderboard_users
         if leaderboard_user.rank_index <= LeaderboardRank.EMPEROR.index
     ]
@@ -351,7 +398,7 @@ def create_leaderboard_users(
 
     # Save Pirate King, if available
     for user in new_world_users:
-        if user in eligible_pk_users:
+        if user.id in eligible_pk_user_ids:
             leaderboard_user: LeaderboardUser = save_leaderboard_user(
                 leaderboard, user, position, LeaderboardRank.PIRATE_KING
             )
@@ -423,36 +470,66 @@ def create_leaderboard_users(
         return leaderboard_users
 
 
-def create_leaderboard_crews(leaderboard: Leaderboard) -> list[LeaderboardCrew]:
+def create_leaderboard_crews(
+    leaderboard: Leaderboard, global_leaderboard: Leaderboard = None
+) -> None:
     """
-    Creates a leaderboard list
+    Creates the leaderboard crews
     :param leaderboard: The leaderboard to create the crews for
-    :return: The leaderboard crews
+    :param global_leaderboard: The global leaderboard. If provided, its crews are copied instead
+    of being computed again
+    :return: None
     """
 
-    leaderboard_crews: list[LeaderboardCrew] = []
-
-    # Get active crews that are visible in search, ordered by level and total chest
+    if global_leaderboard is not None:
+        LeaderboardCrew.insert_from(
+            LeaderboardCrew.select(
+                Value(leaderboard.id),
+                LeaderboardCrew.crew,
+                LeaderboardCrew.captain,
+                LeaderboardCrew.position,
+                LeaderboardCrew.level,
+                LeaderboardCrew.total_chest_amount,
+            ).where(LeaderboardCrew.leaderboard == global_leaderboard),
+            [
+                LeaderboardCrew.leaderboard,
+                LeaderboardCrew.crew,
+                LeaderboardCrew.captain,
+                LeaderboardCrew.position,
+                LeaderboardCrew.level,
+                LeaderboardCrew.total_chest_amount,
+            ],
+        ).execute()
+        return
+
+    # Get active crews that are visible in search, ordered by level and total chest, together
+    # with their captain
     crews: list[Crew] = (
-        Crew.select()
+        Crew.select(Crew, User)
+        .join(
+            User,
+            on=((User.crew == Crew.id) & (User.crew_role == CrewRole.CAPTAIN)),
+            attr="captain",
+        )
         .where((Crew.is_active == True) & (Crew.allow_view_in_search == True))
         .order_by(Crew.level.desc(), Crew.total_gained_chest_amount.desc())
         .limit(Env.LEADERBOARD_CREW_LIMIT.get_int())
     )
 
-    for index, crew in enumerate(crews):
-        leaderboard_crew: LeaderboardCrew = LeaderboardCrew()
-        leaderboard_crew.leaderboard = leaderboard
-        leaderboard_crew.crew = crew
-        leaderboard_crew.captain = crew.get_captain()
-        leaderboard_crew.position = index + 1
-        leaderboard_crew.level = crew.level
-        leaderboard_crew.total_chest_amount = crew.total_gained_chest_amount
-        leaderboard_crew.save()
-
-        leaderboard_crews.append(leaderboard_crew)
+    rows = [
+        {
+            LeaderboardCrew.leaderboard: leaderboard,
+            LeaderboardCrew.crew: crew,
+            LeaderboardCrew.captain: crew.captain,
+            LeaderboardCrew.position: index + 1,
+            LeaderboardCrew.level: crew.level,
+            LeaderboardCrew.total_chest_amount: crew.total_gained_chest_amount,
+        }
+        for index, crew in enumerate(crews)
+    ]
 
-    return leaderboard_crews
+    if len(rows) > 0:
+        LeaderboardCrew.insert_many(rows).execute()
 
 
 def save_leaderboard_user(
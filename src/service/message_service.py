@@ -1,7 +1,6 @@
 import base64
 import json
 import logging
-import re
 import traceback
 from uuid import uuid4
 
@@ -21,11 +20,13 @@ from telegram import (
 )
 from telegram.error import BadRequest, TelegramError, Forbidden
 from telegram.ext import ContextTypes
-from telegram.helpers import mention_markdown
 
 import constants as c
 import resources.Environment as Env
 import resources.phrases as phrases
+import src.service.identity_map_service as identity_map_service
+import src.service.task_service as task_service
+import src.service.text_render_service as text_render_service
 from src.model.Group import Group
 from src.model.GroupChat import GroupChat
 from src.model.GroupChatAutoDelete import GroupChatAutoDelete
@@ -37,6 +38,7 @@ from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaName import SavedMediaName
 from src.model.enums.SavedMediaType import SavedMediaType
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.pojo.ContextDataValue import ContextDataValue
 from src.model.pojo.Keyboard import Keyboard
 from src.service.bot_service import set_bot_context_data, get_bot_context_data
@@ -49,14 +51,7 @@ def escape_invalid_markdown_chars(text: str) -> str:
     :return: Escaped text
     """
 
-    escape_chars = r"~#+-=|{}.!"
-
-    text = re.sub(f"([{re.escape(escape_chars)}])", r"\\\1", text)
-
-    # Escape eventual quadruple backslashes with a double backslash
-    text = text.replace("\\\\", "\\")
-
-    return text
+    return text_render_service.escape_invalid_markdown_chars(text)
 
 
 def escape_valid_markdown_chars(text: str) -> str:
@@ -66,9 +61,7 @@ def escape_valid_markdown_chars(text: str) -> str:
     :return: Escaped text
     """
 
-    escape_chars = r"_*[]()>"
-
-    return re.sub(f"([{re.escape(escape_chars)}])", r"\\\1", text)
+    return text_render_service.escape_valid_markdown_chars(text)
 
 
 def get_chat_id(
@@ -145,12 +138,19 @@ async def get_keyboard(
     try:
         # Current user not in authorized users
         if not any(int(u.tg_user_id) == update.effective_user.id for u in authorized_users):
-            # Get the user that sent the update. Could per user parameter,but to be sure let's
-            # re-select it
-            user_from_update: User = User.get(
-                User.tg_user_id
-                == await get_effective_tg_user_id(update.effective_user, update.effective_message)
-            )
+            # Get the user that sent the update, already loaded if managing the update. Checked
+            # against the update, in case the identity map is of another update
+            user_from_update: User = identity_map_service.get_effective_user()
+            if (
+                user_from_update is None
+                or int(user_from_update.tg_user_id) != update.effective_user.id
+            ):
+                user_from_update = User.get(
+                    User.tg_user_id
+                    == await get_effective_tg_user_id(
+                        update.effective_user, update.effective_message
+                    )
+                )
             authorized_users.append(user_from_update)
     except AttributeError:
         pass
@@ -487,7 +487,9 @@ async def full_message_send(
 
             # Enqueue for auto deletion
             if should_auto_delete:
-                context.application.create_task(enqueue_message_auto_delete(group_chat, message))
+                task_service.submit(
+                    TaskPoolType.BACKGROUND, enqueue_message_auto_delete(group_chat, message)
+                )
 
             return message
         except TelegramError as e:
@@ -522,7 +524,9 @@ async def full_message_send(
     )
 
     if should_auto_delete:
-        context.application.create_task(enqueue_message_auto_delete(group_chat, message))
+        task_service.submit(
+            TaskPoolType.BACKGROUND, enqueue_message_auto_delete(group_chat, message)
+        )
 
     return message
 
@@ -770,7 +774,9 @@ async def full_media_send(
 
             # Enqueue for auto deletion
             if should_auto_delete:
-                context.application.create_task(enqueue_message_auto_delete(group_chat, message))
+                task_service.submit(
+                    TaskPoolType.BACKGROUND, enqueue_message_auto_delete(group_chat, message)
+                )
 
             return message
 
@@ -797,7 +803,9 @@ async def full_media_send(
             )
             # Enqueue for auto deletion
             if should_auto_delete:
-                context.application.create_task(enqueue_message_auto_delete(group_chat, message))
+                task_service.submit(
+                    TaskPoolType.BACKGROUND, enqueue_message_auto_delete(group_chat, message)
+                )
 
             return message
 
@@ -811,7 +819,9 @@ async def full_media_send(
             )
             # Enqueue for auto deletion
             if should_auto_delete:
-                context.application.create_task(enqueue_message_auto_delete(group_chat, message))
+                task_service.submit(
+                    TaskPoolType.BACKGROUND, enqueue_message_auto_delete(group_chat, message)
+                )
 
             return message
 
@@ -827,7 +837,9 @@ async def full_media_send(
         )
         # Enqueue for auto deletion
         if should_auto_delete:
-            context.application.create_task(enqueue_message_auto_delete(group_chat, message))
+            task_service.submit(
+                TaskPoolType.BACKGROUND, enqueue_message_auto_delete(group_chat, message)
+            )
 
         return message
 
@@ -981,7 +993,7 @@ def mention_markdown_v2(user_id: int | str, name: str) -> str:
     """
     Create a mention markdown v2
     """
-    return mention_markdown(user_id, name, 2)
+    return text_render_service.mention_markdown_v2(user_id, name)
 
 
 def mention_markdown_user(user: User) -> str:
@@ -1488,14 +1500,19 @@ def get_group_chat_from_update(update: Update) -> GroupChat | None:
     :return: The group chat
     """
 
-    group = Group.get_or_none(Group.tg_group_id == update.effective_chat.id)
-    if group is None:
-        return
-
     tg_topic_id = None
     if update.effective_chat.is_forum and update.effective_message.is_topic_message:
         tg_topic_id = update.effective_message.message_thread_id
 
+    # Already loaded if managing the update
+    group_chat = identity_map_service.get(GroupChat, (str(update.effective_chat.id), tg_topic_id))
+    if group_chat is not None:
+        return group_chat
+
+    group = Group.get_or_none(Group.tg_group_id == update.effective_chat.id)
+    if group is None:
+        return
+
     group_chat = GroupChat.get_or_none(
         (GroupChat.group == group) & (GroupChat.tg_topic_id == tg_topic_id)
     )
@@ -1538,6 +1555,7 @@ async def enqueue_message_auto_delete(group_chat: GroupChat, message: Message):
     :param group_chat: The group chat
     :param message: The message
     """
+    from src.service.auto_delete_service import enqueue
     from src.service.date_service import get_datetime_in_future_minutes
 
     if group_chat.auto_delete_duration is None:
@@ -1548,3 +1566,4 @@ async def enqueue_message_auto_delete(group_chat: GroupChat, message: Message):
     auto_delete.message_id = message.message_id
     auto_delete.delete_date = get_datetime_in_future_minutes(group_chat.auto_delete_duration)
     auto_delete.save()
+    enqueue(auto_delete)
@@ -0,0 +1,356 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from peewee import Database
+from telegram.request import HTTPXRequest, RequestData
+
+import resources.Environment as Env
+import src.service.task_service as task_service
+from src.model.enums.TraceKind import TraceKind
+
+# Upper bounds of the duration histogram buckets, in seconds
+DURATION_BUCKETS: list[float] = [0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+
+class Trace:
+    """
+    Measurements of a running update, screen or timer
+    """
+
+    def __init__(self, kind: TraceKind, name: str, parent: "Trace" = None):
+        """
+        Initialize the trace
+        :param kind: The kind of traced operation
+        :param name: The name, for example the screen or timer name
+        :param parent: The enclosing trace, which also receives the measurements
+        """
+        self.kind: TraceKind = kind
+        self.name: str = name
+        self.parent: Trace | None = parent
+        self.start: float = time.perf_counter()
+        self.query_count: int = 0
+        self.query_seconds: float = 0
+        self.api_call_count: int = 0
+        self.api_seconds: float = 0
+        # Count and total time by statement, parameters excluded so that N+1 queries add up
+        self.queries: dict[str, list] = {}
+
+    def add_query(self, sql: str, seconds: float) -> None:
+        """
+        Add an executed query to this trace and its parents
+        :param sql: The statement
+        :param seconds: How long it took
+        :return: None
+        """
+
+        trace = self
+        while trace is not None:
+            trace.query_count += 1
+            trace.query_seconds += seconds
+            totals = trace.queries.setdefault(sql, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+            trace = trace.parent
+
+    def add_api_call(self, seconds: float) -> None:
+        """
+        Add a Telegram API call to this trace and its parents
+        :param seconds: How long it took
+        :return: None
+        """
+
+        trace = self
+        while trace is not None:
+            trace.api_call_count += 1
+            trace.api_seconds += seconds
+            trace = trace.parent
+
+    def get_top_queries_text(self, limit: int) -> str:
+        """
+        Get the queries that took the most time
+        :param limit: How many queries
+        :return: One line per query with count and total time
+        """
+
+        top_queries = sorted(self.queries.items(), key=lambda item: item[1][1], reverse=True)
+        return "\n".join(
+            f"  {count}x {seconds * 1000:.1f} ms: {sql}"
+            for sql, (count, seconds) in top_queries[:limit]
+        )
+
+
+class TraceStats:
+    """
+    Aggregated measurements of all the traces with the same kind and name
+    """
+
+    def __init__(self):
+        """
+        Initialize the stats
+        """
+        self.count: int = 0
+        self.slow_count: int = 0
+        self.seconds: float = 0
+        self.bucket_counts: list[int] = [0] * len(DURATION_BUCKETS)
+        self.query_count: int = 0
+        self.query_seconds: float = 0
+        self.api_call_count: int = 0
+        self.api_seconds: float = 0
+
+    def add(self, trace: Trace, seconds: float, is_slow: bool) -> None:
+        """
+        Add a finished trace
+        :param trace: The trace
+        :param seconds: How long it took
+        :param is_slow: Whether it was slower than the threshold
+        :return: None
+        """
+
+        self.count += 1
+        self.slow_count += int(is_slow)
+        self.seconds += seconds
+        for index, bucket in enumerate(DURATION_BUCKETS):
+            if seconds <= bucket:
+                self.bucket_counts[index] += 1
+        self.query_count += trace.query_count
+        self.query_seconds += trace.query_seconds
+        self.api_call_count += trace.api_call_count
+        self.api_seconds += trace.api_seconds
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_stats: dict[tuple[TraceKind, str], TraceStats] = {}
+# Calls and total time by Telegram API endpoint
+_api_stats: dict[str, list] = {}
+_is_installed: bool = False
+
+
+def install() -> None:
+    """
+    Hook the query execution of peewee so that queries are measured
+    :return: None
+    """
+
+    global _is_installed
+
+    if _is_installed:
+        return
+
+    original_execute_sql = Database.execute_sql
+
+    def execute_sql(database, sql, params=None, *args, **kwargs):
+        trace = _current_trace.get()
+        if trace is None:
+            return original_execute_sql(database, sql, params, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return original_execute_sql(database, sql, params, *args, **kwargs)
+        finally:
+            trace.add_query(sql, time.perf_counter() - start)
+
+    Database.execute_sql = execute_sql
+    _is_installed = True
+
+
+@contextmanager
+def trace(kind: TraceKind, name: str) -> Iterator[None]:
+    """
+    Measure the code run inside the context, if metrics are enabled
+    :param kind: The kind of traced operation
+    :param name: The name, for example the screen or timer name
+    """
+
+    if not _is_installed:
+        yield
+        return
+
+    current = Trace(kind, name, parent=_current_trace.get())
+    token = _current_trace.set(current)
+    try:
+        yield
+    finally:
+        _current_trace.reset(token)
+        seconds = time.perf_counter() - current.start
+        threshold = Env.METRICS_SLOW_TRACE_THRESHOLD_MILLISECONDS.get_int() / 1000
+        is_slow = seconds >= threshold
+
+        _stats.setdefault((kind, name), TraceStats()).add(current, seconds, is_slow)
+
+        if is_slow:
+            logging.warning(
+                f"Slow {kind} {name}: {seconds * 1000:.0f} ms, {current.query_count} queries"
+                f" ({current.query_seconds * 1000:.0f} ms), {current.api_call_count} Telegram"
+                f" API calls ({current.api_seconds * 1000:.0f} ms). Top queries:\n"
+                + current.get_top_queries_text(Env.METRICS_SLOW_TRACE_TOP_QUERIES.get_int())
+            )
+
+
+class InstrumentedHTTPXRequest(HTTPXRequest):
+    """
+    Request backend that measures the Telegram API calls
+    """
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: RequestData = None,
+        read_timeout=HTTPXRequest.DEFAULT_NONE,
+        write_timeout=HTTPXRequest.DEFAULT_NONE,
+        connect_timeout=HTTPXRequest.DEFAULT_NONE,
+        pool_timeout=HTTPXRequest.DEFAULT_NONE,
+    ) -> tuple[int, bytes]:
+        start = time.perf_counter()
+        try:
+            return await super().do_request(
+                url,
+                method,
+                request_data=request_data,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+        finally:
+            seconds = time.perf_counter() - start
+            endpoint = url.rsplit("/", 1)[-1]
+            totals = _api_stats.setdefault(endpoint, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+
+            current = _current_trace.get()
+            if current is not None:
+                current.add_api_call(seconds)
+
+
+def get_metrics_text() -> str:
+    """
+    Get the metrics in the Prometheus text format
+    :return: The metrics
+    """
+
+    lines = [
+        "# HELP bot_trace_duration_seconds Duration of updates, screens and timers",
+        "# TYPE bot_trace_duration_seconds histogram",
+    ]
+    for (kind, name), stats in _stats.items():
+        labels = f'kind="{kind}",name="{name}"'
+        for bucket, bucket_count in zip(DURATION_BUCKETS, stats.bucket_counts):
+            lines.append(
+                f'bot_trace_duration_seconds_bucket{{{labels},le="{bucket}"}} {bucket_count}'
+            )
+        lines.append(f'bot_trace_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+        lines.append(f"bot_trace_duration_seconds_sum{{{labels}}} {stats.seconds}")
+        lines.append(f"bot_trace_duration_seconds_count{{{labels}}} {stats.count}")
+
+    for metric, help_text, attribute in [
+        ("bot_trace_slow_total", "Traces slower than the threshold", "slow_count"),
+        ("bot_trace_db_queries_total", "Database queries", "query_count"),
+        ("bot_trace_db_query_seconds_total", "Time spent in database queries", "query_seconds"),
+        ("bot_trace_telegram_api_calls_total", "Telegram API calls", "api_call_count"),
+        (
+            "bot_trace_telegram_api_seconds_total",
+            "Time spent in Telegram API calls",
+            "api_seconds",
+        ),
+    ]:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for (kind, name), stats in _stats.items():
+            lines.append(f'{metric}{{kind="{kind}",name="{name}"}} {getattr(stats, attribute)}')
+
+    lines += [
+        "# HELP bot_telegram_api_calls_total Telegram API calls by endpoint",
+        "# TYPE bot_telegram_api_calls_total counter",
+    ]
+    lines += [
+        f'bot_telegram_api_calls_total{{endpoint="{endpoint}"}} {count}'
+        for endpoint, (count, _) in _api_stats.items()
+    ]
+    lines += [
+        "# HELP bot_telegram_api_seconds_total Time spent in Telegram API calls by endpoint",
+        "# TYPE bot_telegram_api_seconds_total counter",
+    ]
+    lines += [
+        f'bot_telegram_api_seconds_total{{endpoint="{endpoint}"}} {seconds}'
+        for endpoint, (_, seconds) in _api_stats.items()
+    ]
+
+    pools = task_service.get_pools()
+    for metric, metric_type, help_text, get_value in [
+        ("bot_task_pool_running", "gauge", "Running tasks", lambda p: len(p.running_tasks)),
+        ("bot_task_pool_queued", "gauge", "Tasks waiting to run", lambda p: len(p.queue)),
+        (
+            "bot_task_pool_submitted_total",
+            "counter",
+            "Submitted tasks",
+            lambda p: p.submitted_count,
+        ),
+        (
+            "bot_task_pool_completed_total",
+            "counter",
+            "Completed tasks",
+            lambda p: p.completed_count,
+        ),
+        ("bot_task_pool_failed_total", "counter", "Failed tasks", lambda p: p.failed_count),
+        ("bot_task_pool_shed_total", "counter", "Tasks dropped when full", lambda p: p.shed_count),
+        (
+            "bot_task_pool_wait_seconds_total",
+            "counter",
+            "Time spent by tasks in the queue",
+            lambda p: p.wait_seconds,
+        ),
+    ]:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {metric_type}"]
+        lines += [f'{metric}{{pool="{pool.pool_type}"}} {get_value(pool)}' for pool in pools]
+
+    return "\n".join(lines) + "\n"
+
+
+async def handle_metrics_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Answer a request to the metrics endpoint
+    :param reader: The request stream
+    :param writer: The response stream
+    :return: None
+    """
+
+    try:
+        request_line = (await reader.readline()).decode(errors="ignore").split(" ")
+        # Skip the headers
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+
+        if len(request_line) > 1 and request_line[1] == "/metrics":
+            status, body = "200 OK", get_metrics_text()
+        else:
+            status, body = "404 Not Found", ""
+
+        payload = body.encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n"
+            ).encode()
+            + payload
+        )
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(port: int) -> asyncio.Server:
+    """
+    Start the metrics endpoint
+    :param port: The port
+    :return: The server
+    """
+
+    server = await asyncio.start_server(handle_metrics_request, Env.METRICS_HOST.get(), port)
+    logging.info(f"Metrics available at http://{Env.METRICS_HOST.get()}:{port}/metrics")
+
+    return server
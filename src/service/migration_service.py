@@ -0,0 +1,130 @@
+import logging
+from typing import Callable
+
+from peewee import Database, Field, Model
+from playhouse.migrate import MySQLMigrator, SchemaMigrator, migrate, make_index_name
+
+from src.model.BaseModel import db_obj
+from src.model.SchemaMigration import SchemaMigration
+
+
+class Migration:
+    """
+    A versioned schema migration
+    """
+
+    def __init__(self, version: int, name: str, upgrade: Callable[[Database], None]):
+        """
+        Initialize the migration
+        :param version: The version, migrations are applied in ascending order
+        :param name: The name
+        :param upgrade: The function that applies the migration
+        """
+        self.version: int = version
+        self.name: str = name
+        self.upgrade: Callable[[Database], None] = upgrade
+
+    def __str__(self) -> str:
+        return f"{self.version:04d}_{self.name}"
+
+
+def get_migrations() -> list[Migration]:
+    """
+    Get all the migrations, in order of version
+    :return: The migrations
+    """
+
+    from src.migration import (
+        m0001_initial_schema,
+        m0002_secondary_indexes,
+        m0003_game_timer,
+        m0004_timer_lease,
+        m0005_bounty_ledger,
+        m0006_crew_member_count,
+        m0007_nullable_columns,
+    )
+
+    return [
+        Migration(1, "initial_schema", m0001_initial_schema.upgrade),
+        Migration(2, "secondary_indexes", m0002_secondary_indexes.upgrade),
+        Migration(3, "game_timer", m0003_game_timer.upgrade),
+        Migration(4, "timer_lease", m0004_timer_lease.upgrade),
+        Migration(5, "bounty_ledger", m0005_bounty_ledger.upgrade),
+        Migration(6, "crew_member_count", m0006_crew_member_count.upgrade),
+        Migration(7, "nullable_columns", m0007_nullable_columns.upgrade),
+    ]
+
+
+def get_pending_migrations(target_version: int = None) -> list[Migration]:
+    """
+    Get the migrations that have not been applied yet
+    :param target_version: The version up to which migrations should be considered
+    :return: The pending migrations
+    """
+
+    applied_versions: list[int] = SchemaMigration.get_applied_versions()
+    return [
+        migration
+        for migration in get_migrations()
+        if migration.version not in applied_versions
+        and (target_version is None or migration.version <= target_version)
+    ]
+
+
+def apply_migrations(target_version: int = None) -> list[Migration]:
+    """
+    Apply the pending migrations
+    :param target_version: The version up to which migrations should be applied
+    :return: The applied migrations
+    """
+
+    db: Database = db_obj.get_db()
+    SchemaMigration.create_table()
+
+    applied: list[Migration] = []
+    for migration in get_pending_migrations(target_version):
+        logging.info(f"Applying migration {migration}")
+        migration.upgrade(db)
+        SchemaMigration.create(version=migration.version, name=migration.name)
+        applied.append(migration)
+
+    return applied
+
+
+def create_missing_indexes(db: Database, model: type[Model]) -> None:
+    """
+    Create the indexes declared in the model Meta that don't exist yet
+    :param db: The database
+    :param model: The model
+    :return: None
+    """
+
+    table_name: str = model._meta.table_name
+    existing_names: set[str] = {index.name for index in db.get_indexes(table_name)}
+    migrator = MySQLMigrator(db)
+
+    for field_names, is_unique in model._meta.indexes:
+        columns = [model._meta.fields[field_name].column_name for field_name in field_names]
+        if make_index_name(table_name, columns) in existing_names:
+            continue
+
+        logging.info(f"Creating index on {table_name} ({', '.join(columns)})")
+        migrate(migrator.add_index(table_name, columns, is_unique))
+
+
+def add_missing_column(db: Database, field: Field) -> bool:
+    """
+    Add the column of a model field if it doesn't exist yet, as tables created from the current
+    models already have it
+    :param db: The database
+    :param field: The field
+    :return: True if the column was added
+    """
+
+    table_name: str = field.model._meta.table_name
+    if field.column_name in {column.name for column in db.get_columns(table_name)}:
+        return False
+
+    logging.info(f"Adding column {table_name}.{field.column_name}")
+    migrate(SchemaMigrator.from_database(db).add_column(table_name, field.column_name, field))
+    return True
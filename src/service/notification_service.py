@@ -6,6 +6,7 @@ from telegram.error import Forbidden
 from telegram.ext import ContextTypes
 
 import resources.phrases as phrases
+import src.service.task_service as task_service
 from src.chat.private.screens.screen_settings_notifications_type import (
     NotificationTypeReservedKeys,
 )
@@ -13,6 +14,7 @@ from src.model.DisabledNotification import DisabledNotification
 from src.model.User import User
 from src.model.enums.Notification import Notification
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.pojo.Keyboard import Keyboard
 from src.service.message_service import full_message_send
 
@@ -46,17 +48,60 @@ async def send_notification(
             context, user, notification, should_forward_message, update
         )
     else:
-        context.application.create_task(
-            send_notification_execute(context, user, notification, should_forward_message, update)
+        task_service.submit(
+            TaskPoolType.NOTIFICATIONS,
+            send_notification_execute(context, user, notification, should_forward_message, update),
         )
 
 
+def send_notifications(
+    context: ContextTypes.DEFAULT_TYPE, user_notifications: list[tuple[User, Notification]]
+) -> int:
+    """
+    Sends notifications to many users, fire and forget. Disabled notifications are filtered out
+    with a single query
+    :param context: The context object
+    :param user_notifications: The users and the notification to send to each of them
+    :return: How many notifications are sent
+    """
+
+    if len(user_notifications) == 0:
+        return 0
+
+    disabled: set[tuple[int, int]] = set(
+        DisabledNotification.select(DisabledNotification.user, DisabledNotification.type)
+        .where(
+            (DisabledNotification.user.in_([user.id for user, _ in user_notifications]))
+            & (
+                DisabledNotification.type.in_(
+                    list({notification.type for _, notification in user_notifications})
+                )
+            )
+        )
+        .tuples()
+    )
+
+    sent_count = 0
+    for user, notification in user_notifications:
+        if (user.id, notification.type) in disabled:
+            continue
+
+        task_service.submit(
+            TaskPoolType.NOTIFICATIONS,
+            send_notification_execute(context, user, notification, check_enabled=False),
+        )
+        sent_count += 1
+
+    return sent_count
+
+
 async def send_notification_execute(
     context: ContextTypes.DEFAULT_TYPE,
     user: User,
     notification: Notification,
     should_forward_message: bool = False,
     update: Update = None,
+    check_enabled: bool = True,
 ) -> None:
     """
     Sends a notification to the user
@@ -65,13 +110,14 @@ async def send_notification_execute(
     :param notification: Notification
     :param should_forward_message: If the message of the update should be forwarded
     :param update: The update object
+    :param check_enabled: If it should be checked that the user has the notification enabled
     :return: None
     """
 
     if should_forward_message and update is None:
         raise ValueError("If should_forward_message is not None, update must be not None")
 
-    if is_enabled(user, notification):
+    if not check_enabled or is_enabled(user, notification):
         # Create Keyboard for notification management
         inline_keyboard: list[list[Keyboard]] = []
         previous_screens = [
@@ -5,6 +5,7 @@ from telegram.error import BadRequest, TelegramError
 from telegram.ext import ContextTypes
 
 import resources.phrases as phrases
+import src.service.task_service as task_service
 from src.model.GroupChat import GroupChat
 from src.model.Prediction import Prediction
 from src.model.PredictionGroupChatMessage import PredictionGroupChatMessage
@@ -21,12 +22,13 @@ from src.model.enums.Notification import (
 from src.model.enums.PredictionStatus import PredictionStatus, get_prediction_status_name_by_key
 from src.model.enums.PredictionType import PredictionType
 from src.model.enums.Screen import Screen
+from src.model.enums.TaskPoolType import TaskPoolType
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
 from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
 from src.model.error.CustomException import PredictionException
 from src.model.pojo.ContextDataValue import ContextDataValue
 from src.model.pojo.Keyboard import Keyboard
-from src.service.bounty_service import round_belly_up, add_or_remove_bounty
+from src.service.bounty_service import round_belly_up, add_or_remove_bounty, add_bounty_batch
 from src.service.date_service import default_datetime_format
 from src.service.devil_fruit_service import get_ability_value
 from src.service.group_service import (
@@ -429,14 +431,18 @@ async def cut_off_invalid_bets(context: ContextTypes.DEFAULT_TYPE, prediction: P
     # If cut off date is not None, delete all PredictionOptionUsers with date > cut off date and
     # return wager
     if prediction.cut_off_date is not None:
-        invalid_prediction_option_users: list[PredictionOptionUser] = get_invalid_bets(prediction)
+        invalid_prediction_option_users: list[PredictionOptionUser] = list(
+            get_invalid_bets(prediction)
+        )
+
+        # Return wagers and subtract from pending bounty
+        await add_bounty_batch([
+            (option_user.user, option_user.wager, option_user.wager)
+            for option_user in invalid_prediction_option_users
+        ])
+
         for invalid_prediction_option_user in invalid_prediction_option_users:
             user: User = invalid_prediction_option_user.user
-            # Return wager and subtract from pending bounty
-            await add_or_remove_bounty(
-                user, invalid_prediction_option_user.wager, should_affect_pending_bounty=True
-            )
-            user.save()
 
             # Add to users_invalid_prediction_options
             if user.id not in users_invalid_prediction_options:
@@ -501,6 +507,9 @@ async def set_results(context: ContextTypes.DEFAULT_TYPE, prediction: Prediction
 
     # Dictionary with key: user_id, value: list (user, total_win, list of prediction_options)
     users_total_win: dict[int, list[User, int, list[PredictionOption]]] = {}
+    # Wins and refunds, settled in bulk: user, amount, pending belly amount
+    wins: list[tuple[User, int, int]] = []
+    refunds: list[tuple[User, int, int]] = []
 
     for prediction_option_user in prediction_options_users:
         user: User = prediction_option_user.user
@@ -519,13 +528,7 @@ async def set_results(context: ContextTypes.DEFAULT_TYPE, prediction: Prediction
                 prediction_option_user, prediction_options_users=prediction_options_users
             )
             # Add to bounty
-            await add_or_remove_bounty(
-                user,
-                win_amount,
-                pending_belly_amount=prediction_option_user.wager,
-                tax_event_type=IncomeTaxEventType.PREDICTION,
-                event_id=prediction.id,
-            )
+            wins.append((user, win_amount, prediction_option_user.wager))
 
             # Add to total win
             users_total_win[user.id][1] += win_amount
@@ -545,11 +548,12 @@ async def set_results(context: ContextTypes.DEFAULT_TYPE, prediction: Prediction
                     get_max_wager_refund(prediction_option_user=prediction_option_user),
                 )
 
-            await add_or_remove_bounty(
-                user, refund_amount, pending_belly_amount=prediction_option_user.wager
-            )
+            refunds.append((user, refund_amount, prediction_option_user.wager))
 
-        user.save()
+    await add_bounty_batch(
+        wins, tax_event_type=IncomeTaxEventType.PREDICTION, event_id=prediction.id
+    )
+    await add_bounty_batch(refunds)
 
     # Update status
     prediction.status = PredictionStatus.RESULT_SET
@@ -963,10 +967,11 @@ async def send_prediction_status_change_message_or_refresh_dispatch(
         if should_refresh:
             text = get_prediction_text(prediction)
 
-        context.application.create_task(
+        task_service.submit(
+            TaskPoolType.BROADCASTS,
             send_prediction_status_change_message_or_refresh(
                 context, prediction, text, should_refresh, group_chat
-            )
+            ),
         )
 
 
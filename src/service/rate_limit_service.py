@@ -0,0 +1,119 @@
+import logging
+import time
+from collections import deque
+
+import resources.Environment as Env
+from src.model.enums.MessageSource import MessageSource
+
+
+class RateLimitEntry:
+    """
+    Sliding window of the last accepted requests for a key, stored in a fixed-size ring buffer
+    """
+
+    __slots__ = ("timestamps", "last_seen", "throttled_count", "is_throttled")
+
+    def __init__(self, limit: int):
+        """
+        Initialize the entry
+        :param limit: How many requests are accepted in the window, which is also the size of the
+        ring buffer
+        """
+        self.timestamps: deque[float] = deque(maxlen=limit)
+        self.last_seen: float = time.monotonic()
+        self.throttled_count: int = 0
+        self.is_throttled: bool = False
+
+
+# Entries by (message source, key)
+_entries: dict[tuple[MessageSource, str], RateLimitEntry] = {}
+
+
+def get_limit(message_source: MessageSource) -> int:
+    """
+    Get how many requests are accepted in the time window for a message source
+    :param message_source: The message source
+    :return: The limit
+    """
+
+    if message_source is MessageSource.PRIVATE:
+        return Env.ANTI_SPAM_PRIVATE_CHAT_MESSAGE_LIMIT.get_int()
+
+    return Env.ANTI_SPAM_GROUP_CHAT_MESSAGE_LIMIT.get_int()
+
+
+def hit(message_source: MessageSource, key: str) -> tuple[bool, bool]:
+    """
+    Register a request for a key and check if it exceeds the limit
+    :param message_source: The message source
+    :param key: The key, user id for private chats and chat id for group chats
+    :return: A tuple of (is throttled, is the first throttled request since the last accepted
+    one)
+    """
+
+    now = time.monotonic()
+    limit = get_limit(message_source)
+
+    entry = _entries.get((message_source, key))
+    if entry is None or entry.timestamps.maxlen != limit:
+        entry = RateLimitEntry(limit)
+        _entries[(message_source, key)] = entry
+
+    entry.last_seen = now
+
+    # Buffer full and the oldest accepted request is still in the window
+    if (
+        len(entry.timestamps) == limit
+        and now - entry.timestamps[0] < Env.ANTI_SPAM_TIME_INTERVAL_SECONDS.get_int()
+    ):
+        entry.throttled_count += 1
+        is_first_throttle = not entry.is_throttled
+        entry.is_throttled = True
+        return True, is_first_throttle
+
+    entry.timestamps.append(now)
+    entry.is_throttled = False
+    return False, False
+
+
+def evict_idle_entries() -> int:
+    """
+    Remove the entries that have not received a request for longer than the time window
+    :return: How many entries were removed
+    """
+
+    now = time.monotonic()
+    window = Env.ANTI_SPAM_TIME_INTERVAL_SECONDS.get_int()
+    idle_keys = [key for key, entry in _entries.items() if now - entry.last_seen >= window]
+    for key in idle_keys:
+        entry = _entries.pop(key)
+        if entry.throttled_count > 0:
+            logging.info(
+                f"Rate limit for {key[0]} {key[1]} expired after throttling"
+                f" {entry.throttled_count} requests"
+            )
+
+    return len(idle_keys)
+
+
+def get_throttled_counters() -> dict[tuple[MessageSource, str], int]:
+    """
+    Get how many requests have been throttled for each tracked key, most throttled first
+    :return: The counters
+    """
+
+    counters = {key: entry.throttled_count for key, entry in _entries.items()}
+    return {
+        key: count
+        for key, count in sorted(counters.items(), key=lambda item: item[1], reverse=True)
+        if count > 0
+    }
+
+
+def get_tracked_keys_count() -> int:
+    """
+    Get how many keys are currently tracked
+    :return: The count
+    """
+
+    return len(_entries)
@@ -1,23 +1,151 @@
+import asyncio
 import logging
-import os
-from typing import AsyncIterator
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import asyncpraw
 from asyncpraw import Reddit
 from asyncpraw.models import Submission, Subreddit
-from peewee import DoesNotExist
 from telegram import Message
 from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 
 import constants as c
 import resources.Environment as Env
+import src.service.download_service as download_service
 from src.model.RedditGroupPost import RedditGroupPost
+from src.model.error.CustomException import DownloadException
 from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaType import SavedMediaType
+from src.service.download_service import ContentCache
 from src.service.message_service import full_media_send, escape_valid_markdown_chars
-from src.utils.download_utils import download_temp_file
-from src.utils.image_utils import compress_image
+from src.utils.image_utils import compress_image_bytes
+
+# Number of hot posts fetched for each subreddit
+HOT_POSTS_LIMIT = 10
+# Number of sent posts kept in the database
+SAVED_POSTS_MAX_COUNT = 20
+# Number of sent posts remembered in memory to skip them
+RECENT_SHORT_LINKS_MAX_COUNT = 500
+
+_reddit: Reddit | None = None
+# Short links of the recently sent posts, oldest first
+_recent_short_links: OrderedDict[str, None] | None = None
+_compressed_image_cache = ContentCache(Env.REDDIT_MEDIA_CACHE_MAX_BYTES.get_int())
+_media_executor = ThreadPoolExecutor(
+    max_workers=Env.REDDIT_MEDIA_MAX_WORKERS.get_int(), thread_name_prefix="reddit_media"
+)
+
+
+def get_reddit() -> Reddit:
+    """
+    Get the reddit client, created on first use and kept open until close is called
+    :return: The reddit client
+    """
+
+    global _reddit
+
+    if _reddit is None:
+        _reddit = asyncpraw.Reddit(
+            client_id=Env.REDDIT_CLIENT_ID.get(),
+            client_secret=Env.REDDIT_CLIENT_SECRET.get(),
+            user_agent=Env.REDDIT_USER_AGENT.get(),
+        )
+
+    return _reddit
+
+
+async def close() -> None:
+    """
+    Close the reddit client and stop the media workers
+    :return: None
+    """
+
+    global _reddit
+
+    if _reddit is not None:
+        await _reddit.close()
+        _reddit = None
+
+    _media_executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def fetch_hot_posts(subreddit_name: str) -> list[Submission]:
+    """
+    Fetch the hot posts of a subreddit that can be sent, skipping stickied and nsfw posts
+    :param subreddit_name: The name of the subreddit
+    :return: The posts
+    """
+
+    subreddit: Subreddit = await get_reddit().subreddit(subreddit_name)
+    return [
+        post
+        async for post in subreddit.hot(limit=HOT_POSTS_LIMIT)
+        if not post.stickied and not post.over_18
+    ]
+
+
+def get_recent_short_links() -> OrderedDict[str, None]:
+    """
+    Get the short links of the recently sent posts, loaded from the database on first use
+    :return: The short links
+    """
+
+    global _recent_short_links
+
+    if _recent_short_links is None:
+        _recent_short_links = OrderedDict(
+            (short_link, None)
+            for (short_link,) in RedditGroupPost.select(RedditGroupPost.short_link)
+            .order_by(RedditGroupPost.id)
+            .tuples()
+        )
+
+    return _recent_short_links
+
+
+def add_recent_short_link(short_link: str) -> None:
+    """
+    Remember a sent post
+    :param short_link: The short link of the post
+    :return: None
+    """
+
+    recent_short_links = get_recent_short_links()
+    recent_short_links[short_link] = None
+    while len(recent_short_links) > RECENT_SHORT_LINKS_MAX_COUNT:
+        recent_short_links.popitem(last=False)
+
+
+async def get_video(url: str) -> bytes:
+    """
+    Download a video
+    :param url: The url of the video
+    :return: The video
+    """
+
+    return await download_service.download(url)
+
+
+async def get_compressed_image(url: str) -> bytes:
+    """
+    Download and compress an image, the compression runs in the media workers
+    :param url: The url of the image
+    :return: The compressed image
+    """
+
+    data = _compressed_image_cache.get(url)
+    if data is None:
+        image = await download_service.download(url)
+        data = await asyncio.get_running_loop().run_in_executor(
+            _media_executor,
+            compress_image_bytes,
+            image,
+            c.TG_DEFAULT_IMAGE_COMPRESSION_QUALITY,
+        )
+        _compressed_image_cache.put(url, data)
+
+    return data
 
 
 async def manage(context: ContextTypes.DEFAULT_TYPE, subreddit_name: str) -> None:
@@ -32,34 +160,11 @@ async def manage(context: ContextTypes.DEFAULT_TYPE, subreddit_name: str) -> Non
         logging.error("Main group ID is not set, can't send reddit post")
         return
 
-    # Create connection
-    connection: Reddit = asyncpraw.Reddit(
-        client_id=Env.REDDIT_CLIENT_ID.get(),
-        client_secret=Env.REDDIT_CLIENT_SECRET.get(),
-        user_agent=Env.REDDIT_USER_AGENT.get(),
-    )
-
-    # Get first 10 hot posts
-    subreddit: Subreddit = await connection.subreddit(subreddit_name)
-    hot_posts: AsyncIterator = subreddit.hot(limit=10)
-
-    async for post in hot_posts:
-        post: Submission = post  # Type hinting
-
-        # Post stickied - skip
-        if post.stickied:
-            continue
-
-        # Post nsfw - skip
-        if post.over_18:
-            continue
-
+    recent_short_links = get_recent_short_links()
+    for post in await fetch_hot_posts(subreddit_name):
         # Post already sent - skip
-        try:
-            RedditGroupPost.get(RedditGroupPost.short_link == post.shortlink)
+        if post.shortlink in recent_short_links:
             continue
-        except DoesNotExist:
-            pass
 
         # Caption
         author_name = post.author.name
@@ -96,10 +201,17 @@ async def manage(context: ContextTypes.DEFAULT_TYPE, subreddit_name: str) -> Non
                         try:
                             url = post.media["reddit_video"]["fallback_url"]
                             url = url.split("?")[0]
-                            saved_media.media_id = open(download_temp_file(url), "rb")
-                        except KeyError:
+                            saved_media.media_id = await get_video(url)
+                        except (KeyError, TypeError):
                             logging.error("Reddit post {} has no video".format(post.shortlink))
                             continue
+                        except DownloadException as download_exception:
+                            logging.error(
+                                "Error downloading video of reddit post {}: {}".format(
+                                    post.shortlink, download_exception
+                                )
+                            )
+                            continue
 
                     # Send media
                     message: Message = await full_media_send(
@@ -113,24 +225,13 @@ async def manage(context: ContextTypes.DEFAULT_TYPE, subreddit_name: str) -> Non
                         )
 
                         # Try resending with a smaller image
-                        image_path = compress_image(
-                            post.url, c.TG_DEFAULT_IMAGE_COMPRESSION_QUALITY
-                        )
-                        saved_media.media_id = open(image_path, "rb")
+                        saved_media.media_id = await get_compressed_image(post.url)
                         message: Message = await full_media_send(
                             context,
                             saved_media,
                             caption=caption,
                             chat_id=main_group_id,
                         )
-
-                        try:
-                            # Delete the temporary image
-                            os.remove(image_path)
-                        except OSError:
-                            # Ignore, will be deleted by auto-cleanup timer
-                            logging.warning("Error deleting temporary image {}".format(image_path))
-                            pass
                     else:
                         raise exceptionBadRequest
 
@@ -139,11 +240,14 @@ async def manage(context: ContextTypes.DEFAULT_TYPE, subreddit_name: str) -> Non
                 reddit_group_post.short_link = post.shortlink
                 reddit_group_post.message_id = message.message_id
                 reddit_group_post.save()
+                add_recent_short_link(post.shortlink)
 
                 # If saved posts > 20, delete all but the last 20
-                if RedditGroupPost.select().count() > 20:
+                if RedditGroupPost.select().count() > SAVED_POSTS_MAX_COUNT:
                     last_n_posts = list(
-                        RedditGroupPost.select().order_by(RedditGroupPost.id.desc()).limit(20)
+                        RedditGroupPost.select()
+                        .order_by(RedditGroupPost.id.desc())
+                        .limit(SAVED_POSTS_MAX_COUNT)
                     )
                     (
                         RedditGroupPost.delete()
@@ -0,0 +1,289 @@
+import logging
+import time
+import unicodedata
+from typing import Callable, Iterable
+
+from peewee import chunked, Expression, Select, SQL
+
+import resources.Environment as Env
+from src.model.BaseModel import BaseModel
+from src.model.Crew import Crew
+from src.model.DevilFruit import DevilFruit
+from src.model.DevilFruitTrade import DevilFruitTrade
+from src.model.enums.SearchIndexType import SearchIndexType
+from src.model.enums.devil_fruit.DevilFruitCategory import DEVIL_FRUIT_CATEGORY_DESCRIPTION_MAP
+from src.model.enums.devil_fruit.DevilFruitSource import DevilFruitSource
+from src.model.enums.devil_fruit.DevilFruitTradeStatus import DevilFruitTradeStatus
+
+# Length of the n-grams used to find the candidates of a search
+NGRAM_LENGTH = 3
+# Maximum number of ids in a single IN condition
+MAX_IDS_PER_QUERY = 1000
+
+
+def normalize(text: str | None) -> str:
+    """
+    Normalize a text for search: lower case, without accents and with single spaces
+    :param text: The text
+    :return: The normalized text
+    """
+
+    if text is None:
+        return ""
+
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.split())
+
+
+def get_ngrams(text: str) -> set[str]:
+    """
+    Get the n-grams of a normalized text
+    :param text: The text
+    :return: The n-grams, empty if the text is shorter than an n-gram
+    """
+
+    return {text[i : i + NGRAM_LENGTH] for i in range(len(text) - NGRAM_LENGTH + 1)}
+
+
+def get_match_rank(fields: tuple[str, ...], text: str) -> tuple[int, int] | None:
+    """
+    Get the rank of a document for a search, lower is better. Matches in the first fields rank
+    higher, then exact matches, prefix matches, word prefix matches and any other match
+    :param fields: The normalized fields of the document, most relevant first
+    :param text: The normalized search text
+    :return: The rank, None if the document doesn't match
+    """
+
+    for field_index, field in enumerate(fields):
+        if text not in field:
+            continue
+
+        if field == text:
+            return field_index, 0
+        if field.startswith(text):
+            return field_index, 1
+        if f" {text}" in field:
+            return field_index, 2
+
+        return field_index, 3
+
+    return None
+
+
+def get_id_in_condition(model: type[BaseModel], ids: Iterable[int]) -> Expression:
+    """
+    Get the condition on the ids of a model. The ids are written in the query as literals, which
+    is much faster than binding a parameter for each of them
+    :param model: The model
+    :param ids: The ids
+    :return: The condition
+    """
+
+    return model.id.in_(SQL(f"({','.join(str(int(row_id)) for row_id in ids)})"))
+
+
+class SearchIndex:
+    """
+    In memory n-gram index of the searchable text of a model. Rebuilt when invalidated by a
+    write of this process, or periodically to include the writes of the other processes
+    """
+
+    def __init__(self, model: type[BaseModel], load_documents: Callable[[], Iterable[tuple]]):
+        """
+        Initialize the index
+        :param model: The model of the indexed rows
+        :param load_documents: Function that returns the rows to index, as tuples of the id and
+        the searchable fields, most relevant first. Rows are returned in the default list order,
+        used to break ties between results with the same rank
+        """
+        self.model: type[BaseModel] = model
+        self.load_documents: Callable[[], Iterable[tuple]] = load_documents
+        # Normalized fields by id
+        self.documents: dict[int, tuple[str, ...]] = {}
+        # Position in the default order by id
+        self.positions: dict[int, int] = {}
+        # Ids by n-gram
+        self.ngrams: dict[str, set[int]] = {}
+        self.build_time: float | None = None
+
+    def is_stale(self) -> bool:
+        """
+        If the index must be rebuilt
+        :return: True if stale
+        """
+
+        return (
+            self.build_time is None
+            or time.monotonic() - self.build_time > Env.SEARCH_INDEX_REFRESH_SECONDS.get_int()
+        )
+
+    def build(self) -> None:
+        """
+        Build the index from the database
+        :return: None
+        """
+
+        start = time.perf_counter()
+        documents: dict[int, tuple[str, ...]] = {}
+        positions: dict[int, int] = {}
+        ngrams: dict[str, set[int]] = {}
+        for position, (document_id, *fields) in enumerate(self.load_documents()):
+            normalized_fields = tuple(normalize(field) for field in fields)
+            documents[document_id] = normalized_fields
+            positions[document_id] = position
+            for field in normalized_fields:
+                for ngram in get_ngrams(field):
+                    ngrams.setdefault(ngram, set()).add(document_id)
+
+        self.documents, self.positions, self.ngrams = documents, positions, ngrams
+        self.build_time = time.monotonic()
+        logging.debug(
+            f"Built search index of {self.model.__name__} with {len(documents)} documents in"
+            f" {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+
+    def invalidate(self) -> None:
+        """
+        Mark the index as stale, so that it's rebuilt by the next search
+        :return: None
+        """
+
+        self.build_time = None
+
+    def get_candidates(self, text: str) -> Iterable[int]:
+        """
+        Get the ids of the documents that could match a search, the ones having all its n-grams
+        :param text: The normalized search text
+        :return: The candidate ids
+        """
+
+        ngrams = get_ngrams(text)
+        if len(ngrams) == 0:
+            return self.documents.keys()
+
+        # Starting from the rarest n-gram
+        id_sets = sorted((self.ngrams.get(ngram, set()) for ngram in ngrams), key=len)
+        return set.intersection(*id_sets)
+
+    def rank(self, text: str) -> list[int]:
+        """
+        Get the ids of the documents that match a search, best first
+        :param text: The search text
+        :return: The ids
+        """
+
+        if self.is_stale():
+            self.build()
+
+        text = normalize(text)
+        results: list[tuple[tuple[int, int], int, int]] = []
+        for document_id in self.get_candidates(text):
+            match_rank = get_match_rank(self.documents[document_id], text)
+            if match_rank is not None:
+                results.append((match_rank, self.positions[document_id], document_id))
+
+        results.sort()
+        return [document_id for _, _, document_id in results]
+
+
+def load_crew_documents() -> Iterable[tuple]:
+    """
+    Load the searchable fields of the active crews
+    :return: Tuples of id, name and description
+    """
+
+    return (
+        Crew.select(Crew.id, Crew.name, Crew.description)
+        .where(Crew.is_active == True)
+        .order_by(Crew.level.desc(), Crew.total_gained_chest_amount.desc())
+        .tuples()
+    )
+
+
+def load_devil_fruit_shop_documents() -> Iterable[tuple]:
+    """
+    Load the searchable fields of the Devil Fruits on sale in the shop
+    :return: Tuples of trade id, full fruit name and category description
+    """
+
+    trades = (
+        DevilFruitTrade.select(DevilFruitTrade, DevilFruit)
+        .join(DevilFruit)
+        .where(
+            (DevilFruitTrade.source == DevilFruitSource.SHOP)
+            & (DevilFruitTrade.status == DevilFruitTradeStatus.PENDING)
+        )
+        .order_by(DevilFruitTrade.date)
+    )
+
+    return [
+        (
+            trade.id,
+            trade.devil_fruit.get_full_name(),
+            DEVIL_FRUIT_CATEGORY_DESCRIPTION_MAP.get(trade.devil_fruit.get_category(), ""),
+        )
+        for trade in trades
+    ]
+
+
+_indexes: dict[SearchIndexType, SearchIndex] = {
+    SearchIndexType.CREW: SearchIndex(Crew, load_crew_documents),
+    SearchIndexType.DEVIL_FRUIT_SHOP: SearchIndex(
+        DevilFruitTrade, load_devil_fruit_shop_documents
+    ),
+}
+
+
+def invalidate(index_type: SearchIndexType) -> None:
+    """
+    Invalidate a search index after a write to its searchable rows
+    :param index_type: The index type
+    :return: None
+    """
+
+    _indexes[index_type].invalidate()
+
+
+def search(
+    index_type: SearchIndexType, text: str, page: int, limit: int, query: Select
+) -> tuple[list[int], int]:
+    """
+    Search a text, keeping only the results that are also returned by a query
+    :param index_type: The index type
+    :param text: The search text
+    :param page: The page, starting from 1
+    :param limit: The page size
+    :param query: Query that selects the ids of the rows allowed in the results, e.g. with the
+    other active filters of a list
+    :return: The ids of the page, best first, and the total number of results
+    """
+
+    index = _indexes[index_type]
+    ranked_ids = index.rank(text)
+
+    allowed_ids: set[int] = set()
+    for ids in chunked(ranked_ids, MAX_IDS_PER_QUERY):
+        allowed_ids.update(
+            row_id for (row_id,) in query.where(get_id_in_condition(index.model, ids)).tuples()
+        )
+
+    result_ids = [row_id for row_id in ranked_ids if row_id in allowed_ids]
+    start = (page - 1) * limit
+    return result_ids[start : start + limit], len(result_ids)
+
+
+def get_rows(index_type: SearchIndexType, ids: list[int]) -> list[BaseModel]:
+    """
+    Get the rows of search results, in the same order
+    :param index_type: The index type
+    :param ids: The ids
+    :return: The rows
+    """
+
+    if len(ids) == 0:
+        return []
+
+    model = _indexes[index_type].model
+    rows = {row.id: row for row in model.select().where(get_id_in_condition(model, ids))}
+    return [rows[row_id] for row_id in ids if row_id in rows]
@@ -0,0 +1,224 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from typing import Coroutine
+
+from src.model.enums.TaskPoolType import TaskPoolType, TaskSheddingPolicy
+
+# Seconds to wait for the queued and running tasks when stopping
+STOP_TIMEOUT_SECONDS = 30
+
+
+class TaskPool:
+    """
+    Runs background tasks with a maximum concurrency. Tasks over it wait in a queue, and when
+    the queue is full tasks are shed according to the policy of the pool
+    """
+
+    def __init__(self, pool_type: TaskPoolType):
+        """
+        Initialize the pool
+        :param pool_type: The pool type
+        """
+        self.pool_type: TaskPoolType = pool_type
+        self.max_concurrency: int = pool_type.get_max_concurrency()
+        self.max_queue_size: int = pool_type.get_max_queue_size()
+        self.shedding_policy: TaskSheddingPolicy = pool_type.get_shedding_policy()
+        # Queued coroutines with the time they were submitted and the context of the submitter,
+        # oldest first
+        self.queue: deque[tuple[Coroutine, float, contextvars.Context]] = deque()
+        self.running_tasks: set[asyncio.Task] = set()
+        self.is_shedding: bool = False
+        self.space_available: asyncio.Event = asyncio.Event()
+        self.space_available.set()
+        self.submitted_count: int = 0
+        self.completed_count: int = 0
+        self.failed_count: int = 0
+        self.shed_count: int = 0
+        self.wait_seconds: float = 0
+
+    def is_full(self) -> bool:
+        """
+        If the queue is full
+        :return: True if full
+        """
+
+        return 0 < self.max_queue_size <= len(self.queue)
+
+    def submit(self, coroutine: Coroutine) -> bool:
+        """
+        Submit a task. If the queue is full, the oldest queued task or the new one is dropped
+        :param coroutine: The coroutine to run
+        :return: False if the new task was dropped
+        """
+
+        self.submitted_count += 1
+
+        if self.is_full():
+            self.shed_count += 1
+            if not self.is_shedding:
+                self.is_shedding = True
+                logging.warning(f"Task pool {self.pool_type} is full, shedding tasks")
+
+            if self.shedding_policy is TaskSheddingPolicy.REJECT_NEW:
+                coroutine.close()
+                return False
+
+            dropped, _, _ = self.queue.popleft()
+            dropped.close()
+
+        # Started later by the task that frees a slot, which must not share its context (e.g. the
+        # identity map of its update)
+        self.queue.append((coroutine, time.perf_counter(), contextvars.copy_context()))
+        self.update_space_available()
+        self.start_queued()
+        return True
+
+    async def submit_with_backpressure(self, coroutine: Coroutine) -> None:
+        """
+        Submit a task, waiting for room in the queue instead of shedding
+        :param coroutine: The coroutine to run
+        :return: None
+        """
+
+        while self.is_full():
+            await self.space_available.wait()
+
+        self.submit(coroutine)
+
+    def start_queued(self) -> None:
+        """
+        Start the queued tasks, up to the maximum concurrency
+        :return: None
+        """
+
+        while len(self.running_tasks) < self.max_concurrency and len(self.queue) > 0:
+            coroutine, submit_time, context = self.queue.popleft()
+            self.wait_seconds += time.perf_counter() - submit_time
+            task = asyncio.get_running_loop().create_task(self.run(coroutine), context=context)
+            self.running_tasks.add(task)
+
+        self.update_space_available()
+
+    def update_space_available(self) -> None:
+        """
+        Update the event that tells whether the queue has room
+        :return: None
+        """
+
+        if self.is_full():
+            self.space_available.clear()
+            return
+
+        self.space_available.set()
+        if self.is_shedding and len(self.queue) == 0:
+            self.is_shedding = False
+            logging.warning(
+                f"Task pool {self.pool_type} is no longer full, {self.shed_count} tasks shed"
+                " so far"
+            )
+
+    async def run(self, coroutine: Coroutine) -> None:
+        """
+        Run a task, then start the next queued one
+        :param coroutine: The coroutine
+        :return: None
+        """
+
+        try:
+            await coroutine
+            self.completed_count += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed_count += 1
+            logging.error(f"Error in task of pool {self.pool_type}: {e}", exc_info=True)
+        finally:
+            self.running_tasks.discard(asyncio.current_task())
+            self.start_queued()
+
+    async def stop(self, timeout: float) -> None:
+        """
+        Wait for the queued and running tasks, then cancel the ones still running
+        :param timeout: Maximum seconds to wait
+        :return: None
+        """
+
+        deadline = time.monotonic() + timeout
+        while len(self.running_tasks) > 0 and time.monotonic() < deadline:
+            await asyncio.wait(
+                list(self.running_tasks), timeout=max(0.0, deadline - time.monotonic())
+            )
+
+        for coroutine, _, _ in self.queue:
+            coroutine.close()
+        self.queue.clear()
+
+        for task in list(self.running_tasks):
+            task.cancel()
+
+
+_pools: dict[TaskPoolType, TaskPool] = {}
+
+
+def get_pool(pool_type: TaskPoolType) -> TaskPool:
+    """
+    Get a task pool, created on first use
+    :param pool_type: The pool type
+    :return: The pool
+    """
+
+    pool = _pools.get(pool_type)
+    if pool is None:
+        pool = TaskPool(pool_type)
+        _pools[pool_type] = pool
+
+    return pool
+
+
+def submit(pool_type: TaskPoolType, coroutine: Coroutine) -> bool:
+    """
+    Run a task in a pool, fire and forget
+    :param pool_type: The pool type
+    :param coroutine: The coroutine to run
+    :return: False if the task was shed because the pool is full
+    """
+
+    return get_pool(pool_type).submit(coroutine)
+
+
+async def submit_with_backpressure(pool_type: TaskPoolType, coroutine: Coroutine) -> None:
+    """
+    Run a task in a pool, waiting for room in its queue if full. Must not be called from a task
+    of the same pool
+    :param pool_type: The pool type
+    :param coroutine: The coroutine to run
+    :return: None
+    """
+
+    await get_pool(pool_type).submit_with_backpressure(coroutine)
+
+
+def get_pools() -> list[TaskPool]:
+    """
+    Get the pools created so far
+    :return: The pools
+    """
+
+    return list(_pools.values())
+
+
+async def stop() -> None:
+    """
+    Wait for the tasks of all the pools, up to a timeout, and cancel the remaining ones
+    :return: None
+    """
+
+    deadline = time.monotonic() + STOP_TIMEOUT_SECONDS
+    # Tasks of the updates start tasks in the other pools, so they are stopped first
+    for pool_type in TaskPoolType:
+        pool = _pools.get(pool_type)
+        if pool is not None:
+            await pool.stop(max(0.0, deadline - time.monotonic()))
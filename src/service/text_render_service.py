@@ -0,0 +1,51 @@
+from functools import lru_cache
+
+import resources.Environment as Env
+
+# Chars that are markdown syntax, escaped in user provided text (e.g. names)
+VALID_MARKDOWN_CHARS = r"_*[]()>"
+# Chars that are not markdown syntax in the bot messages but must be escaped for MarkdownV2
+INVALID_MARKDOWN_CHARS = r"~#+-=|{}.!"
+# Chars escaped in the text of a MarkdownV2 mention
+MENTION_MARKDOWN_CHARS = r"\_*[]()~`>#+-=|{}.!"
+
+# Translation tables from each char to its escaped version, built once
+_VALID_MARKDOWN_TABLE = str.maketrans({char: "\\" + char for char in VALID_MARKDOWN_CHARS})
+_INVALID_MARKDOWN_TABLE = str.maketrans({char: "\\" + char for char in INVALID_MARKDOWN_CHARS})
+_MENTION_MARKDOWN_TABLE = str.maketrans({char: "\\" + char for char in MENTION_MARKDOWN_CHARS})
+
+
+def escape_valid_markdown_chars(text: str) -> str:
+    """
+    Escape valid markdown chars
+    :param text: Text
+    :return: Escaped text
+    """
+
+    return text.translate(_VALID_MARKDOWN_TABLE)
+
+
+def escape_invalid_markdown_chars(text: str) -> str:
+    """
+    Escape invalid markdown chars
+    :param text: Text
+    :return: Escaped text
+    """
+
+    text = text.translate(_INVALID_MARKDOWN_TABLE)
+
+    # Escape eventual quadruple backslashes with a double backslash
+    return text.replace("\\\\", "\\")
+
+
+@lru_cache(maxsize=Env.MENTION_CACHE_MAX_SIZE.get_int())
+def mention_markdown_v2(user_id: int | str, name: str) -> str:
+    """
+    Create a MarkdownV2 mention of a user. The most recently rendered mentions are cached, since
+    the same users are mentioned over and over in lists and leaderboards
+    :param user_id: The Telegram user id
+    :param name: The name shown in the mention
+    :return: The mention
+    """
+
+    return f"[{name.translate(_MENTION_MARKDOWN_TABLE)}](tg://user?id={user_id})"
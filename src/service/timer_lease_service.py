@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from peewee import IntegrityError
+
+import resources.Environment as Env
+from src.model.TimerLease import TimerLease
+from src.model.TimerRun import TimerRun
+
+# Identifies this process as owner of the leases
+OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[-99:]
+
+# Names of the timers whose lease was acquired by this process
+_held_names: set[str] = set()
+_heartbeat_task: asyncio.Task | None = None
+
+
+def get_expiration_date() -> datetime:
+    """
+    Get the expiration date of a lease acquired or renewed now
+    :return: The expiration date
+    """
+
+    return datetime.now() + timedelta(seconds=Env.TIMER_LEASE_TTL_SECONDS.get_int())
+
+
+def acquire(name: str) -> bool:
+    """
+    Acquire or renew the lease of a timer. It's acquired if it has no owner yet, if it's
+    already owned by this process or if its owner didn't renew it in time
+    :param name: The timer name
+    :return: True if this process holds the lease
+    """
+
+    now = datetime.now()
+    expiration_date = get_expiration_date()
+    updated_count = (
+        TimerLease.update(owner=OWNER, expiration_date=expiration_date)
+        .where(
+            (TimerLease.name == name)
+            & ((TimerLease.owner == OWNER) | (TimerLease.expiration_date < now))
+        )
+        .execute()
+    )
+
+    if updated_count > 0:
+        is_held = True
+    else:
+        lease: TimerLease = TimerLease.get_or_none(TimerLease.name == name)
+        if lease is None:
+            try:
+                TimerLease.create(name=name, owner=OWNER, expiration_date=expiration_date)
+                is_held = True
+            except IntegrityError:  # Created by another process in the meantime
+                is_held = False
+        else:
+            # Not updated but owned, renewed with the same expiration date
+            is_held = lease.owner == OWNER
+
+    if is_held and name not in _held_names:
+        logging.info(f"Acquired the lease of timer {name}")
+        _held_names.add(name)
+    elif not is_held and name in _held_names:
+        logging.warning(f"Lost the lease of timer {name}")
+        _held_names.discard(name)
+
+    return is_held
+
+
+def renew() -> int:
+    """
+    Renew all the leases held by this process
+    :return: How many leases were renewed
+    """
+
+    if len(_held_names) == 0:
+        return 0
+
+    return (
+        TimerLease.update(expiration_date=get_expiration_date())
+        .where(TimerLease.owner == OWNER)
+        .execute()
+    )
+
+
+def release() -> None:
+    """
+    Release all the leases held by this process, so that the other processes can take over
+    without waiting for their expiration
+    :return: None
+    """
+
+    if len(_held_names) == 0:
+        return
+
+    TimerLease.update(expiration_date=datetime.now()).where(TimerLease.owner == OWNER).execute()
+    _held_names.clear()
+
+
+@contextmanager
+def record_run(name: str) -> Iterator[TimerRun]:
+    """
+    Record a run of a timer, with its start, end and duration. The runs older than the
+    retention are deleted
+    :param name: The timer name
+    :return: The run
+    """
+
+    timer_run: TimerRun = TimerRun.create(name=name, owner=OWNER, start_date=datetime.now())
+    start = time.perf_counter()
+    try:
+        yield timer_run
+        timer_run.is_successful = True
+    except Exception:
+        timer_run.is_successful = False
+        raise
+    finally:
+        timer_run.end_date = datetime.now()
+        timer_run.duration_milliseconds = int((time.perf_counter() - start) * 1000)
+        timer_run.save()
+
+        retention_date = datetime.now() - timedelta(days=Env.TIMER_RUN_RETENTION_DAYS.get_int())
+        TimerRun.delete().where(
+            (TimerRun.name == name) & (TimerRun.start_date < retention_date)
+        ).execute()
+
+
+async def run_heartbeat() -> None:
+    """
+    Renew the held leases periodically, until cancelled
+    :return: None
+    """
+
+    while True:
+        await asyncio.sleep(Env.TIMER_LEASE_HEARTBEAT_SECONDS.get_int())
+
+        try:
+            renew()
+        except Exception as e:
+            logging.error(f"Error while renewing the timer leases: {e}", exc_info=True)
+
+
+def start() -> None:
+    """
+    Start renewing the leases held by this process
+    :return: None
+    """
+
+    global _heartbeat_task
+
+    if _heartbeat_task is not None:
+        return
+
+    # Not created with the application, which waits for its tasks when stopping
+    _heartbeat_task = asyncio.create_task(run_heartbeat())
+
+
+def stop() -> None:
+    """
+    Stop renewing the leases and release them
+    :return: None
+    """
+
+    global _heartbeat_task
+
+    if _heartbeat_task is None:
+        return
+
+    _heartbeat_task.cancel()
+    _heartbeat_task = None
+
+    try:
+        release()
+    except Exception as e:
+        logging.error(f"Error while releasing the timer leases: {e}")
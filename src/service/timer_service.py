@@ -5,10 +5,16 @@ from apscheduler.triggers.cron import CronTrigger
 from telegram.ext import ContextTypes, Application, Job
 
 import src.model.enums.Timer as Timer
+import src.service.artifact_service as artifact_service
+import src.service.metrics_service as metrics_service
+import src.service.timer_lease_service as timer_lease_service
 from src.chat.manage_message import init, end
 from src.model.DailyReward import DailyReward
+from src.model.enums.TraceKind import TraceKind
+from src.service.bot_service import remove_expired_context_data
 from src.service.bounty_loan_service import set_expired_bounty_loans
 from src.service.bounty_poster_service import reset_bounty_poster_limit
+from src.service.crew_service import reconcile_member_count
 from src.service.devil_fruit_service import schedule_devil_fruit_release, respawn_devil_fruit
 from src.service.game_service import end_inactive_games
 from src.service.generic_service import run_minute_tasks
@@ -20,8 +26,8 @@ from src.service.prediction_service import (
     close_scheduled_predictions,
     send_prediction_status_change_message_or_refresh_dispatch,
 )
+from src.service.rate_limit_service import evict_idle_entries
 from src.service.reddit_service import manage as send_reddit_post
-from src.utils.download_utils import cleanup_temp_dir
 
 
 def add_to_queue(application: Application, timer: Timer.Timer) -> Job:
@@ -90,14 +96,45 @@ async def run(context: ContextTypes.DEFAULT_TYPE) -> None:
 
     db = init()
 
+    # Timers on the state of the process run in every process, the others only in the one
+    # holding their lease
+    is_leased = timer not in Timer.WORKER_TIMERS
+    if is_leased and not timer_lease_service.acquire(timer.name):
+        end(db)
+        return
+
     if timer.should_log:
         logging.info(f"Running timer {job.name}")
 
+    with metrics_service.trace(TraceKind.TIMER, job.name):
+        if is_leased:
+            with timer_lease_service.record_run(timer.name):
+                await execute(context, timer)
+        else:
+            await execute(context, timer)
+
+    if timer.should_log:
+        logging.info(f"Finished timer {context.job.name}")
+    end(db)
+
+    return
+
+
+async def execute(context: ContextTypes.DEFAULT_TYPE, timer: Timer.Timer) -> None:
+    """
+    Execute a timer
+    :param context: The context
+    :param timer: The timer
+    :return: None
+    """
+
     match timer:
         case Timer.REDDIT_POST_ONE_PIECE | Timer.REDDIT_POST_MEME_PIECE:
             await send_reddit_post(context, timer.info)
         case Timer.TEMP_DIR_CLEANUP:
-            cleanup_temp_dir()
+            deleted_count = artifact_service.cleanup()
+            if timer.should_log:
+                logging.info(f"Deleted {deleted_count} temp files")
         case Timer.TIMER_SEND_LEADERBOARD:
             await send_leaderboard(context)
         case Timer.RESET_BOUNTY_POSTER_LIMIT:
@@ -126,11 +163,17 @@ async def run(context: ContextTypes.DEFAULT_TYPE) -> None:
             await run_minute_tasks(context)
         case Timer.DAILY_REWARD:
             DailyReward.reset()
+        case Timer.CONTEXT_DATA_CLEANUP:
+            removed_count = remove_expired_context_data(context.application)
+            evicted_count = evict_idle_entries()
+            if timer.should_log:
+                logging.info(
+                    f"Removed {removed_count} expired context data entries and {evicted_count}"
+                    " idle anti-spam entries"
+                )
+        case Timer.RECONCILE_CREW_MEMBER_COUNT:
+            corrected_count = reconcile_member_count()
+            if timer.should_log:
+                logging.info(f"Corrected the member count of {corrected_count} crews")
         case _:
             raise ValueError(f"Unknown timer {timer.name}")
-
-    if timer.should_log:
-        logging.info(f"Finished timer {context.job.name}")
-    end(db)
-
-    return
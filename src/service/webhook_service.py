@@ -0,0 +1,332 @@
+import asyncio
+import hmac
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from typing import Callable
+from urllib.parse import urlparse
+
+from telegram import Bot, Update
+from telegram.ext import Application
+
+import constants as c
+import resources.Environment as Env
+
+# Header with the secret token, sent by Telegram with each update
+SECRET_TOKEN_HEADER = b"x-telegram-bot-api-secret-token"
+# Maximum size of an update request body
+MAX_BODY_BYTES = 1024 * 1024
+# Seconds to wait for a worker to finish its pending updates when stopping
+WORKER_STOP_TIMEOUT_SECONDS = 30
+
+# Index of the worker running in this process, None if not running as a webhook worker
+_worker_index: int | None = None
+
+
+def get_worker_index() -> int | None:
+    """
+    Get the index of the webhook worker running in this process
+    :return: The index, None if the bot is not running as a webhook worker
+    """
+
+    return _worker_index
+
+
+def is_primary_worker() -> bool:
+    """
+    If this process runs the tasks that must run only once, like the timers. True when
+    polling, or for the first webhook worker
+    :return: True if primary
+    """
+
+    return _worker_index is None or _worker_index == 0
+
+
+def get_worker_count() -> int:
+    """
+    Get the number of webhook workers
+    :return: The number of workers
+    """
+
+    worker_count = Env.WEBHOOK_WORKERS.get_int()
+    return worker_count if worker_count > 0 else (os.cpu_count() or 1)
+
+
+def is_shared_state_stale(load_time: float | None) -> bool:
+    """
+    If state kept in memory must be reloaded from the database. With more than one webhook
+    worker, the other workers can change it, so it's reloaded periodically
+    :param load_time: When the state was loaded, from time.monotonic(). None if never loaded
+    :return: True if stale
+    """
+
+    if load_time is None:
+        return True
+
+    return (
+        _worker_index is not None
+        and get_worker_count() > 1
+        and time.monotonic() - load_time > Env.WEBHOOK_SHARED_STATE_REFRESH_SECONDS.get_int()
+    )
+
+
+def get_shard_key(update_data: dict) -> int:
+    """
+    Get the key used to choose the worker of an update: the chat id, or the user id for updates
+    without a chat (e.g. inline queries), which is also the id of the user's private chat.
+    This way the updates of a chat are always managed in order by the same worker
+    :param update_data: The update, as received from Telegram
+    :return: The shard key
+    """
+
+    for payload in update_data.values():
+        if not isinstance(payload, dict):
+            continue
+
+        for container in (payload, payload.get("message")):
+            if isinstance(container, dict) and isinstance(container.get("chat"), dict):
+                return container["chat"]["id"]
+
+        for user_key in ("from", "user"):
+            if isinstance(payload.get(user_key), dict):
+                return payload[user_key]["id"]
+
+    return update_data.get("update_id", 0)
+
+
+class WebhookApp:
+    """
+    ASGI application that receives the updates from Telegram and dispatches them to the workers
+    """
+
+    def __init__(
+        self, path: str, secret_token: str, workers: list[BaseProcess], update_queues: list[Queue]
+    ):
+        """
+        Initialize the application
+        :param path: The path on which updates are received
+        :param secret_token: The secret token that Telegram sends with each update
+        :param workers: The worker processes
+        :param update_queues: The update queue of each worker
+        """
+        self.path: str = path
+        self.secret_token: bytes = secret_token.encode()
+        self.workers: list[BaseProcess] = workers
+        self.update_queues: list[Queue] = update_queues
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            return
+
+        if scope["path"] != self.path:
+            await self.respond(send, 404)
+            return
+
+        if scope["method"] != "POST":
+            await self.respond(send, 405)
+            return
+
+        headers = dict(scope["headers"])
+        if not hmac.compare_digest(headers.get(SECRET_TOKEN_HEADER, b""), self.secret_token):
+            await self.respond(send, 403)
+            return
+
+        body = await self.read_body(receive)
+        if body is None:
+            await self.respond(send, 413)
+            return
+
+        try:
+            update_data = json.loads(body)
+            worker_index = get_shard_key(update_data) % len(self.update_queues)
+        except (ValueError, TypeError, KeyError):
+            await self.respond(send, 400)
+            return
+
+        # Worker not running, Telegram retries the update later
+        if not self.workers[worker_index].is_alive():
+            logging.error(f"Webhook worker {worker_index} is not running")
+            await self.respond(send, 503)
+            return
+
+        self.update_queues[worker_index].put(body)
+        await self.respond(send, 200)
+
+    @staticmethod
+    async def read_body(receive: Callable) -> bytes | None:
+        """
+        Read the body of a request
+        :param receive: The ASGI receive function
+        :return: The body, None if too large
+        """
+
+        chunks: list[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                return None
+
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def respond(send: Callable, status: int) -> None:
+        """
+        Send an empty response
+        :param send: The ASGI send function
+        :param status: The status code
+        :return: None
+        """
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-length", b"0")],
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+
+async def set_webhook() -> None:
+    """
+    Register the webhook url on Telegram
+    :return: None
+    """
+
+    async with Bot(Env.BOT_TOKEN.get()) as bot:
+        await bot.set_webhook(
+            url=Env.WEBHOOK_URL.get(),
+            secret_token=Env.WEBHOOK_SECRET_TOKEN.get(),
+            max_connections=Env.WEBHOOK_MAX_CONNECTIONS.get_int(),
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=Env.BOT_DROP_PENDING_UPDATES.get_bool(),
+        )
+
+
+def run(worker_target: Callable[[int, Queue], None]) -> None:
+    """
+    Start the workers and receive the updates with the webhook, until the process is stopped
+    :param worker_target: The function run by each worker process, with the worker index and
+    its update queue
+    :return: None
+    """
+
+    import uvicorn
+
+    if Env.WEBHOOK_URL.get() is None or Env.WEBHOOK_SECRET_TOKEN.get() is None:
+        raise ValueError("WEBHOOK_URL and WEBHOOK_SECRET_TOKEN are required in webhook mode")
+
+    # Spawned, the workers must not share the connections of this process
+    mp_context = multiprocessing.get_context("spawn")
+    worker_count = get_worker_count()
+    update_queues: list[Queue] = [mp_context.Queue() for _ in range(worker_count)]
+    workers: list[BaseProcess] = [
+        mp_context.Process(
+            target=worker_target,
+            args=(worker_index, update_queues[worker_index]),
+            name=f"webhook_worker_{worker_index}",
+            daemon=True,
+        )
+        for worker_index in range(worker_count)
+    ]
+    for worker in workers:
+        worker.start()
+
+    logging.info(f"Started {worker_count} webhook workers")
+
+    try:
+        asyncio.run(set_webhook())
+        uvicorn.run(
+            WebhookApp(
+                urlparse(Env.WEBHOOK_URL.get()).path or "/",
+                Env.WEBHOOK_SECRET_TOKEN.get(),
+                workers,
+                update_queues,
+            ),
+            host=Env.WEBHOOK_LISTEN_ADDRESS.get(),
+            port=Env.WEBHOOK_PORT.get_int(),
+            lifespan="off",
+            log_level="warning",
+        )
+    finally:
+        # Let the workers manage the updates already received
+        for update_queue in update_queues:
+            update_queue.put(None)
+
+        for worker in workers:
+            worker.join(WORKER_STOP_TIMEOUT_SECONDS)
+            if worker.is_alive():
+                logging.error(f"Webhook worker {worker.name} did not stop in time")
+                worker.terminate()
+
+
+def run_worker(application: Application, worker_index: int, update_queue: Queue) -> None:
+    """
+    Run the application of a worker, managing the updates of its queue until it receives None
+    :param application: The application
+    :param worker_index: The worker index
+    :param update_queue: The update queue
+    :return: None
+    """
+
+    # Stopped by the dispatcher process, through the queue
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    asyncio.run(process_updates(application, update_queue))
+    logging.info(f"Webhook worker {worker_index} stopped")
+
+
+def init_worker(worker_index: int) -> None:
+    """
+    Initialize the process of a worker, to be called before building its application
+    :param worker_index: The worker index
+    :return: None
+    """
+
+    global _worker_index
+
+    _worker_index = worker_index
+
+    # The temp files are tracked by the artifact store of each process, so each worker has
+    # its own temp folder
+    c.TEMP_DIR = os.path.join(c.TEMP_DIR, f"worker_{worker_index}")
+
+
+async def process_updates(application: Application, update_queue: Queue) -> None:
+    """
+    Feed the updates of the queue to the application, until None is received
+    :param application: The application
+    :param update_queue: The update queue
+    :return: None
+    """
+
+    loop = asyncio.get_running_loop()
+
+    await application.initialize()
+    if application.post_init is not None:
+        await application.post_init(application)
+    await application.start()
+
+    try:
+        while True:
+            body = await loop.run_in_executor(None, update_queue.get)
+            if body is None:
+                break
+
+            await application.update_queue.put(Update.de_json(json.loads(body), application.bot))
+    finally:
+        await application.stop()
+        if application.post_stop is not None:
+            await application.post_stop(application)
+        await application.shutdown()
+        if application.post_shutdown is not None:
+            await application.post_shutdown(application)
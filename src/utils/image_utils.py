@@ -1,30 +1,18 @@
-import os
+import io
 
-import validators
 from PIL import Image
 
-from src.utils.download_utils import download_temp_file
 
-
-def compress_image(path: str, quality: int) -> str:
+def compress_image_bytes(data: bytes, quality: int) -> bytes:
     """
-    Reduces an image to the required max file size
-    :param path: Path to the original (unchanged) image
-    :type path: str
+    Reduces an image in memory to the required max file size
+    :param data: The original image
     :param quality: Quality of the compressed image (0-100)
-    :type quality: int
-    :return: an image path to the limited image.
-    :rtype: str
+    :return: The compressed image
     """
 
-    # Download image if path is an url
-    if validators.url(path):
-        path = download_temp_file(path)
-
-    image = Image.open(path)
-    compressed_image_path = os.path.join(
-        os.path.dirname(path), f"compressed_{os.path.basename(path)}"
-    )
-    image.save(compressed_image_path, quality=quality, optimize=True)
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.save(output, format=image.format, quality=quality, optimize=True)
 
-    return compressed_image_path
+    return output.getvalue()